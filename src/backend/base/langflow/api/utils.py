@@ -11,6 +11,7 @@ from sqlalchemy import delete
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.graph.graph.base import Graph
+from langflow.graph.utils import aflush_build_logs
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models import User
 from langflow.services.database.models.flow import Flow
@@ -183,7 +184,7 @@ async def build_graph_from_db_no_cache(flow_id: uuid.UUID, session: AsyncSession
 
 async def build_graph_from_db(flow_id: uuid.UUID, session: AsyncSession, chat_service: ChatService):
     graph = await build_graph_from_db_no_cache(flow_id=flow_id, session=session)
-    await chat_service.set_cache(str(flow_id), graph)
+    await chat_service.cache_graph(str(flow_id), graph, snapshot=True)
     return graph
 
 
@@ -196,7 +197,7 @@ async def build_and_cache_graph_from_data(
     # Convert flow_id to str if it's UUID
     str_flow_id = str(flow_id) if isinstance(flow_id, uuid.UUID) else flow_id
     graph = Graph.from_payload(graph_data, str_flow_id)
-    await chat_service.set_cache(str_flow_id, graph)
+    await chat_service.cache_graph(str_flow_id, graph, snapshot=True)
     return graph
 
 
@@ -281,6 +282,8 @@ def parse_value(value: Any, input_type: str) -> Any:
 
 async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None:
     try:
+        # Buffered rows of the flow would otherwise be written after it is deleted
+        await aflush_build_logs()
         await session.exec(delete(TransactionTable).where(TransactionTable.flow_id == flow_id))
         await session.exec(delete(VertexBuildTable).where(VertexBuildTable.flow_id == flow_id))
         await session.exec(delete(Flow).where(Flow.id == flow_id))
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import time
 import traceback
 import typing
@@ -36,6 +35,7 @@ from langflow.api.v1.schemas import (
     VerticesOrderResponse,
 )
 from langflow.events.event_manager import EventManager, create_default_event_manager
+from langflow.events.event_queue import BuildEventQueue
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.graph.base import Graph
 from langflow.graph.utils import log_vertex_build
@@ -44,7 +44,13 @@ from langflow.schema.schema import OutputValue
 from langflow.services.cache.utils import CacheMiss
 from langflow.services.chat.service import ChatService
 from langflow.services.database.models.flow.model import Flow
-from langflow.services.deps import get_chat_service, get_session, get_telemetry_service, session_scope
+from langflow.services.deps import (
+    get_chat_service,
+    get_session,
+    get_settings_service,
+    get_telemetry_service,
+    session_scope,
+)
 from langflow.services.telemetry.schema import ComponentPayload, PlaygroundPayload
 
 if TYPE_CHECKING:
@@ -114,7 +120,7 @@ async def retrieve_vertices_order(
         # and return the same structure but only with the ids
         components_count = len(graph.vertices)
         vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
-        await chat_service.set_cache(str(flow_id), graph)
+        await chat_service.cache_graph(str(flow_id), graph, snapshot=True)
         background_tasks.add_task(
             telemetry_service.log_package_playground,
             PlaygroundPayload(
@@ -194,7 +200,7 @@ async def build_flow(
             # and return the same structure but only with the ids
             components_count = len(graph.vertices)
             vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
-            await chat_service.set_cache(flow_id_str, graph)
+            await chat_service.cache_graph(flow_id_str, graph, snapshot=True)
             background_tasks.add_task(
                 telemetry_service.log_package_playground,
                 PlaygroundPayload(
@@ -277,7 +283,7 @@ async def build_flow(
                     artifacts=artifacts,
                 )
             else:
-                await chat_service.set_cache(flow_id_str, graph)
+                await chat_service.cache_graph(flow_id_str, graph)
 
             timedelta = time.perf_counter() - start_time
             duration = format_elapsed_time(timedelta)
@@ -334,7 +340,7 @@ async def build_flow(
     async def build_vertices(
         vertex_id: str,
         graph: Graph,
-        client_consumed_queue: asyncio.Queue,
+        client_consumed_queue: asyncio.Queue | None,
         event_manager: EventManager,
     ) -> None:
         build_task = asyncio.create_task(_build_vertex(vertex_id, graph, event_manager))
@@ -346,15 +352,14 @@ async def build_flow(
             return
 
         vertex_build_response: VertexBuildResponse = build_task.result()
-        # send built event or error event
+        # send built event or error event, the response is serialized once by the event manager
         try:
-            vertex_build_response_json = vertex_build_response.model_dump_json()
-            build_data = json.loads(vertex_build_response_json)
+            event_manager.on_end_vertex(data={"build_data": vertex_build_response})
         except Exception as exc:
             msg = f"Error serializing vertex build response: {exc}"
             raise ValueError(msg) from exc
-        event_manager.on_end_vertex(data={"build_data": build_data})
-        await client_consumed_queue.get()
+        if client_consumed_queue is not None:
+            await client_consumed_queue.get()
         if vertex_build_response.valid and vertex_build_response.next_vertices_ids:
             tasks = []
             for next_vertex_id in vertex_build_response.next_vertices_ids:
@@ -367,7 +372,7 @@ async def build_flow(
                     task.cancel()
                 return
 
-    async def event_generator(event_manager: EventManager, client_consumed_queue: asyncio.Queue) -> None:
+    async def event_generator(event_manager: EventManager, client_consumed_queue: asyncio.Queue | None) -> None:
         if not data:
             # using another task since the build_graph_and_get_order is now an async function
             vertices_task = asyncio.create_task(build_graph_and_get_order())
@@ -396,7 +401,8 @@ async def build_flow(
                 event_manager.on_error(data=error_message.data)
                 raise
         event_manager.on_vertices_sorted(data={"ids": ids, "to_run": vertices_to_run})
-        await client_consumed_queue.get()
+        if client_consumed_queue is not None:
+            await client_consumed_queue.get()
 
         tasks = []
         for vertex_id in ids:
@@ -422,9 +428,12 @@ async def build_flow(
             event_manager.on_error(data=error_message.data)
             raise
         event_manager.on_end(data={})
+        logger.debug(f"Sent the build events of flow {flow_id}: {dict(event_manager.event_counts)}")
         await event_manager.queue.put((None, None, time.time))
 
-    async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio.Queue) -> typing.AsyncGenerator:
+    async def consume_and_yield(
+        queue: asyncio.Queue, client_consumed_queue: asyncio.Queue | None
+    ) -> typing.AsyncGenerator:
         while True:
             event_id, value, put_time = await queue.get()
             if value is None:
@@ -432,16 +441,31 @@ async def build_flow(
             get_time = time.time()
             yield value
             get_time_yield = time.time()
-            client_consumed_queue.put_nowait(event_id)
+            if client_consumed_queue is not None:
+                client_consumed_queue.put_nowait(event_id)
             logger.debug(
                 f"consumed event {event_id} "
                 f"(time in queue, {get_time - put_time:.4f}, "
                 f"client {get_time_yield - get_time:.4f})"
             )
 
-    asyncio_queue: asyncio.Queue = asyncio.Queue()
-    asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
-    event_manager = create_default_event_manager(queue=asyncio_queue)
+    settings = get_settings_service().settings
+    asyncio_queue: asyncio.Queue
+    asyncio_queue_client_consumed: asyncio.Queue | None
+    if settings.build_event_buffer_size > 0:
+        # The vertices are built without waiting for the client to read their events
+        asyncio_queue = BuildEventQueue(
+            max_size=settings.build_event_buffer_size, overflow_policy=settings.build_event_overflow_policy
+        )
+        asyncio_queue_client_consumed = None
+    else:
+        asyncio_queue = asyncio.Queue()
+        asyncio_queue_client_consumed = asyncio.Queue()
+    event_manager = create_default_event_manager(
+        queue=asyncio_queue,
+        token_batch_interval=settings.token_event_batch_interval,
+        token_batch_size=settings.token_event_batch_size,
+    )
     main_task = asyncio.create_task(event_generator(event_manager, asyncio_queue_client_consumed))
 
     def on_disconnect() -> None:
@@ -520,7 +544,7 @@ async def build_vertex(
         raise HTTPException(status_code=404, detail="Graph not found") from exc
 
     try:
-        cache = await chat_service.get_cache(flow_id_str)
+        cache = await chat_service.get_cached_graph(flow_id_str)
         if isinstance(cache, CacheMiss):
             # If there's no cache
             logger.warning(f"No cache found for {flow_id_str}. Building graph starting at {vertex_id}")
@@ -567,7 +591,7 @@ async def build_vertex(
             background_tasks.add_task(graph.end_all_traces, error=exc)
             # If there's an error building the vertex
             # we need to clear the cache
-            await chat_service.clear_cache(flow_id_str)
+            await chat_service.clear_graph_cache(flow_id_str)
 
         result_data_response.message = artifacts
 
@@ -592,7 +616,7 @@ async def build_vertex(
         graph.reset_inactivated_vertices()
         graph.reset_activated_vertices()
 
-        await chat_service.set_cache(flow_id_str, graph)
+        await chat_service.cache_graph(flow_id_str, graph)
 
         # graph.stop_vertex tells us if the user asked
         # to stop the build of the graph at a certain vertex
@@ -643,7 +667,7 @@ async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService
     graph = None
     try:
         try:
-            cache = await chat_service.get_cache(flow_id)
+            cache = await chat_service.get_cached_graph(flow_id)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Error building Component")
             yield str(StreamData(event="error", data={"error": str(exc)}))
@@ -717,7 +741,7 @@ async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService
     finally:
         logger.debug("Closing stream")
         if graph:
-            await chat_service.set_cache(flow_id, graph)
+            await chat_service.cache_graph(flow_id, graph)
         yield str(StreamData(event="close", data={"message": "Stream closed"}))
 
 
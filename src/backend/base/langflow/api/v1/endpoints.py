@@ -33,7 +33,9 @@ from langflow.graph.schema import RunOutputs
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
+from langflow.processing.graph_cache import get_graph_cache
 from langflow.processing.process import process_tweaks, run_graph_internal
+from langflow.processing.run_coalescer import get_run_coalescer, run_fingerprint
 from langflow.schema.graph import Tweaks
 from langflow.services.auth.utils import api_key_security, get_current_active_user
 from langflow.services.cache.utils import save_uploaded_file
@@ -95,6 +97,27 @@ async def simple_run_flow(
 ):
     if input_request.input_value is not None and input_request.tweaks is not None:
         validate_input_and_tweaks(input_request)
+    # The stream URLs of a streamed run can only be read once, so streamed runs are never shared
+    if not stream and input_request.session_id is None and (run_coalescer := get_run_coalescer()) is not None:
+        key = run_fingerprint(
+            input_request,
+            flow_id=str(flow.id),
+            updated_at=flow.updated_at,
+            user_id=str(api_key_user.id) if api_key_user else None,
+        )
+        return await run_coalescer.run(
+            key, lambda: _run_flow(flow=flow, input_request=input_request, api_key_user=api_key_user)
+        )
+    return await _run_flow(flow=flow, input_request=input_request, stream=stream, api_key_user=api_key_user)
+
+
+async def _run_flow(
+    flow: Flow,
+    input_request: SimplifiedAPIRequest,
+    *,
+    stream: bool = False,
+    api_key_user: User | None = None,
+) -> RunResponse:
     try:
         task_result: list[RunOutputs] = []
         user_id = api_key_user.id if api_key_user else None
@@ -102,9 +125,15 @@ async def simple_run_flow(
         if flow.data is None:
             msg = f"Flow {flow_id_str} has no data"
             raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
+        graph = get_graph_cache().get_graph(
+            flow.data,
+            flow_id=flow_id_str,
+            updated_at=flow.updated_at,
+            tweaks=input_request.tweaks,
+            stream=stream,
+            flow_name=flow.name,
+            user_id=str(user_id),
+        )
         inputs = [
             InputValueRequest(
                 components=[],
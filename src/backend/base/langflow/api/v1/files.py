@@ -1,4 +1,5 @@
 import hashlib
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from http import HTTPStatus
 from io import BytesIO
@@ -6,15 +7,17 @@ from pathlib import Path
 from typing import Annotated
 from uuid import UUID
 
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
 
 from langflow.api.utils import CurrentActiveUser, DbSession
 from langflow.api.v1.schemas import UploadFileResponse
 from langflow.services.database.models.flow import Flow
 from langflow.services.deps import get_settings_service, get_storage_service
 from langflow.services.settings.service import SettingsService
-from langflow.services.storage.service import StorageService
+from langflow.services.storage.local import LocalStorageService
+from langflow.services.storage.service import CHUNK_SIZE, StorageService
 from langflow.services.storage.utils import build_content_type_from_extension
 
 router = APIRouter(tags=["Files"], prefix="/files")
@@ -60,17 +63,29 @@ async def upload_file(
         raise HTTPException(status_code=403, detail="You don't have access to this flow")
 
     try:
-        file_content = await file.read()
         timestamp = datetime.now(tz=timezone.utc).astimezone().strftime("%Y-%m-%d_%H-%M-%S")
-        file_name = file.filename or hashlib.sha256(file_content).hexdigest()
+        file_name = file.filename or await _hash_upload_file(file)
         full_file_name = f"{timestamp}_{file_name}"
         folder = str(flow.id)
-        await storage_service.save_file(flow_id=folder, file_name=full_file_name, data=file_content)
+        await storage_service.save_file_stream(folder, full_file_name, _iter_upload_file(file))
         return UploadFileResponse(flow_id=str(flow.id), file_path=f"{folder}/{full_file_name}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+async def _iter_upload_file(file: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await file.read(CHUNK_SIZE):
+        yield chunk
+
+
+async def _hash_upload_file(file: UploadFile) -> str:
+    sha256 = hashlib.sha256()
+    async for chunk in _iter_upload_file(file):
+        sha256.update(chunk)
+    await file.seek(0)
+    return sha256.hexdigest()
+
+
 @router.get("/download/{flow_id}/{file_name}")
 async def download_file(
     file_name: str, flow_id: UUID, storage_service: Annotated[StorageService, Depends(get_storage_service)]
@@ -88,18 +103,32 @@ async def download_file(
     if not content_type:
         raise HTTPException(status_code=500, detail=f"Content type not found for extension {extension}")
 
+    headers = {
+        "Content-Disposition": f"attachment; filename={file_name} filename*=UTF-8''{file_name}",
+        "Content-Type": "application/octet-stream",
+    }
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
-        headers = {
-            "Content-Disposition": f"attachment; filename={file_name} filename*=UTF-8''{file_name}",
-            "Content-Type": "application/octet-stream",
-            "Content-Length": str(len(file_content)),
-        }
-        return StreamingResponse(BytesIO(file_content), media_type=content_type, headers=headers)
+        if isinstance(storage_service, LocalStorageService):
+            # Served from disk in chunks (or with the server's zero-copy extension) and with support for Range requests
+            file_path = anyio.Path(storage_service.build_full_path(flow_id_str, file_name))
+            if not await file_path.is_file():
+                msg = f"File {file_name} not found in flow {flow_id_str}"
+                raise FileNotFoundError(msg)
+            return FileResponse(file_path, media_type=content_type, headers=headers)
+        file_stream = storage_service.get_file_stream(flow_id_str, file_name)
+        # Start reading the file to report a missing file as an error before the response starts
+        first_chunk = await anext(file_stream, b"")
+        return StreamingResponse(_prepend(first_chunk, file_stream), media_type=content_type, headers=headers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+async def _prepend(first_chunk: bytes, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    yield first_chunk
+    async for chunk in chunks:
+        yield chunk
+
+
 @router.get("/images/{flow_id}/{file_name}")
 async def download_image(file_name: str, flow_id: UUID):
     storage_service = get_storage_service()
@@ -19,6 +19,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, remove_api_keys, validate_is_component
 from langflow.api.v1.schemas import FlowListCreate
+from langflow.graph.utils import aflush_build_logs
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.services.database.models.flow import Flow, FlowCreate, FlowRead, FlowUpdate
 from langflow.services.database.models.flow.model import FlowHeader
@@ -422,6 +423,8 @@ async def delete_multiple_flows(
         flows_to_delete = (
             await db.exec(select(Flow).where(col(Flow.id).in_(flow_ids)).where(Flow.user_id == user.id))
         ).all()
+        if flows_to_delete:
+            await aflush_build_logs()
         for flow in flows_to_delete:
             transactions_to_delete = await get_transactions_by_flow_id(db, flow.id)
             for transaction in transactions_to_delete:
@@ -8,6 +8,8 @@ from sqlalchemy import delete
 from sqlmodel import col, select
 
 from langflow.api.utils import DbSession, custom_params
+from langflow.graph.utils import aflush_build_logs
+from langflow.memory import aflush_messages
 from langflow.schema.message import MessageResponse
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
@@ -25,6 +27,7 @@ router = APIRouter(prefix="/monitor", tags=["Monitor"])
 @router.get("/builds")
 async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
     try:
+        await aflush_build_logs()
         vertex_builds = await get_vertex_builds_by_flow_id(session, flow_id)
         return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
     except Exception as e:
@@ -34,6 +37,7 @@ async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSessio
 @router.delete("/builds", status_code=204)
 async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> None:
     try:
+        await aflush_build_logs()
         await delete_vertex_builds_by_flow_id(session, flow_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -49,6 +53,7 @@ async def get_messages(
     order_by: Annotated[str | None, Query()] = "timestamp",
 ) -> list[MessageResponse]:
     try:
+        await aflush_messages(session_id)
         stmt = select(MessageTable)
         if flow_id:
             stmt = stmt.where(MessageTable.flow_id == flow_id)
@@ -70,6 +75,7 @@ async def get_messages(
 @router.delete("/messages", status_code=204, dependencies=[Depends(get_current_active_user)])
 async def delete_messages(message_ids: list[UUID], session: DbSession) -> None:
     try:
+        await aflush_messages()
         await session.exec(delete(MessageTable).where(MessageTable.id.in_(message_ids)))  # type: ignore[attr-defined]
         await session.commit()
     except Exception as e:
@@ -83,6 +89,7 @@ async def update_message(
     session: DbSession,
 ):
     try:
+        await aflush_messages()
         db_message = await session.get(MessageTable, message_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -113,6 +120,7 @@ async def update_session_id(
     session: DbSession,
 ) -> list[MessageResponse]:
     try:
+        await aflush_messages(old_session_id)
         # Get all messages with the old session ID
         stmt = select(MessageTable).where(MessageTable.session_id == old_session_id)
         messages = (await session.exec(stmt)).all()
@@ -146,6 +154,7 @@ async def delete_messages_session(
     session: DbSession,
 ):
     try:
+        await aflush_messages(session_id)
         await session.exec(
             delete(MessageTable)
             .where(col(MessageTable.session_id) == session_id)
@@ -165,6 +174,7 @@ async def get_transactions(
     params: Annotated[Params | None, Depends(custom_params)],
 ) -> Page[TransactionTable]:
     try:
+        await aflush_build_logs()
         stmt = (
             select(TransactionTable)
             .where(TransactionTable.flow_id == flow_id)
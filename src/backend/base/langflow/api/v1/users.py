@@ -14,6 +14,7 @@ from langflow.services.auth.utils import (
     get_password_hash,
     verify_password,
 )
+from langflow.services.database.models.api_key.cache import invalidate_verified_api_keys
 from langflow.services.database.models.folder.utils import create_default_folder_if_it_doesnt_exist
 from langflow.services.database.models.user import User, UserCreate, UserRead, UserUpdate
 from langflow.services.database.models.user.crud import get_user_by_id, update_user
@@ -118,6 +119,7 @@ async def reset_password(
     new_password = get_password_hash(user_update.password)
     user.password = new_password
     await session.commit()
+    invalidate_verified_api_keys(user_id=user.id)
     await session.refresh(user)
 
     return user
@@ -142,5 +144,6 @@ async def delete_user(
 
     await session.delete(user_db)
     await session.commit()
+    invalidate_verified_api_keys(user_id=user_id)
 
     return {"detail": "User deleted"}
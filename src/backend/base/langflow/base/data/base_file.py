@@ -1,6 +1,7 @@
 import shutil
 import tarfile
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from zipfile import ZipFile, is_zipfile
@@ -96,6 +97,7 @@ class BaseFileComponent(Component, ABC):
 
     SERVER_FILE_PATH_FIELDNAME = "file_path"
     SUPPORTED_BUNDLE_EXTENSIONS = ["zip", "tar", "tgz", "bz2", "gz"]
+    PROCESSING_BATCH_SIZE = 100
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -176,6 +178,17 @@ class BaseFileComponent(Component, ABC):
         Returns:
             list[Data]: Parsed data from the processed files.
         """
+        return list(self.iter_data())
+
+    def iter_data(self) -> Iterator[Data]:
+        """Loads and parses file(s) like `load_files`, yielding the Data of each batch of files as it is parsed.
+
+        Files are passed to `process_files` in batches of `PROCESSING_BATCH_SIZE`, so a consumer that does not
+        keep the yielded Data only holds one batch in memory.
+
+        Yields:
+            Data: Parsed data from the processed files.
+        """
         self._temp_dirs: list[TemporaryDirectory] = []
         final_files = []  # Initialize to avoid UnboundLocalError
         try:
@@ -187,12 +200,16 @@ class BaseFileComponent(Component, ABC):
 
             # Step 3: Final validation of file types
             final_files = self._filter_and_mark_files(all_files)
+            if not final_files:
+                # Let process_files handle (and report) an empty list of files
+                self.process_files(final_files)
+                return
 
             # Step 4: Process files
-            processed_files = self.process_files(final_files)
-
-            # Extract and flatten Data objects to return
-            return [data for file in processed_files for data in file.data if file.data]
+            for start in range(0, len(final_files), self.PROCESSING_BATCH_SIZE):
+                processed_files = self.process_files(final_files[start : start + self.PROCESSING_BATCH_SIZE])
+                # Extract and flatten Data objects to yield
+                yield from (data for file in processed_files for data in file.data if file.data)
 
         finally:
             # Delete temporary directories
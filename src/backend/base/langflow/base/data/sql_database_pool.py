@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from langchain_community.utilities import SQLDatabase
+from sqlalchemy import create_engine, text
+
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy.engine import Engine
+
+
+class SQLDatabasePool:
+    """A process wide pool of SQL databases that are reused across flow runs, with their engine and schema.
+
+    Databases are keyed by their URL and the options of their engine, so the runs that connect to the same database
+    share its pool of connections. The tables of a pooled database are reflected lazily, when a run first needs them,
+    and kept for the next runs. Databases that were not used for `idle_timeout` seconds are evicted, the least
+    recently used database is evicted when the pool is full, and the connections of evicted databases are closed.
+    """
+
+    def __init__(self, max_size: int, idle_timeout: float | None = None, connection_pool_size: int = 5) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.connection_pool_size = connection_pool_size
+        self._databases: OrderedDict[str, tuple[SQLDatabase, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_database(self, database_url: str, **engine_kwargs: Any) -> SQLDatabase:
+        """Returns the pooled database for the URL and engine options, connecting to it if it is not pooled.
+
+        Args:
+            database_url: The SQLAlchemy URL of the database.
+            **engine_kwargs: The options passed to `create_engine`.
+
+        Returns:
+            SQLDatabase: The pooled database.
+        """
+        key = self._key(database_url, engine_kwargs)
+        with self._lock:
+            evicted = self._evict_idle()
+            database = self._use(key)
+        self._dispose(evicted)
+        if database is not None:
+            return database
+
+        # Connecting lists the tables of the database, so it runs without the lock to not block the other runs
+        new_database = SQLDatabase(self._create_engine(database_url, engine_kwargs), lazy_table_reflection=True)
+        with self._lock:
+            database = self._use(key)
+            if database is None:
+                database = new_database
+                self._databases[key] = (database, time.monotonic())
+                evicted = []
+            else:
+                # Another run connected to the same database in the meantime
+                evicted = [new_database]
+            while len(self._databases) > self.max_size:
+                evicted.append(self._databases.popitem(last=False)[1][0])
+        self._dispose(evicted)
+        return database
+
+    def _use(self, key: str) -> SQLDatabase | None:
+        """Returns the pooled database for the key, marking it as recently used. The lock must be held."""
+        entry = self._databases.get(key)
+        if entry is None:
+            return None
+        self._databases[key] = (entry[0], time.monotonic())
+        self._databases.move_to_end(key)
+        return entry[0]
+
+    @staticmethod
+    def _dispose(databases: list[SQLDatabase]) -> None:
+        # Runs that still hold an evicted database get new connections from its engine if they need them
+        for database in databases:
+            database._engine.dispose()
+
+    def _create_engine(self, database_url: str, engine_kwargs: dict[str, Any]) -> Engine:
+        options = {"pool_pre_ping": True, **engine_kwargs}
+        # Pool classes such as StaticPool and NullPool do not take a size
+        if "poolclass" not in options:
+            options.setdefault("pool_size", self.connection_pool_size)
+        return create_engine(database_url, **options)
+
+    @staticmethod
+    def _key(database_url: str, engine_kwargs: dict[str, Any]) -> str:
+        return f"{database_url}:{sorted(engine_kwargs.items())!r}"
+
+    def _evict_idle(self) -> list[SQLDatabase]:
+        if self.idle_timeout is None:
+            return []
+        now = time.monotonic()
+        evicted = []
+        # The databases are ordered by last use, so only the oldest ones need to be checked
+        while self._databases and now - next(iter(self._databases.values()))[1] > self.idle_timeout:
+            evicted.append(self._databases.popitem(last=False)[1][0])
+        return evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            databases = [database for database, _ in self._databases.values()]
+            self._databases.clear()
+        self._dispose(databases)
+
+    def __len__(self) -> int:
+        return len(self._databases)
+
+
+_sql_database_pool: SQLDatabasePool | None = None
+
+
+def get_sql_database_pool() -> SQLDatabasePool | None:
+    """Returns the process wide SQL database pool, or None if `sql_database_pool_size` is 0."""
+    global _sql_database_pool  # noqa: PLW0603
+    settings = get_settings_service().settings
+    if settings.sql_database_pool_size <= 0:
+        return None
+    if _sql_database_pool is None:
+        _sql_database_pool = SQLDatabasePool(
+            max_size=settings.sql_database_pool_size,
+            idle_timeout=settings.sql_database_pool_idle_timeout or None,
+            connection_pool_size=settings.sql_database_connection_pool_size,
+        )
+    return _sql_database_pool
+
+
+def get_sql_database(database_url: str, **engine_kwargs: Any) -> SQLDatabase:
+    """Returns the database for the URL, from the SQL database pool if it is enabled.
+
+    Without the pool, a new engine is created and the schema is reflected on every call.
+    """
+    pool = get_sql_database_pool()
+    if pool is not None:
+        return pool.get_database(database_url, **engine_kwargs)
+    return SQLDatabase(create_engine(database_url, **engine_kwargs))
+
+
+def iter_query_batches(database: SQLDatabase, query: str, batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    """Runs the query and yields its rows in batches of `batch_size`, as dictionaries keyed by column.
+
+    The rows are read with a server side cursor when the driver supports it, so only a batch of rows is fetched
+    from the database at a time. The query runs in a transaction that is committed once all its rows were read, as
+    `SQLDatabase.run` does, and rolled back if the caller stops reading before.
+    """
+    with database._engine.begin() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=batch_size).execute(text(query))
+        if not result.returns_rows:
+            return
+        for partition in result.mappings().partitions(batch_size):
+            yield [dict(row) for row in partition]
@@ -1,6 +1,10 @@
+import multiprocessing
 import unicodedata
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from concurrent import futures
+from functools import partial
+from itertools import islice
 from pathlib import Path
 
 import chardet
@@ -196,3 +200,42 @@ def parallel_load_data(
         )
     # loaded_files is an iterator, so we need to convert it to a list
     return list(loaded_files)
+
+
+def process_load_data(
+    file_paths: Iterable[str],
+    *,
+    silent_errors: bool,
+    max_concurrency: int,
+    load_function: Callable = parse_text_file_to_data,
+    executor: futures.ProcessPoolExecutor | None = None,
+) -> Iterator[Data | None]:
+    """Parses files in a pool of processes, yielding the results in the order of `file_paths`.
+
+    Unlike `parallel_load_data`, the parsing of CPU-bound formats such as PDF and DOCX is not serialized by the GIL.
+    At most `2 * max_concurrency` files are parsed or waiting to be consumed at a time, so memory stays bounded
+    however many files there are. `load_function` must be a module level function so it can be sent to the
+    processes. Pass an `executor` from `create_process_pool` to reuse its processes across calls.
+    """
+    load = partial(load_function, silent_errors=silent_errors)
+    max_in_flight = 2 * max_concurrency
+    paths = iter(file_paths)
+    pool = executor or create_process_pool(max_concurrency)
+    in_flight: deque[futures.Future] = deque()
+    try:
+        in_flight.extend(pool.submit(load, file_path) for file_path in islice(paths, max_in_flight))
+        while in_flight:
+            result = in_flight.popleft().result()
+            for file_path in islice(paths, 1):
+                in_flight.append(pool.submit(load, file_path))
+            yield result
+    finally:
+        for future in in_flight:
+            future.cancel()
+        if executor is None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def create_process_pool(max_workers: int) -> futures.ProcessPoolExecutor:
+    # spawn, as forking a process that runs threads (e.g. the server) can deadlock the children
+    return futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
@@ -1,9 +1,11 @@
 from abc import abstractmethod
 from functools import wraps
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
+from langflow.base.vectorstores.pool import get_vector_store_pool
 from langflow.custom import Component
 from langflow.field_typing import Text, VectorStore
+from langflow.graph.vertex.utils import hash_build_inputs
 from langflow.helpers.data import docs_to_data
 from langflow.io import DataInput, MultilineInput, Output
 from langflow.schema import Data
@@ -19,6 +21,10 @@ def check_cached_vector_store(f):
     across separate invocations of the component. This method exists so that components with
     multiple output methods share the same vector store during the same invocation of the
     component.
+
+    Components that set `pool_vector_store` also reuse the vector stores built by previous runs
+    with the same connection and configuration params when the vector store pool is enabled.
+    Vector stores are only reused when there is no data to ingest.
     """
 
     @wraps(f)
@@ -26,8 +32,18 @@ def check_cached_vector_store(f):
         if self._cached_vector_store is not None:
             return self._cached_vector_store
 
+        pool = get_vector_store_pool()
+        pool_key = self.get_vector_store_pool_key() if pool is not None else None
+        if pool_key is not None and not getattr(self, "ingest_data", None):
+            pooled_vector_store = pool.get(pool_key, health_check=self.check_vector_store_health)
+            if pooled_vector_store is not None:
+                self._cached_vector_store = pooled_vector_store
+                return pooled_vector_store
+
         result = f(self, *args, **kwargs)
         self._cached_vector_store = result
+        if pool_key is not None:
+            pool.put(pool_key, result)
         return result
 
     check_cached.is_cached_vector_store_checked = True
@@ -37,6 +53,15 @@ def check_cached_vector_store(f):
 class LCVectorStoreComponent(Component):
     # Used to ensure a single vector store is built for each run of the flow
     _cached_vector_store: VectorStore | None = None
+    # Whether the built vector store can be reused by other runs with the same params
+    pool_vector_store: ClassVar[bool] = False
+    # Inputs that do not change the vector store, so they are not part of its pool key
+    vector_store_pool_excluded_inputs: ClassVar[set[str]] = {
+        "search_query",
+        "ingest_data",
+        "number_of_results",
+        "search_type",
+    }
 
     def __init_subclass__(cls, **kwargs):
         """Enforces the check cached decorator on all subclasses."""
@@ -143,6 +168,23 @@ class LCVectorStoreComponent(Component):
         self.status = search_results
         return search_results
 
+    def get_vector_store_pool_key(self) -> str | None:
+        """Returns the key of the vector store in the vector store pool, or None if it should not be pooled."""
+        if not self.pool_vector_store:
+            return None
+        params = {
+            name: getattr(self, name, None)
+            for name in self._inputs
+            if name not in self.vector_store_pool_excluded_inputs
+        }
+        # Inputs that cannot be hashed, e.g. an embedding model that holds its client in a field that is not
+        # excluded from its dump, could differ between builds with the same key, so the store is not pooled
+        return hash_build_inputs({"component": type(self).__name__, "user_id": str(self.user_id), "params": params})
+
+    def check_vector_store_health(self, vector_store: VectorStore) -> bool:  # noqa: ARG002
+        """Returns whether a pooled vector store can still be used. Implementations can check their connection."""
+        return True
+
     def get_retriever_kwargs(self):
         """Get the retriever kwargs. Implementations can override this method to provide custom retriever kwargs."""
         return {}
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from langflow.field_typing import VectorStore
+
+
+class VectorStorePool:
+    """A process wide pool of built vector stores that are reused across flow runs and sessions.
+
+    Stores are keyed by the connection and configuration params of the component that built them.
+    Stores that were not used for `idle_timeout` seconds are evicted, the least recently used store is
+    evicted when the pool is full, and stores that fail their health check are dropped so a new one is built.
+    """
+
+    def __init__(self, max_size: int, idle_timeout: float | None = None) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._stores: OrderedDict[str, tuple[VectorStore, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, health_check: Callable[[VectorStore], bool] | None = None) -> VectorStore | None:
+        """Returns the pooled vector store for the key, or None if there is no healthy one.
+
+        Args:
+            key: The key of the vector store.
+            health_check: A callable that returns whether the vector store can still be used.
+
+        Returns:
+            VectorStore | None: The pooled vector store.
+        """
+        with self._lock:
+            self._evict_idle()
+            entry = self._stores.get(key)
+        if entry is None:
+            return None
+        vector_store = entry[0]
+        if health_check is not None and not self._is_healthy(vector_store, health_check):
+            with self._lock:
+                if key in self._stores and self._stores[key][0] is vector_store:
+                    del self._stores[key]
+            return None
+        with self._lock:
+            if key in self._stores:
+                self._stores[key] = (vector_store, time.monotonic())
+                self._stores.move_to_end(key)
+        return vector_store
+
+    def put(self, key: str, vector_store: VectorStore) -> None:
+        """Adds a vector store to the pool, replacing the one with the same key."""
+        with self._lock:
+            self._stores[key] = (vector_store, time.monotonic())
+            self._stores.move_to_end(key)
+            while len(self._stores) > self.max_size:
+                self._stores.popitem(last=False)
+
+    def _evict_idle(self) -> None:
+        if self.idle_timeout is None:
+            return
+        now = time.monotonic()
+        # The stores are ordered by last use, so only the oldest ones need to be checked
+        while self._stores and now - next(iter(self._stores.values()))[1] > self.idle_timeout:
+            self._stores.popitem(last=False)
+
+    @staticmethod
+    def _is_healthy(vector_store: VectorStore, health_check: Callable[[VectorStore], bool]) -> bool:
+        try:
+            return health_check(vector_store)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"Pooled {type(vector_store).__name__} failed its health check")
+            return False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stores.clear()
+
+    def __len__(self) -> int:
+        return len(self._stores)
+
+
+_vector_store_pool: VectorStorePool | None = None
+
+
+def get_vector_store_pool() -> VectorStorePool | None:
+    """Returns the process wide vector store pool, or None if `vector_store_pool_size` is 0."""
+    global _vector_store_pool  # noqa: PLW0603
+    settings = get_settings_service().settings
+    if settings.vector_store_pool_size <= 0:
+        return None
+    if _vector_store_pool is None:
+        _vector_store_pool = VectorStorePool(
+            max_size=settings.vector_store_pool_size,
+            idle_timeout=settings.vector_store_pool_idle_timeout or None,
+        )
+    return _vector_store_pool
@@ -18,6 +18,7 @@ from langflow.custom import Component
 from langflow.io import BoolInput, DataInput, DropdownInput, IntInput, MessageTextInput, NestedDictInput, Output
 from langflow.schema import Data
 from langflow.schema.dotdict import dotdict
+from langflow.services.deps import get_http_client_service
 
 
 class APIRequestComponent(Component):
@@ -294,23 +295,24 @@ class APIRequestComponent(Component):
 
         urls = [self.add_query_params(url, query_params) for url in urls]
 
-        async with httpx.AsyncClient() as client:
-            results = await asyncio.gather(
-                *[
-                    self.make_request(
-                        client,
-                        method,
-                        u,
-                        headers,
-                        rec,
-                        timeout,
-                        follow_redirects=follow_redirects,
-                        save_to_file=save_to_file,
-                        include_httpx_metadata=include_httpx_metadata,
-                    )
-                    for u, rec in zip(urls, bodies, strict=True)
-                ]
-            )
+        # The shared client reuses the connections opened by previous requests
+        client = get_http_client_service().get_client()
+        results = await asyncio.gather(
+            *[
+                self.make_request(
+                    client,
+                    method,
+                    u,
+                    headers,
+                    rec,
+                    timeout,
+                    follow_redirects=follow_redirects,
+                    save_to_file=save_to_file,
+                    include_httpx_metadata=include_httpx_metadata,
+                )
+                for u, rec in zip(urls, bodies, strict=True)
+            ]
+        )
         self.status = results
         return results
 
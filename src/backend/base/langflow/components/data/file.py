@@ -1,5 +1,13 @@
+from collections.abc import Iterator
+
 from langflow.base.data import BaseFileComponent
-from langflow.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data
+from langflow.base.data.utils import (
+    TEXT_FILE_TYPES,
+    create_process_pool,
+    parallel_load_data,
+    parse_text_file_to_data,
+    process_load_data,
+)
 from langflow.io import BoolInput, IntInput
 from langflow.schema import Data
 
@@ -34,12 +42,37 @@ class FileComponent(BaseFileComponent):
             info="When multiple files are being processed, the number of files to process concurrently.",
             value=1,
         ),
+        BoolInput(
+            name="use_multiprocessing",
+            display_name="Parse in Separate Processes",
+            advanced=True,
+            value=False,
+            info=(
+                "If true, files are parsed by 'Processing Concurrency' processes instead of threads, "
+                "which scales CPU-bound formats such as PDF and DOCX with the number of cores."
+            ),
+        ),
     ]
 
     outputs = [
         *BaseFileComponent._base_outputs,
     ]
 
+    def iter_data(self) -> Iterator[Data]:
+        if not self._use_processes():
+            yield from super().iter_data()
+            return
+        # Share the processes between the batches of files
+        with create_process_pool(self.concurrency_multithreading) as process_pool:
+            self._process_pool = process_pool
+            try:
+                yield from super().iter_data()
+            finally:
+                self._process_pool = None
+
+    def _use_processes(self) -> bool:
+        return self.use_multiprocessing and self.use_multithreading and self.concurrency_multithreading > 1
+
     def process_files(self, file_list: list[BaseFileComponent.BaseFile]) -> list[BaseFileComponent.BaseFile]:
         """Processes files either sequentially or in parallel, depending on concurrency settings.
 
@@ -79,6 +112,16 @@ class FileComponent(BaseFileComponent):
             if file_count > 1:
                 self.log(f"Processing {file_count} files sequentially.")
             processed_data = [process_file(str(file.path), silent_errors=self.silent_errors) for file in file_list]
+        elif self._use_processes():
+            self.log(f"Starting parallel processing of {file_count} files in {concurrency} processes.")
+            processed_data = list(
+                process_load_data(
+                    [str(file.path) for file in file_list],
+                    silent_errors=self.silent_errors,
+                    max_concurrency=concurrency,
+                    executor=getattr(self, "_process_pool", None),
+                )
+            )
         else:
             self.log(f"Starting parallel processing of {file_count} files with concurrency: {concurrency}.")
             file_paths = [str(file.path) for file in file_list]
@@ -1,8 +1,12 @@
+from contextlib import closing
+
 from langchain_community.tools.sql_database.tool import QuerySQLDataBaseTool
 from langchain_community.utilities import SQLDatabase
 
+from langflow.base.data.sql_database_pool import get_sql_database, iter_query_batches
 from langflow.custom import CustomComponent
 from langflow.field_typing import Text
+from langflow.schema.dataframe import DataFrame
 
 
 class SQLExecutorComponent(CustomComponent):
@@ -29,6 +33,26 @@ class SQLExecutorComponent(CustomComponent):
                 "display_name": "Add Error",
                 "info": "Add the error to the result.",
             },
+            "output_format": {
+                "display_name": "Output Format",
+                "info": "Return the result as text, or the rows as a DataFrame that is read from the database in "
+                "batches.",
+                "options": ["Text", "DataFrame"],
+                "value": "Text",
+                "advanced": True,
+            },
+            "batch_size": {
+                "display_name": "Batch Size",
+                "info": "The number of rows read from the database at a time when the output format is DataFrame.",
+                "value": 1000,
+                "advanced": True,
+            },
+            "max_rows": {
+                "display_name": "Max Rows",
+                "info": "The maximum number of rows returned when the output format is DataFrame. 0 means no limit.",
+                "value": 10000,
+                "advanced": True,
+            },
         }
 
     def clean_up_uri(self, uri: str) -> str:
@@ -44,15 +68,22 @@ class SQLExecutorComponent(CustomComponent):
         include_columns: bool = False,
         passthrough: bool = False,
         add_error: bool = False,
+        output_format: str = "Text",
+        batch_size: int = 1000,
+        max_rows: int = 10000,
         **kwargs,
-    ) -> Text:
+    ) -> Text | DataFrame:
         _ = kwargs
         error = None
         try:
-            database = SQLDatabase.from_uri(database_url)
+            database = get_sql_database(database_url)
         except Exception as e:
             msg = f"An error occurred while connecting to the database: {e}"
             raise ValueError(msg) from e
+        if output_format == "DataFrame":
+            return self._build_dataframe(
+                database, query, batch_size, max_rows, passthrough=passthrough, add_error=add_error
+            )
         try:
             tool = QuerySQLDataBaseTool(db=database)
             result = tool.run(query, include_columns=include_columns)
@@ -72,3 +103,26 @@ class SQLExecutorComponent(CustomComponent):
             result = query
 
         return result
+
+    def _build_dataframe(
+        self, database: SQLDatabase, query: str, batch_size: int, max_rows: int, *, passthrough: bool, add_error: bool
+    ) -> DataFrame:
+        rows: list[dict] = []
+        try:
+            # The rows are read in batches and the query stops once max_rows were read, to bound the memory used
+            with closing(iter_query_batches(database, query, max(batch_size, 1))) as batches:
+                for batch in batches:
+                    rows.extend(batch)
+                    if 0 < max_rows <= len(rows):
+                        del rows[max_rows:]
+                        break
+        except Exception as e:
+            self.status = str(e)
+            if not passthrough:
+                raise
+            # As in text mode, the query is returned in passthrough mode, with the error if it should be added
+            row = {"query": query, "error": repr(e)} if add_error else {"query": query}
+            return DataFrame([row])
+        result = DataFrame(rows)
+        self.status = f"{len(result)} rows"
+        return result
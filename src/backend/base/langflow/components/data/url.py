@@ -1,12 +1,16 @@
+import asyncio
 import re
 
-from langchain_community.document_loaders import AsyncHtmlLoader, WebBaseLoader
+import httpx
+from bs4 import BeautifulSoup
+from langchain_community.document_loaders.web_base import default_header_template
 
 from langflow.custom import Component
 from langflow.helpers.data import data_to_text
 from langflow.io import DropdownInput, MessageTextInput, Output
 from langflow.schema import Data
 from langflow.schema.message import Message
+from langflow.services.deps import get_http_client_service
 
 
 class URLComponent(Component):
@@ -71,19 +75,34 @@ class URLComponent(Component):
 
         return string
 
-    def fetch_content(self) -> list[Data]:
+    async def fetch_content(self) -> list[Data]:
         urls = [self.ensure_url(url.strip()) for url in self.urls if url.strip()]
-        if self.format == "Raw HTML":
-            loader = AsyncHtmlLoader(web_path=urls, encoding="utf-8")
-        else:
-            loader = WebBaseLoader(web_paths=urls, encoding="utf-8")
-        docs = loader.load()
-        data = [Data(text=doc.page_content, **doc.metadata) for doc in docs]
+        # The shared client reuses the connections opened by previous fetches
+        client = get_http_client_service().get_client()
+        responses = await asyncio.gather(
+            *[client.get(url, headers=default_header_template, follow_redirects=True) for url in urls]
+        )
+        data = [self._response_to_data(url, response) for url, response in zip(urls, responses, strict=True)]
         self.status = data
         return data
 
-    def fetch_content_text(self) -> Message:
-        data = self.fetch_content()
+    def _response_to_data(self, url: str, response: httpx.Response) -> Data:
+        response.encoding = "utf-8"
+        html = response.text
+        soup = BeautifulSoup(html, "xml" if url.endswith(".xml") else "html.parser")
+        # The same metadata as the LangChain web loaders
+        metadata = {"source": url}
+        if title := soup.find("title"):
+            metadata["title"] = title.get_text()
+        if description := soup.find("meta", attrs={"name": "description"}):
+            metadata["description"] = description.get("content", "No description found.")
+        if html_tag := soup.find("html"):
+            metadata["language"] = html_tag.get("lang", "No language found.")
+        text = html if self.format == "Raw HTML" else soup.get_text()
+        return Data(text=text, **metadata)
+
+    async def fetch_content_text(self) -> Message:
+        data = await self.fetch_content()
 
         result_string = data_to_text("{text}", data)
         self.status = result_string
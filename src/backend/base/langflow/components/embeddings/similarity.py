@@ -1,8 +1,11 @@
 import numpy as np
 
 from langflow.custom import Component
-from langflow.io import DataInput, DropdownInput, Output
-from langflow.schema import Data
+from langflow.io import DataInput, DropdownInput, IntInput, Output
+from langflow.schema import Data, DataFrame
+
+# The number of query rows compared at once with the Manhattan distance, which cannot be computed as a matrix product
+MANHATTAN_BATCH_SIZE = 64
 
 
 class EmbeddingSimilarityComponent(Component):
@@ -24,10 +27,28 @@ class EmbeddingSimilarityComponent(Component):
             options=["Cosine Similarity", "Euclidean Distance", "Manhattan Distance"],
             value="Cosine Similarity",
         ),
+        DataInput(
+            name="candidate_vectors",
+            display_name="Candidate Vectors",
+            info=(
+                "Data objects with embedding vectors to rank for each of the Embedding Vectors in 'Top Matches'. "
+                "If empty, the Embedding Vectors are ranked against each other, e.g. to find duplicates."
+            ),
+            is_list=True,
+            advanced=True,
+        ),
+        IntInput(
+            name="top_k",
+            display_name="Top K",
+            info="The number of best matching candidates returned for each embedding vector in 'Top Matches'.",
+            value=5,
+            advanced=True,
+        ),
     ]
 
     outputs = [
         Output(display_name="Similarity Data", name="similarity_data", method="compute_similarity"),
+        Output(display_name="Top Matches", name="top_matches", method="compute_top_matches"),
     ]
 
     def compute_similarity(self) -> Data:
@@ -70,3 +91,79 @@ class EmbeddingSimilarityComponent(Component):
 
         self.status = similarity_data
         return similarity_data
+
+    def compute_top_matches(self) -> DataFrame:
+        """Ranks the candidate vectors for each embedding vector in a single matrix operation.
+
+        Returns a row per match with the index of the embedding vector, the index of the candidate, the rank of the
+        match and its score. The vectors themselves are not copied into the output.
+        """
+        queries = self._to_matrix(self.embedding_vectors, "Embedding Vectors")
+        exclude_self = not self.candidate_vectors
+        candidates = queries if exclude_self else self._to_matrix(self.candidate_vectors, "Candidate Vectors")
+        if queries.shape[1] != candidates.shape[1]:
+            msg = "Embeddings must have the same dimensions."
+            raise ValueError(msg)
+        if exclude_self and queries.shape[0] < 2:  # noqa: PLR2004
+            msg = "At least two embedding vectors are required to rank them against each other."
+            raise ValueError(msg)
+
+        scores, higher_is_better = self._score_matrix(queries, candidates)
+        if exclude_self:
+            np.fill_diagonal(scores, -np.inf if higher_is_better else np.inf)
+        ranking_scores = -scores if higher_is_better else scores
+
+        top_k = max(1, min(self.top_k, candidates.shape[0] - int(exclude_self)))
+        # argpartition finds the top k of each row in linear time, only those are sorted
+        top_indices = np.argpartition(ranking_scores, top_k - 1, axis=1)[:, :top_k]
+        order = np.argsort(np.take_along_axis(ranking_scores, top_indices, axis=1), axis=1)
+        top_indices = np.take_along_axis(top_indices, order, axis=1)
+        top_scores = np.take_along_axis(scores, top_indices, axis=1)
+
+        top_matches = DataFrame(
+            {
+                "query_index": np.repeat(np.arange(queries.shape[0]), top_k),
+                "candidate_index": top_indices.ravel(),
+                "rank": np.tile(np.arange(1, top_k + 1), queries.shape[0]),
+                "score": top_scores.ravel(),
+            }
+        )
+        self.status = f"{len(top_matches)} matches for {queries.shape[0]} embedding vectors"
+        return top_matches
+
+    def _to_matrix(self, vectors: list[Data], name: str) -> np.ndarray:
+        if not vectors:
+            msg = f"{name} must contain at least one embedding vector."
+            raise ValueError(msg)
+        try:
+            matrix = np.asarray([vector.data["embeddings"] for vector in vectors], dtype=np.float64)
+        except ValueError as e:
+            msg = "Embeddings must have the same dimensions."
+            raise ValueError(msg) from e
+        return matrix
+
+    def _score_matrix(self, queries: np.ndarray, candidates: np.ndarray) -> tuple[np.ndarray, bool]:
+        """Returns the scores of every query and candidate pair and whether higher scores are better matches."""
+        if self.similarity_metric == "Cosine Similarity":
+            query_norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            candidate_norms = np.linalg.norm(candidates, axis=1, keepdims=True)
+            return (queries / query_norms) @ (candidates / candidate_norms).T, True
+
+        if self.similarity_metric == "Euclidean Distance":
+            # |q - c|^2 = |q|^2 + |c|^2 - 2 q.c, clipped as rounding can make it slightly negative
+            squared = (
+                np.sum(queries**2, axis=1)[:, None]
+                + np.sum(candidates**2, axis=1)[None, :]
+                - 2 * queries @ candidates.T
+            )
+            return np.sqrt(np.clip(squared, 0, None)), False
+
+        if self.similarity_metric == "Manhattan Distance":
+            scores = np.empty((queries.shape[0], candidates.shape[0]))
+            for start in range(0, queries.shape[0], MANHATTAN_BATCH_SIZE):
+                batch = queries[start : start + MANHATTAN_BATCH_SIZE]
+                scores[start : start + len(batch)] = np.abs(batch[:, None, :] - candidates[None, :, :]).sum(axis=2)
+            return scores, False
+
+        msg = f"Unsupported similarity metric: {self.similarity_metric}"
+        raise ValueError(msg)
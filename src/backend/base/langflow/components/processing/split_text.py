@@ -1,5 +1,10 @@
+import copy
+from collections.abc import Iterator
+from itertools import islice
+
 from langchain_text_splitters import CharacterTextSplitter
 
+from langflow.base.data.utils import create_process_pool
 from langflow.custom import Component
 from langflow.io import HandleInput, IntInput, MessageTextInput, Output
 from langflow.schema import Data
@@ -11,6 +16,7 @@ class SplitTextComponent(Component):
     description: str = "Split text into chunks based on specified criteria."
     icon = "scissors-line-dashed"
     name = "SplitText"
+    cache_results = True
 
     inputs = [
         HandleInput(
@@ -38,26 +44,61 @@ class SplitTextComponent(Component):
             info="The character to split on. Defaults to newline.",
             value="\n",
         ),
+        IntInput(
+            name="workers",
+            display_name="Worker Processes",
+            info=(
+                "The number of processes that split the inputs. Use more than 1 to split large batches of inputs "
+                "on several cores."
+            ),
+            value=1,
+            advanced=True,
+        ),
     ]
 
     outputs = [
         Output(display_name="Chunks", name="chunks", method="split_text"),
     ]
 
-    def _docs_to_data(self, docs):
-        return [Data(text=doc.page_content, data=doc.metadata) for doc in docs]
-
     def split_text(self) -> list[Data]:
-        separator = unescape_string(self.separator)
+        data = list(self.iter_chunks())
+        self.status = data
+        return data
 
-        documents = [_input.to_lc_document() for _input in self.data_inputs if isinstance(_input, Data)]
+    def iter_chunks(self) -> Iterator[Data]:
+        """Splits the inputs lazily, one input at a time, yielding a Data per chunk.
 
+        The chunks are built straight from the text of each input, without intermediate LangChain Documents. With
+        more than one worker, the inputs are split in batches by a pool of processes.
+        """
         splitter = CharacterTextSplitter(
             chunk_overlap=self.chunk_overlap,
             chunk_size=self.chunk_size,
-            separator=separator,
+            separator=unescape_string(self.separator),
         )
-        docs = splitter.split_documents(documents)
-        data = self._docs_to_data(docs)
-        self.status = data
-        return data
+        inputs = (_input for _input in self.data_inputs if isinstance(_input, Data))
+        if self.workers > 1 and len(self.data_inputs) > 1:
+            yield from self._iter_chunks_in_processes(splitter, inputs)
+            return
+        for _input in inputs:
+            yield from self._chunks_to_data(_input, splitter.split_text(self._get_text(_input)))
+
+    def _iter_chunks_in_processes(self, splitter: CharacterTextSplitter, inputs: Iterator[Data]) -> Iterator[Data]:
+        # Only a few batches of texts are sent to the processes at a time, to keep the memory bounded
+        batch_size = self.workers * 4
+        with create_process_pool(self.workers) as executor:
+            while batch := list(islice(inputs, batch_size)):
+                texts = [self._get_text(_input) for _input in batch]
+                for _input, chunks in zip(batch, executor.map(splitter.split_text, texts), strict=True):
+                    yield from self._chunks_to_data(_input, chunks)
+
+    @staticmethod
+    def _get_text(_input: Data) -> str:
+        text = _input.get_text()
+        return text if isinstance(text, str) else str(text)
+
+    def _chunks_to_data(self, _input: Data, chunks: list[str]) -> Iterator[Data]:
+        # The same metadata as Data.to_lc_document, copied for each chunk as CharacterTextSplitter does
+        metadata = {key: value for key, value in _input.data.items() if key != _input.text_key}
+        for chunk in chunks:
+            yield Data(text=chunk, data=copy.deepcopy(metadata))
@@ -82,6 +82,12 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
         ),
     ]
 
+    pool_vector_store = True
+
+    def check_vector_store_health(self, vector_store: Chroma) -> bool:
+        vector_store._client.heartbeat()
+        return True
+
     @check_cached_vector_store
     def build_vector_store(self) -> Chroma:
         """Builds the Chroma object."""
@@ -1,6 +1,7 @@
 from langchain_community.vectorstores import FAISS
 
 from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from langflow.base.vectorstores.pool import get_vector_store_pool
 from langflow.helpers.data import docs_to_data
 from langflow.io import BoolInput, HandleInput, IntInput, StrInput
 from langflow.schema import Data
@@ -44,6 +45,8 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
         ),
     ]
 
+    pool_vector_store = True
+
     @check_cached_vector_store
     def build_vector_store(self) -> FAISS:
         """Builds the FAISS object."""
@@ -72,12 +75,19 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             raise ValueError(msg)
         path = self.resolve_path(self.persist_directory)
 
-        vector_store = FAISS.load_local(
-            folder_path=path,
-            embeddings=self.embedding,
-            index_name=self.index_name,
-            allow_dangerous_deserialization=self.allow_dangerous_deserialization,
-        )
+        # Reuse the index loaded, or built, by a previous run instead of reading it from disk again
+        pool = get_vector_store_pool()
+        pool_key = self.get_vector_store_pool_key() if pool is not None else None
+        vector_store = pool.get(pool_key) if pool_key is not None else None
+        if vector_store is None:
+            vector_store = FAISS.load_local(
+                folder_path=path,
+                embeddings=self.embedding,
+                index_name=self.index_name,
+                allow_dangerous_deserialization=self.allow_dangerous_deserialization,
+            )
+            if pool_key is not None and vector_store:
+                pool.put(pool_key, vector_store)
 
         if not vector_store:
             msg = "Failed to load the FAISS index."
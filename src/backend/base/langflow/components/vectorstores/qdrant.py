@@ -48,6 +48,12 @@ class QdrantVectorStoreComponent(LCVectorStoreComponent):
         ),
     ]
 
+    pool_vector_store = True
+
+    def check_vector_store_health(self, vector_store: Qdrant) -> bool:
+        vector_store.client.get_collections()
+        return True
+
     @check_cached_vector_store
     def build_vector_store(self) -> Qdrant:
         qdrant_kwargs = {
@@ -15,6 +15,7 @@ from langflow.helpers.flow import list_flows, load_flow, run_flow
 from langflow.schema import Data
 from langflow.services.deps import get_storage_service, get_variable_service, session_scope
 from langflow.services.storage.service import StorageService
+from langflow.services.variable.service import DatabaseVariableService
 from langflow.template.utils import update_frontend_node_with_template_values
 from langflow.type_extraction.type_extraction import post_process_type
 from langflow.utils import validate
@@ -53,6 +54,11 @@ class CustomComponent(BaseComponent):
     # True constants that should be shared (using ClassVar)
     _code_class_base_inheritance: ClassVar[str] = "CustomComponent"
     function_entrypoint_name: ClassVar[str] = "build"
+    cache_results: ClassVar[bool] = False
+    """Whether the results can be reused by builds with the same code and inputs when the vertex result cache is
+    enabled. Only set it for deterministic components."""
+    cache_results_ttl: ClassVar[int | None] = None
+    """The number of seconds cached results are reused for. None keeps them until the cache expires them."""
     name: str | None = None
     """The name of the component used to styles. Defaults to None."""
     display_name: str | None = None
@@ -437,6 +443,14 @@ class CustomComponent(BaseComponent):
         else:
             msg = f"Invalid user id: {self.user_id}"
             raise TypeError(msg)
+        if self._vertex is not None and isinstance(variable_service, DatabaseVariableService):
+            # Load the variables of the user once for the whole run instead of once per field
+            graph = self.graph
+            async with graph.run_variables_lock:
+                if graph.run_variables is None or str(graph.run_variables.user_id) != str(user_id):
+                    async with session_scope() as session:
+                        graph.run_variables = await variable_service.get_user_variables(user_id, session)
+            return graph.run_variables.get(name, field)
         async with session_scope() as session:
             return await variable_service.get_variable(user_id=user_id, name=name, field=field, session=session)
 
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any
+
+import orjson
+from loguru import logger
+
+from langflow.services.deps import get_settings_service
+from langflow.utils.version import get_version_info
+
+CATALOG_FILE_NAME = "component_catalog.json"
+
+
+class ComponentCatalog:
+    """A snapshot of the output types and templates built from component files, persisted between startups.
+
+    Building the template of a component executes its code, which dominates the startup time. The entries
+    are keyed by the hash of the component code, and the whole snapshot is discarded when the Langflow version
+    changes, so only the component files that changed since the last startup are processed again.
+    """
+
+    def __init__(self, path: Path, version: str) -> None:
+        self.path = path
+        self.version = version
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._used: dict[str, dict[str, Any]] = {}
+        self._changed = False
+
+    @classmethod
+    def load(cls, path: Path, version: str) -> ComponentCatalog:
+        """Loads the snapshot from the path, or returns an empty catalog if it is missing or outdated."""
+        catalog = cls(path, version)
+        try:
+            data = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return catalog
+        except (OSError, orjson.JSONDecodeError):
+            logger.warning(f"Could not read the component catalog at {path}, rebuilding it")
+            return catalog
+        if data.get("version") == version:
+            catalog._entries = data.get("components", {})
+        return catalog
+
+    @staticmethod
+    def hash_code(code: str) -> str:
+        return hashlib.sha256(code.encode()).hexdigest()
+
+    def get(self, code: str) -> dict[str, Any] | None:
+        """Returns the cached entry of the component code, or None if it was not built before."""
+        key = self.hash_code(code)
+        entry = self._used.get(key) or self._entries.get(key)
+        if entry is not None:
+            self._used[key] = entry
+        return entry
+
+    def update(self, code: str, **fields: Any) -> None:
+        """Caches fields of the component code entry. Values that cannot be persisted are not cached."""
+        try:
+            orjson.dumps(fields)
+        except TypeError:
+            logger.debug("Could not cache a component in the component catalog")
+            return
+        key = self.hash_code(code)
+        entry = self._used.get(key) or self._entries.get(key, {})
+        self._used[key] = {**entry, **fields}
+        self._changed = True
+
+    def merge(self, other: ComponentCatalog) -> None:
+        """Adds the entries used by a copy of the catalog, e.g. one used by another process."""
+        self._used.update(other._used)
+        self._changed = self._changed or other._changed
+
+    def save(self) -> None:
+        """Persists the entries used since the catalog was loaded, dropping the ones of removed components."""
+        if not self._changed and self._used.keys() == self._entries.keys():
+            return
+        data = orjson.dumps({"version": self.version, "components": self._used})
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            tmp_path.replace(self.path)
+        except OSError:
+            logger.opt(exception=True).warning(f"Could not save the component catalog to {self.path}")
+
+
+def load_component_catalog() -> ComponentCatalog | None:
+    """Returns the component catalog of the config directory, or None if `component_catalog_snapshot` is disabled."""
+    settings = get_settings_service().settings
+    if not settings.component_catalog_snapshot or not settings.config_dir:
+        return None
+    return ComponentCatalog.load(Path(settings.config_dir) / CATALOG_FILE_NAME, get_version_info()["version"])
@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 import ast
 import asyncio
 import zlib
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import anyio
 from aiofile import async_open
@@ -9,6 +12,9 @@ from loguru import logger
 
 from langflow.custom import Component
 
+if TYPE_CHECKING:
+    from langflow.custom.directory_reader.catalog import ComponentCatalog
+
 
 class CustomComponentPathValueError(ValueError):
     pass
@@ -41,10 +47,25 @@ class DirectoryReader:
     # the custom components from this directory.
     base_path = ""
 
-    def __init__(self, directory_path, *, compress_code_field=False) -> None:
-        """Initialize DirectoryReader with a directory path and a flag indicating whether to compress the code."""
+    def __init__(self, directory_path, *, compress_code_field=False, catalog: ComponentCatalog | None = None) -> None:
+        """Initialize DirectoryReader with a directory path and a flag indicating whether to compress the code.
+
+        If a component catalog is given, the output types and templates of the components whose code did not
+        change since they were cached are read from it instead of being built again.
+        """
         self.directory_path = directory_path
         self.compress_code_field = compress_code_field
+        self.catalog = catalog
+
+    def _get_cached(self, code: str, field: str) -> Any:
+        if self.catalog is None or not code:
+            return None
+        entry = self.catalog.get(code)
+        return entry.get(field) if entry else None
+
+    def _cache(self, code: str, **fields) -> None:
+        if self.catalog is not None and code:
+            self.catalog.update(code, **fields)
 
     def get_safe_path(self):
         """Check if the path is valid and return it, or None if it's not."""
@@ -68,8 +89,14 @@ class DirectoryReader:
             for component in menu["components"]:
                 try:
                     if component["error"] if with_errors else not component["error"]:
-                        component_tuple = (*build_component(component), component)
-                        components.append(component_tuple)
+                        template = None if with_errors else self._get_cached(component["code"], "template")
+                        if template is not None:
+                            component_name = self._get_cached(component["code"], "name")
+                        else:
+                            component_name, template = build_component(component)
+                            if not with_errors:
+                                self._cache(component["code"], name=component_name, template=template)
+                        components.append((component_name, template, component))
                 except Exception:  # noqa: BLE001
                     logger.debug(f"Error while loading component {component['name']} from {component['file']}")
                     continue
@@ -251,11 +278,14 @@ class DirectoryReader:
                 component_name_camelcase = component_name
 
             if validation_result:
-                try:
-                    output_types = self.get_output_types_from_code(result_content)
-                except Exception:  # noqa: BLE001
-                    logger.opt(exception=True).debug("Error while getting output types from code")
-                    output_types = [component_name_camelcase]
+                output_types = self._get_cached(result_content, "output_types")
+                if output_types is None:
+                    try:
+                        output_types = self.get_output_types_from_code(result_content)
+                        self._cache(result_content, output_types=output_types)
+                    except Exception:  # noqa: BLE001
+                        logger.opt(exception=True).debug("Error while getting output types from code")
+                        output_types = [component_name_camelcase]
             else:
                 output_types = [component_name_camelcase]
 
@@ -325,11 +355,14 @@ class DirectoryReader:
                 component_name_camelcase = component_name
 
             if validation_result:
-                try:
-                    output_types = await asyncio.to_thread(self.get_output_types_from_code, result_content)
-                except Exception:  # noqa: BLE001
-                    logger.exception("Error while getting output types from code")
-                    output_types = [component_name_camelcase]
+                output_types = self._get_cached(result_content, "output_types")
+                if output_types is None:
+                    try:
+                        output_types = await asyncio.to_thread(self.get_output_types_from_code, result_content)
+                        self._cache(result_content, output_types=output_types)
+                    except Exception:  # noqa: BLE001
+                        logger.exception("Error while getting output types from code")
+                        output_types = [component_name_camelcase]
             else:
                 output_types = [component_name_camelcase]
 
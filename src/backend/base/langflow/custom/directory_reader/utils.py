@@ -1,10 +1,20 @@
+from __future__ import annotations
+
 import asyncio
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
 from langflow.custom.directory_reader import DirectoryReader
 from langflow.template.frontend_node.custom_components import CustomComponentFrontendNode
 
+if TYPE_CHECKING:
+    from langflow.custom.directory_reader.catalog import ComponentCatalog
+
 
 def merge_nested_dicts_with_renaming(dict1, dict2):
     for key, value in dict2.items():
@@ -63,6 +73,51 @@ async def abuild_and_validate_all_files(reader: DirectoryReader, file_list):
     return valid_components, invalid_components
 
 
+def _build_and_validate_files_in_worker(path: str, file_list: list[str], catalog: ComponentCatalog | None):
+    """Builds and validates files in a worker process of the component discovery pool."""
+    reader = DirectoryReader(path, compress_code_field=False, catalog=catalog)
+    valid_components, invalid_components = build_and_validate_all_files(reader, file_list)
+    return valid_components, invalid_components, catalog
+
+
+def _merge_menu_lists(menu_lists: list[dict]) -> dict:
+    """Merges menu lists built from consecutive chunks of the same file list, keeping the order of the files."""
+    merged: dict = {"menu": []}
+    menus_by_name: dict[str, dict] = {}
+    for menu_list in menu_lists:
+        for menu in menu_list["menu"]:
+            if menu["name"] in menus_by_name:
+                menus_by_name[menu["name"]]["components"].extend(menu["components"])
+            else:
+                menus_by_name[menu["name"]] = menu
+                merged["menu"].append(menu)
+    return merged
+
+
+def build_and_validate_all_files_in_pool(
+    path: str, file_list: list[str], workers: int, catalog: ComponentCatalog | None = None
+):
+    """Build and validate all files across a pool of processes.
+
+    The files are split in consecutive chunks that are built by `workers` processes, and the results are merged
+    in the order of the files, so the menus are the same as the ones built by `build_and_validate_all_files`.
+    """
+    chunk_size = math.ceil(len(file_list) / (workers * 2))
+    chunks = [file_list[i : i + chunk_size] for i in range(0, len(file_list), chunk_size)]
+    # Forking a process that runs threads and an event loop is not safe
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        results = list(
+            executor.map(_build_and_validate_files_in_worker, repeat(path), chunks, repeat(catalog, len(chunks)))
+        )
+
+    if catalog is not None:
+        for _, _, worker_catalog in results:
+            catalog.merge(worker_catalog)
+    valid_components = _merge_menu_lists([valid for valid, _, _ in results])
+    invalid_components = _merge_menu_lists([invalid for _, invalid, _ in results])
+    return valid_components, invalid_components
+
+
 def load_files_from_path(path: str):
     """Load all files from a given path."""
     reader = DirectoryReader(path, compress_code_field=False)
@@ -70,12 +125,24 @@ def load_files_from_path(path: str):
     return reader.get_files()
 
 
-def build_custom_component_list_from_path(path: str):
-    """Build a list of custom components for the langchain from a given path."""
+def build_custom_component_list_from_path(path: str, catalog: ComponentCatalog | None = None, *, workers: int = 0):
+    """Build a list of custom components for the langchain from a given path.
+
+    If `workers` is set, the files are built across that many processes.
+    """
     file_list = load_files_from_path(path)
-    reader = DirectoryReader(path, compress_code_field=False)
+    reader = DirectoryReader(path, compress_code_field=False, catalog=catalog)
 
-    valid_components, invalid_components = build_and_validate_all_files(reader, file_list)
+    valid_components = invalid_components = None
+    if workers > 0 and len(file_list) > 1:
+        try:
+            valid_components, invalid_components = build_and_validate_all_files_in_pool(
+                path, file_list, workers, catalog
+            )
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).warning(f"Could not build the components of {path} in processes")
+    if valid_components is None or invalid_components is None:
+        valid_components, invalid_components = build_and_validate_all_files(reader, file_list)
 
     valid_menu = build_valid_menu(valid_components)
     invalid_menu = build_invalid_menu(invalid_components)
@@ -83,12 +150,26 @@ def build_custom_component_list_from_path(path: str):
     return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
 
 
-async def abuild_custom_component_list_from_path(path: str):
-    """Build a list of custom components for the langchain from a given path."""
+async def abuild_custom_component_list_from_path(
+    path: str, catalog: ComponentCatalog | None = None, *, workers: int = 0
+):
+    """Build a list of custom components for the langchain from a given path.
+
+    If `workers` is set, the files are built across that many processes.
+    """
     file_list = await asyncio.to_thread(load_files_from_path, path)
-    reader = DirectoryReader(path, compress_code_field=False)
+    reader = DirectoryReader(path, compress_code_field=False, catalog=catalog)
 
-    valid_components, invalid_components = await abuild_and_validate_all_files(reader, file_list)
+    valid_components = invalid_components = None
+    if workers > 0 and len(file_list) > 1:
+        try:
+            valid_components, invalid_components = await asyncio.to_thread(
+                build_and_validate_all_files_in_pool, path, file_list, workers, catalog
+            )
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).warning(f"Could not build the components of {path} in processes")
+    if valid_components is None or invalid_components is None:
+        valid_components, invalid_components = await abuild_and_validate_all_files(reader, file_list)
 
     valid_menu = build_valid_menu(valid_components)
     invalid_menu = build_invalid_menu(invalid_components)
@@ -1,5 +1,9 @@
+import hashlib
+import threading
 from typing import TYPE_CHECKING
 
+from cachetools import LRUCache
+
 from langflow.utils import validate
 
 if TYPE_CHECKING:
@@ -10,3 +14,65 @@ def eval_custom_component_code(code: str) -> type["CustomComponent"]:
     """Evaluate custom component code."""
     class_name = validate.extract_class_name(code)
     return validate.create_class(code, class_name)
+
+
+class ComponentClassCache:
+    """An LRU cache of the component classes compiled from component code, keyed by the hash of the code.
+
+    The classes are shared by every instance built from the same code, so they must not be modified.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: LRUCache = LRUCache(maxsize=max(max_size, 1))
+        self._lock = threading.Lock()
+
+    def get_class(self, code: str) -> type["CustomComponent"]:
+        """Returns the class defined by the code, compiling it only if it is not cached yet."""
+        if self.max_size <= 0:
+            return eval_custom_component_code(code)
+        key = hashlib.sha256(code.encode()).hexdigest()
+        with self._lock:
+            class_object = self._cache.get(key)
+            if class_object is not None:
+                self.hits += 1
+                return class_object
+            self.misses += 1
+        # Code that fails to compile is not cached, so the error is raised again on the next call
+        class_object = eval_custom_component_code(code)
+        with self._lock:
+            self._cache[key] = class_object
+        return class_object
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._cache), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_component_class_cache: ComponentClassCache | None = None
+
+
+def get_component_class_cache() -> ComponentClassCache:
+    """Returns the process wide component class cache, sized by the `component_class_cache_size` setting."""
+    from langflow.services.deps import get_settings_service
+
+    global _component_class_cache  # noqa: PLW0603
+    if _component_class_cache is None:
+        _component_class_cache = ComponentClassCache(
+            max_size=get_settings_service().settings.component_class_cache_size
+        )
+    return _component_class_cache
+
+
+def get_component_class(code: str) -> type["CustomComponent"]:
+    """Returns the class defined by the component code, from the component class cache when it is enabled."""
+    return get_component_class_cache().get_class(code)
@@ -13,16 +13,18 @@ from pydantic import BaseModel
 
 from langflow.custom import CustomComponent
 from langflow.custom.custom_component.component import Component
+from langflow.custom.directory_reader.catalog import load_component_catalog
 from langflow.custom.directory_reader.utils import (
     abuild_custom_component_list_from_path,
     build_custom_component_list_from_path,
     merge_nested_dicts_with_renaming,
 )
-from langflow.custom.eval import eval_custom_component_code
+from langflow.custom.eval import eval_custom_component_code, get_component_class
 from langflow.custom.schema import MissingDefault
 from langflow.field_typing.range_spec import RangeSpec
 from langflow.helpers.custom import format_type
 from langflow.schema import dotdict
+from langflow.services.deps import get_settings_service
 from langflow.template.field.base import Input
 from langflow.template.frontend_node.custom_components import ComponentFrontendNode, CustomComponentFrontendNode
 from langflow.type_extraction.type_extraction import extract_inner_type
@@ -267,7 +269,7 @@ def get_component_instance(custom_component: CustomComponent, user_id: str | UUI
         error = "Invalid code type"
     else:
         try:
-            custom_class = eval_custom_component_code(custom_component._code)
+            custom_class = get_component_class(custom_component._code)
         except Exception as exc:
             logger.exception("Error while evaluating custom component code")
             raise HTTPException(
@@ -466,12 +468,15 @@ def build_custom_components(components_paths: list[str]):
     logger.info(f"Building custom components from {components_paths}")
     custom_components_from_file: dict = {}
     processed_paths = set()
+    catalog = load_component_catalog()
     for path in components_paths:
         path_str = str(path)
         if path_str in processed_paths:
             continue
 
-        custom_component_dict = build_custom_component_list_from_path(path_str)
+        custom_component_dict = build_custom_component_list_from_path(
+            path_str, catalog=catalog, workers=get_settings_service().settings.component_discovery_workers
+        )
         if custom_component_dict:
             category = next(iter(custom_component_dict))
             logger.info(f"Loading {len(custom_component_dict[category])} component(s) from category {category}")
@@ -480,6 +485,8 @@ def build_custom_components(components_paths: list[str]):
             )
         processed_paths.add(path_str)
 
+    if catalog is not None:
+        catalog.save()
     return custom_components_from_file
 
 
@@ -491,12 +498,15 @@ async def abuild_custom_components(components_paths: list[str]):
     logger.info(f"Building custom components from {components_paths}")
     custom_components_from_file: dict = {}
     processed_paths = set()
+    catalog = await asyncio.to_thread(load_component_catalog)
     for path in components_paths:
         path_str = str(path)
         if path_str in processed_paths:
             continue
 
-        custom_component_dict = await abuild_custom_component_list_from_path(path_str)
+        custom_component_dict = await abuild_custom_component_list_from_path(
+            path_str, catalog=catalog, workers=get_settings_service().settings.component_discovery_workers
+        )
         if custom_component_dict:
             category = next(iter(custom_component_dict))
             logger.info(f"Loading {len(custom_component_dict[category])} component(s) from category {category}")
@@ -505,6 +515,8 @@ async def abuild_custom_components(components_paths: list[str]):
             )
         processed_paths.add(path_str)
 
+    if catalog is not None:
+        await asyncio.to_thread(catalog.save)
     return custom_components_from_file
 
 
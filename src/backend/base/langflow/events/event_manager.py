@@ -1,13 +1,16 @@
 import asyncio
 import inspect
-import json
+import threading
 import time
 import uuid
+from collections import Counter
 from functools import partial
-from typing import Literal
+from typing import Any, Literal
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from loguru import logger
+from pydantic import BaseModel
 from typing_extensions import Protocol
 
 from langflow.schema.log import LoggableType
@@ -22,10 +25,46 @@ class PartialEventCallback(Protocol):
     def __call__(self, *, data: LoggableType): ...
 
 
+def _encode_default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    return jsonable_encoder(obj)
+
+
+def encode_event(event_type: str, data: Any) -> bytes:
+    """Encodes an event in a single pass, falling back to `jsonable_encoder` for the types orjson does not know."""
+    return orjson.dumps({"event": event_type, "data": data}, default=_encode_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _get_running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
 class EventManager:
-    def __init__(self, queue: asyncio.Queue):
+    """Sends the events of a flow build to a queue.
+
+    With a `token_batch_interval`, the token events of a message are sent together, once per interval or every
+    `token_batch_size` tokens. Any other event first sends the pending tokens, so the order of the events is kept.
+    Components send their tokens from worker threads, so the pending tokens are guarded by a lock and the timer
+    that sends them is started in the event loop the manager was created in.
+    """
+
+    def __init__(self, queue: asyncio.Queue, *, token_batch_interval: float = 0, token_batch_size: int = 32):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        self.token_batch_interval = token_batch_interval
+        self.token_batch_size = token_batch_size
+        self.event_counts: Counter[str] = Counter()
+        self._token_id: str | None = None
+        self._token_chunks: list[str] = []
+        self._token_batch_start = 0.0
+        self._token_lock = threading.Lock()
+        self._token_flush_scheduled = False
+        self._token_flush_handle: asyncio.TimerHandle | None = None
+        self._loop = _get_running_loop()
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -61,6 +100,13 @@ class EventManager:
         self.events[name] = callback_
 
     def send_event(self, *, event_type: Literal["message", "error", "warning", "info", "token"], data: LoggableType):
+        if event_type == "token" and self.token_batch_interval > 0 and isinstance(data, dict):
+            self._add_token(data)
+            return
+        self.flush_tokens()
+        self._put_event(event_type, data)
+
+    def _put_event(self, event_type: str, data: LoggableType) -> None:
         try:
             if isinstance(data, dict) and event_type in {"message", "error", "warning", "info", "token"}:
                 data = create_event_by_type(event_type, **data)
@@ -68,11 +114,67 @@ class EventManager:
             logger.debug(f"Error creating playground event: {e}")
         except Exception:
             raise
-        jsonable_data = jsonable_encoder(data)
-        json_data = {"event": event_type, "data": jsonable_data}
         event_id = f"{event_type}-{uuid.uuid4()}"
-        str_data = json.dumps(json_data) + "\n\n"
-        self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+        self.event_counts[event_type] += 1
+        self.queue.put_nowait((event_id, encode_event(event_type, data) + b"\n\n", time.time()))
+
+    def _add_token(self, data: dict) -> None:
+        if self._loop is None:
+            # The manager was created outside of a loop, the first token sent from the loop sets it
+            self._loop = _get_running_loop()
+        token_id = data.get("id")
+        with self._token_lock:
+            if self._token_chunks and token_id != self._token_id:
+                self._send_tokens()
+            if not self._token_chunks:
+                self._token_id = token_id
+                self._token_batch_start = time.monotonic()
+            self._token_chunks.append(data.get("chunk", ""))
+            self.event_counts["token_chunk"] += 1
+            if (
+                len(self._token_chunks) >= self.token_batch_size
+                or time.monotonic() - self._token_batch_start >= self.token_batch_interval
+            ):
+                self._send_tokens()
+                return
+            if self._token_flush_scheduled:
+                return
+            self._token_flush_scheduled = True
+        self._schedule_token_flush()
+
+    def _schedule_token_flush(self) -> None:
+        # Sends the last tokens of the message even if no other event follows them
+        if self._loop is None or self._loop.is_closed():
+            with self._token_lock:
+                self._token_flush_scheduled = False
+            self.flush_tokens()
+        elif _get_running_loop() is self._loop:
+            self._token_flush_handle = self._loop.call_later(self.token_batch_interval, self._flush_scheduled_tokens)
+        else:
+            self._loop.call_soon_threadsafe(self._schedule_token_flush)
+
+    def _flush_scheduled_tokens(self) -> None:
+        with self._token_lock:
+            self._token_flush_handle = None
+            self._token_flush_scheduled = False
+            self._send_tokens()
+
+    def flush_tokens(self) -> None:
+        """Sends the pending tokens as a single token event."""
+        with self._token_lock:
+            # The timer can only be cancelled from its loop, elsewhere it fires later with no tokens to send
+            if self._token_flush_handle is not None and _get_running_loop() is self._loop:
+                self._token_flush_handle.cancel()
+                self._token_flush_handle = None
+                self._token_flush_scheduled = False
+            self._send_tokens()
+
+    def _send_tokens(self) -> None:
+        """Sends the pending tokens. The token lock must be held."""
+        if not self._token_chunks:
+            return
+        chunk, self._token_chunks = "".join(self._token_chunks), []
+        self._put_event("token", {"chunk": chunk, "id": self._token_id})
 
     def noop(self, *, data: LoggableType) -> None:
         pass
@@ -81,8 +183,8 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
-def create_default_event_manager(queue):
-    manager = EventManager(queue)
+def create_default_event_manager(queue, *, token_batch_interval: float = 0, token_batch_size: int = 32):
+    manager = EventManager(queue, token_batch_interval=token_batch_interval, token_batch_size=token_batch_size)
     manager.register_event("on_token", "token")
     manager.register_event("on_vertices_sorted", "vertices_sorted")
     manager.register_event("on_error", "error")
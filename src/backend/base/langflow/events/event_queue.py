@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Literal
+
+import orjson
+
+from langflow.events.event_manager import encode_event
+
+OverflowPolicy = Literal["coalesce", "drop"]
+
+
+class BuildEventQueue(asyncio.Queue):
+    """A queue of build events that bounds the token events waiting for a slow client.
+
+    The events are `(event_id, value, put_time)` tuples, as put by the `EventManager`. Once `max_size` events are
+    waiting, token events are either merged into the token event waiting last, when both are chunks of the same
+    message (`coalesce`), or discarded (`drop`). Other events are always queued, as the client needs all of them to
+    follow the build.
+    """
+
+    def __init__(self, max_size: int, overflow_policy: OverflowPolicy = "coalesce") -> None:
+        super().__init__()
+        self.max_size = max_size
+        self.overflow_policy = overflow_policy
+        self.coalesced = 0
+        self.dropped = 0
+
+    def put_nowait(self, item: tuple) -> None:
+        event_id, value, _ = item
+        if value is not None and self.qsize() >= self.max_size and _is_token_event(event_id):
+            if self.overflow_policy == "drop":
+                self.dropped += 1
+                return
+            if self._coalesce(value):
+                self.coalesced += 1
+                return
+        super().put_nowait(item)
+
+    def _coalesce(self, value: bytes) -> bool:
+        # Called only when the queue is full, so parsing the waiting token event again is not in the hot path
+        last_event_id, last_value, last_put_time = self._queue[-1]  # type: ignore[attr-defined]
+        if not _is_token_event(last_event_id):
+            return False
+        last_event, event = orjson.loads(last_value), orjson.loads(value)
+        if last_event["data"].get("id") != event["data"].get("id"):
+            return False
+        last_event["data"]["chunk"] += event["data"]["chunk"]
+        merged_value = encode_event("token", last_event["data"]) + b"\n\n"
+        self._queue[-1] = (last_event_id, merged_value, last_put_time)  # type: ignore[attr-defined]
+        return True
+
+
+def _is_token_event(event_id: str | None) -> bool:
+    return event_id is not None and event_id.startswith("token-")
@@ -6,10 +6,10 @@ import copy
 import json
 import queue
 import threading
+import time
 import uuid
 from collections import defaultdict, deque
 from datetime import datetime, timezone
-from functools import partial
 from itertools import chain
 from typing import TYPE_CHECKING, Any, cast
 
@@ -38,7 +38,7 @@ from langflow.logging.logger import LogConfig, configure
 from langflow.schema.dotdict import dotdict
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import get_chat_service, get_settings_service, get_tracing_service
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -52,6 +52,7 @@ if TYPE_CHECKING:
     from langflow.schema import Data
     from langflow.services.chat.schema import GetCache, SetCache
     from langflow.services.tracing.service import TracingService
+    from langflow.services.variable.service import UserVariables
 
 
 class Graph:
@@ -100,6 +101,9 @@ class Graph:
         self._sorted_vertices_layers: list[list[str]] = []
         self._run_id = ""
         self._session_id = ""
+        # The variables of the user, loaded once per run when a component first resolves a variable
+        self.run_variables: UserVariables | None = None
+        self.run_variables_lock = asyncio.Lock()
         self._start_time = datetime.now(timezone.utc)
         self.inactivated_vertices: set = set()
         self.activated_vertices: list[str] = []
@@ -107,7 +111,9 @@ class Graph:
         self.vertices_to_run: set[str] = set()
         self.stop_vertex: str | None = None
         self.inactive_vertices: set = set()
-        self.edges: list[CycleEdge] = []
+        self._graph_edges: list[CycleEdge] = []
+        self._outgoing_edges: dict[str, list[CycleEdge]] = defaultdict(list)
+        self._incoming_edges: dict[str, list[CycleEdge]] = defaultdict(list)
         self.vertices: list[Vertex] = []
         self.run_manager = RunnableVerticesManager()
         self.state_manager = GraphStateManager()
@@ -130,6 +136,8 @@ class Graph:
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        self.queue_wait_times: dict[str, float] = {}
+        self._changed_vertices: set[str] = set()
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -648,6 +656,8 @@ class Graph:
         for vertex in self.vertices:
             self.state_manager.subscribe(run_id_str, vertex.update_graph_state)
         self._run_id = run_id_str
+        self.run_variables = None
+        self.run_variables_lock = asyncio.Lock()
         if self.tracing_service:
             self.tracing_service.set_run_id(run_id)
 
@@ -940,8 +950,8 @@ class Graph:
 
     def get_edge(self, source_id: str, target_id: str) -> CycleEdge | None:
         """Returns the edge between two vertices."""
-        for edge in self.edges:
-            if edge.source_id == source_id and edge.target_id == target_id:
+        for edge in self._outgoing_edges.get(source_id, []):
+            if edge.target_id == target_id:
                 return edge
         return None
 
@@ -1030,8 +1040,11 @@ class Graph:
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
+        edges = state.pop("edges")
         self.__dict__.update(state)
+        self.edges = edges
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
+        self._changed_vertices = set()
         self.state_manager = GraphStateManager()
         self.tracing_service = get_tracing_service()
         self.set_run_id(self._run_id)
@@ -1074,6 +1087,59 @@ class Graph:
         else:
             return graph
 
+    def clone(self, user_id: str | None = None) -> Graph:
+        """Creates a fresh copy of the graph that reuses its already processed structure.
+
+        The flattened nodes and edges, the cycle information and the adjacency maps are carried
+        over from this graph, so only the vertices and their component instances are created again.
+        Plain edges hold no run state and are shared with the copy.
+
+        Args:
+            user_id: The user ID of the new graph. Defaults to the user ID of this graph.
+
+        Returns:
+            Graph: A new graph without any run state.
+        """
+        if self._start is not None:
+            # Graphs built from components keep their instances in the vertices
+            return copy.deepcopy(self)
+
+        new_graph = type(self)(
+            flow_id=self.flow_id,
+            flow_name=self.flow_name,
+            description=self.description,
+            user_id=user_id if user_id is not None else self.user_id,
+            context=dict(self._context),
+        )
+        new_graph.raw_graph_data = self.raw_graph_data
+        new_graph._vertices = self._vertices.copy()
+        new_graph._edges = self._edges.copy()
+        new_graph.top_level_vertices = self.top_level_vertices.copy()
+        new_graph._cycle_vertices = set(self.cycle_vertices)
+        new_graph._is_cyclic = self.is_cyclic
+
+        new_graph.vertices = [new_graph._create_vertex(vertex.full_data) for vertex in self.vertices]
+        new_graph.vertex_map = {vertex.id: vertex for vertex in new_graph.vertices}
+        new_graph.edges = [
+            cast("CycleEdge", new_graph.build_edge(edge.to_data())) if isinstance(edge, CycleEdge) else edge
+            for edge in self.edges
+        ]
+        new_graph.predecessor_map = defaultdict(
+            list, {key: value.copy() for key, value in self.predecessor_map.items()}
+        )
+        new_graph.successor_map = defaultdict(list, {key: value.copy() for key, value in self.successor_map.items()})
+        new_graph.parent_child_map = defaultdict(
+            list, {key: value.copy() for key, value in self.parent_child_map.items()}
+        )
+        new_graph.in_degree_map = defaultdict(int, self.in_degree_map)
+
+        new_graph._build_vertex_params()
+        new_graph._instantiate_components_in_vertices()
+        new_graph._set_cache_to_vertices_in_cycle()
+        new_graph.run_manager.cycle_vertices = self.run_manager.cycle_vertices.copy()
+        new_graph.define_vertices_lists()
+        return new_graph
+
     def __eq__(self, /, other: object) -> bool:
         if not isinstance(other, Graph):
             return False
@@ -1082,18 +1148,49 @@ class Graph:
     # update this graph with another graph by comparing the __repr__ of each vertex
     # and if the __repr__ of a vertex is not the same as the other
     # then update the .data of the vertex to the self
+    @property
+    def edges(self) -> list[CycleEdge]:
+        return self._graph_edges
+
+    @edges.setter
+    def edges(self, edges: list[CycleEdge]) -> None:
+        self._graph_edges = edges
+        self._outgoing_edges = defaultdict(list)
+        self._incoming_edges = defaultdict(list)
+        for edge in edges:
+            self._index_edge(edge)
+
+    def _index_edge(self, edge: CycleEdge) -> None:
+        """Adds an edge to the incoming and outgoing edge indexes of its vertices."""
+        self._outgoing_edges[edge.source_id].append(edge)
+        self._incoming_edges[edge.target_id].append(edge)
+
+    def _append_edge(self, edge: CycleEdge) -> None:
+        """Appends an edge to the graph keeping the edge indexes up to date."""
+        self._graph_edges.append(edge)
+        self._index_edge(edge)
+
+    def _remove_edges_of_vertex(self, vertex_id: str) -> None:
+        """Removes all the edges that start or end in a vertex, keeping the edge indexes up to date."""
+        removed = self._outgoing_edges.pop(vertex_id, []) + self._incoming_edges.pop(vertex_id, [])
+        if not removed:
+            return
+        for edge in removed:
+            if edge.target_id != vertex_id:
+                self._incoming_edges[edge.target_id].remove(edge)
+            if edge.source_id != vertex_id:
+                self._outgoing_edges[edge.source_id].remove(edge)
+        self._graph_edges = [edge for edge in self._graph_edges if vertex_id not in {edge.source_id, edge.target_id}]
+
     # both graphs have the same vertices and edges
     # but the data of the vertices might be different
 
     def update_edges_from_vertex(self, other_vertex: Vertex) -> None:
         """Updates the edges of a vertex in the Graph."""
-        new_edges = []
-        for edge in self.edges:
-            if other_vertex.id in {edge.source_id, edge.target_id}:
-                continue
-            new_edges.append(edge)
-        new_edges += other_vertex.edges
-        self.edges = new_edges
+        new_edges = other_vertex.edges
+        self._remove_edges_of_vertex(other_vertex.id)
+        for edge in new_edges:
+            self._append_edge(edge)
 
     def vertex_data_is_identical(self, vertex: Vertex, other_vertex: Vertex) -> bool:
         data_is_equivalent = vertex == other_vertex
@@ -1201,8 +1298,12 @@ class Graph:
         """Updates the edges of a vertex."""
         # Vertex has edges, so we need to update the edges
         for edge in vertex.edges:
-            if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
-                self.edges.append(edge)
+            if (
+                edge.source_id in self.vertex_map
+                and edge.target_id in self.vertex_map
+                and edge not in self._outgoing_edges.get(edge.source_id, [])
+            ):
+                self._append_edge(edge)
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
@@ -1245,7 +1346,7 @@ class Graph:
             return
         self.vertices.remove(vertex)
         self.vertex_map.pop(vertex_id)
-        self.edges = [edge for edge in self.edges if vertex_id not in {edge.source_id, edge.target_id}]
+        self._remove_edges_of_vertex(vertex_id)
 
     def _build_vertex_params(self) -> None:
         """Identifies and handles the LLM vertex within the graph."""
@@ -1322,10 +1423,58 @@ class Graph:
         self.reset_inactivated_vertices()
         self.reset_activated_vertices()
 
-        await chat_service.set_cache(str(self.flow_id or self._run_id), self)
+        await chat_service.cache_graph(str(self.flow_id or self._run_id), self)
         self._record_snapshot(vertex_id)
         return vertex_build_result
 
+    def mark_vertex_changed(self, vertex_id: str) -> None:
+        """Records that the run state of a vertex changed so it is part of the next state delta."""
+        self._changed_vertices.add(vertex_id)
+
+    def pop_state_delta(self) -> dict[str, Any]:
+        """Returns the run state that changed since the previous delta and starts tracking changes again.
+
+        The delta holds the run manager state, the vertices waiting to run and the run state of the
+        vertices built or (in)activated since the previous delta, so its size depends on the work done
+        and not on the size of the graph. Use `apply_state_delta` to replay it on a graph snapshot.
+        """
+        changed_vertices = [
+            self.vertex_map[vertex_id] for vertex_id in self._changed_vertices if vertex_id in self.vertex_map
+        ]
+        self._changed_vertices = set()
+        return {
+            "run_manager": copy.deepcopy(self.run_manager.to_dict()),
+            "vertices_to_run": set(self.vertices_to_run),
+            "inactivated_vertices": set(self.inactivated_vertices),
+            "activated_vertices": list(self.activated_vertices),
+            "run_queue": list(self._run_queue),
+            "vertices": {vertex.id: vertex.get_run_state() for vertex in changed_vertices},
+            "cycle_edges": {
+                (edge.source_id, edge.target_id): (edge.is_fulfilled, edge.result)
+                for vertex in changed_vertices
+                for edge in vertex.incoming_edges
+                if isinstance(edge, CycleEdge)
+            },
+        }
+
+    def apply_state_delta(self, delta: dict[str, Any]) -> None:
+        """Applies a delta created by `pop_state_delta` to this graph."""
+        cycle_vertices = self.run_manager.cycle_vertices
+        self.run_manager = RunnableVerticesManager.from_dict(delta["run_manager"])
+        self.run_manager.cycle_vertices = cycle_vertices
+        self.vertices_to_run = set(delta["vertices_to_run"])
+        self.inactivated_vertices = set(delta["inactivated_vertices"])
+        self.activated_vertices = list(delta["activated_vertices"])
+        self._run_queue = deque(delta["run_queue"])
+        for vertex_id, run_state in delta["vertices"].items():
+            if vertex_id in self.vertex_map:
+                self.vertex_map[vertex_id].set_run_state(run_state)
+        for (source_id, target_id), (is_fulfilled, result) in delta["cycle_edges"].items():
+            edge = self.get_edge(source_id, target_id)
+            if isinstance(edge, CycleEdge):
+                edge.is_fulfilled = is_fulfilled
+                edge.result = result
+
     def get_snapshot(self):
         return copy.deepcopy(
             {
@@ -1429,12 +1578,16 @@ class Graph:
                         should_build = True
 
             if should_build:
+                result_cache_kwargs = {}
+                if get_settings_service().settings.vertex_result_cache:
+                    result_cache_kwargs = {"get_cache": get_cache, "set_cache": set_cache}
                 await vertex.build(
                     user_id=user_id,
                     inputs=inputs_dict,
                     fallback_to_env_vars=fallback_to_env_vars,
                     files=files,
                     event_manager=event_manager,
+                    **result_cache_kwargs,
                 )
                 if set_cache is not None:
                     vertex_dict = {
@@ -1452,6 +1605,8 @@ class Graph:
             if not isinstance(exc, ComponentBuildError):
                 logger.exception("Error building Component")
             raise
+        finally:
+            self.mark_vertex_changed(vertex_id)
 
         if vertex.result is not None:
             params = f"{vertex.built_object_repr()}{params}"
@@ -1475,71 +1630,139 @@ class Graph:
     ) -> list[CycleEdge]:
         """Returns a list of edges for a given vertex."""
         # The idea here is to return the edges that have the vertex_id as source or target
-        # or both
-        return [
-            edge
-            for edge in self.edges
-            if (edge.source_id == vertex_id and is_source is not False)
-            or (edge.target_id == vertex_id and is_target is not False)
-        ]
+        # or both, using the edge indexes so the cost depends on the degree of the vertex
+        outgoing_edges = self._outgoing_edges.get(vertex_id, []) if is_source is not False else []
+        if is_target is False:
+            return list(outgoing_edges)
+        incoming_edges = self._incoming_edges.get(vertex_id, [])
+        # Self loops are in both indexes but must only be returned once
+        return outgoing_edges + [edge for edge in incoming_edges if edge.source_id != vertex_id or is_source is False]
 
     def get_vertices_with_target(self, vertex_id: str) -> list[Vertex]:
         """Returns the vertices connected to a vertex."""
         vertices: list[Vertex] = []
-        for edge in self.edges:
-            if edge.target_id == vertex_id:
-                vertex = self.get_vertex(edge.source_id)
-                if vertex is None:
-                    continue
-                vertices.append(vertex)
+        for edge in self._incoming_edges.get(vertex_id, []):
+            vertex = self.get_vertex(edge.source_id)
+            if vertex is None:
+                continue
+            vertices.append(vertex)
         return vertices
 
-    async def process(self, *, fallback_to_env_vars: bool, start_component_id: str | None = None) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+    async def process(
+        self,
+        *,
+        fallback_to_env_vars: bool,
+        start_component_id: str | None = None,
+        max_concurrency: int | None = None,
+    ) -> Graph:
+        """Processes the graph, building each vertex as soon as all of its predecessors are built.
+
+        Args:
+            fallback_to_env_vars: Whether to fallback to environment variables.
+            start_component_id: The ID of the component to start the run from.
+            max_concurrency: The maximum number of vertices built at the same time. Defaults to the
+                `max_concurrent_vertex_builds` setting, where 0 means no limit.
+        """
         first_layer = self.sort_vertices(start_component_id=start_component_id)
         vertex_task_run_count: dict[str, int] = {}
-        to_process = deque(first_layer)
-        layer_index = 0
         chat_service = get_chat_service()
         run_id = uuid.uuid4()
         self.set_run_id(run_id)
         self.set_run_name()
         await self.initialize_run()
         lock = chat_service.async_cache_locks[self.run_id]
-        while to_process:
-            current_batch = list(to_process)  # Copy current deque items to a list
-            to_process.clear()  # Clear the deque for new items
-            tasks = []
-            for vertex_id in current_batch:
+        if max_concurrency is None:
+            max_concurrency = get_settings_service().settings.max_concurrent_vertex_builds
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+        self.queue_wait_times = {}
+        pending: set[asyncio.Task] = set()
+
+        def schedule(vertices_ids: list[str]) -> None:
+            for vertex_id in vertices_ids:
                 vertex = self.get_vertex(vertex_id)
                 task = asyncio.create_task(
-                    self.build_vertex(
-                        vertex_id=vertex_id,
-                        user_id=self.user_id,
-                        inputs_dict={},
+                    self._build_vertex_when_ready(
+                        vertex_id,
+                        semaphore=semaphore,
+                        queued_at=time.perf_counter(),
                         fallback_to_env_vars=fallback_to_env_vars,
                         get_cache=chat_service.get_cache,
                         set_cache=chat_service.set_cache,
                     ),
                     name=f"{vertex.display_name} Run {vertex_task_run_count.get(vertex_id, 0)}",
                 )
-                tasks.append(task)
+                pending.add(task)
                 vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
 
-            logger.debug(f"Running layer {layer_index} with {len(tasks)} tasks, {current_batch}")
+        logger.debug(f"Starting graph processing with {first_layer}")
+        schedule(first_layer)
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending.difference_update(done)
             try:
-                next_runnable_vertices = await self._execute_tasks(tasks, lock=lock)
+                vertices = self._get_built_vertices(done)
             except Exception:
-                logger.exception(f"Error executing tasks in layer {layer_index}")
+                for task in pending:
+                    task.cancel()
+                # No build is left running once the run failed
+                await asyncio.gather(*pending, return_exceptions=True)
                 raise
-            if not next_runnable_vertices:
-                break
-            to_process.extend(next_runnable_vertices)
-            layer_index += 1
+            for vertex in vertices:
+                # set all executed vertices as non-runnable to not run them again.
+                # they could be calculated as predecessor or successors of parallel vertices
+                # This could usually happen with input vertices like ChatInput
+                self.run_manager.remove_vertex_from_runnables(vertex.id)
+                logger.debug(f"Vertex {vertex.id}, result: {vertex.built_result}, object: {vertex.built_object}")
+
+            for vertex in vertices:
+                next_runnable_vertices = await self.get_next_runnable_vertices(lock, vertex=vertex, cache=False)
+                logger.debug(f"Vertex {vertex.id} finished, starting {next_runnable_vertices}")
+                schedule(next_runnable_vertices)
 
         logger.debug("Graph processing complete")
         return self
 
+    async def _build_vertex_when_ready(
+        self,
+        vertex_id: str,
+        *,
+        semaphore: asyncio.Semaphore | None,
+        queued_at: float,
+        fallback_to_env_vars: bool,
+        get_cache: GetCache | None = None,
+        set_cache: SetCache | None = None,
+    ) -> VertexBuildResult:
+        """Waits for a free build slot and builds the vertex, recording how long it waited in the queue."""
+        async with semaphore or contextlib.nullcontext():
+            queue_wait_time = time.perf_counter() - queued_at
+            self.queue_wait_times[vertex_id] = queue_wait_time
+            logger.debug(f"Vertex {vertex_id} waited {queue_wait_time:.4f} seconds to be built")
+            return await self.build_vertex(
+                vertex_id=vertex_id,
+                user_id=self.user_id,
+                inputs_dict={},
+                fallback_to_env_vars=fallback_to_env_vars,
+                get_cache=get_cache,
+                set_cache=set_cache,
+            )
+
+    @staticmethod
+    def _get_built_vertices(tasks: set[asyncio.Task]) -> list[Vertex]:
+        """Returns the vertices built by the finished tasks, raising the first exception found."""
+        vertices: list[Vertex] = []
+        for task in sorted(tasks, key=lambda task: task.get_name()):
+            task_name = task.get_name()
+            if (exception := task.exception()) is not None:
+                logger.error(f"Task {task_name} failed with exception: {exception}")
+                raise exception
+            result = task.result()
+            if isinstance(result, VertexBuildResult):
+                vertices.append(result.vertex)
+            else:
+                msg = f"Invalid result from task {task_name}: {result}"
+                raise TypeError(msg)
+        return vertices
+
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         next_runnable_vertices = set()
         for v_id in sorted(vertex_successors_ids):
@@ -1563,43 +1786,9 @@ class Graph:
                 else:
                     self.run_manager.add_to_vertices_being_run(next_v_id)
             if cache and self.flow_id is not None:
-                set_cache_coro = partial(get_chat_service().set_cache, key=self.flow_id)
-                await set_cache_coro(data=self, lock=lock)
+                await get_chat_service().cache_graph(str(self.flow_id), self, lock=lock)
         return next_runnable_vertices
 
-    async def _execute_tasks(self, tasks: list[asyncio.Task], lock: asyncio.Lock) -> list[str]:
-        """Executes tasks in parallel, handling exceptions for each task."""
-        results = []
-        completed_tasks = await asyncio.gather(*tasks, return_exceptions=True)
-        vertices: list[Vertex] = []
-
-        for i, result in enumerate(completed_tasks):
-            task_name = tasks[i].get_name()
-            if isinstance(result, Exception):
-                logger.error(f"Task {task_name} failed with exception: {result}")
-                # Cancel all remaining tasks
-                for t in tasks[i + 1 :]:
-                    t.cancel()
-                raise result
-            if isinstance(result, VertexBuildResult):
-                vertices.append(result.vertex)
-            else:
-                msg = f"Invalid result from task {task_name}: {result}"
-                raise TypeError(msg)
-
-        for v in vertices:
-            # set all executed vertices as non-runnable to not run them again.
-            # they could be calculated as predecessor or successors of parallel vertices
-            # This could usually happen with input vertices like ChatInput
-            self.run_manager.remove_vertex_from_runnables(v.id)
-
-            logger.debug(f"Vertex {v.id}, result: {v.built_result}, object: {v.built_object}")
-
-        for v in vertices:
-            next_runnable_vertices = await self.get_next_runnable_vertices(lock, vertex=v, cache=False)
-            results.extend(next_runnable_vertices)
-        return list(set(results))
-
     def topological_sort(self) -> list[Vertex]:
         """Performs a topological sort of the vertices in the graph.
 
@@ -1683,7 +1872,7 @@ class Graph:
     def get_vertex_neighbors(self, vertex: Vertex) -> dict[Vertex, int]:
         """Returns the neighbors of a vertex."""
         neighbors: dict[Vertex, int] = {}
-        for edge in self.edges:
+        for edge in self.get_vertex_edges(vertex.id):
             if edge.source_id == vertex.id:
                 neighbor = self.get_vertex(edge.target_id)
                 if neighbor is None:
@@ -1691,7 +1880,7 @@ class Graph:
                 if neighbor not in neighbors:
                     neighbors[neighbor] = 0
                 neighbors[neighbor] += 1
-            elif edge.target_id == vertex.id:
+            else:
                 neighbor = self.get_vertex(edge.source_id)
                 if neighbor is None:
                     continue
@@ -15,11 +15,11 @@ from langflow.interface.utils import extract_input_variables_from_prompt
 from langflow.schema.data import Data
 from langflow.schema.message import Message
 from langflow.services.database.models.transactions.crud import log_transaction as crud_log_transaction
-from langflow.services.database.models.transactions.model import TransactionBase
+from langflow.services.database.models.transactions.model import TransactionBase, TransactionTable
 from langflow.services.database.models.vertex_builds.crud import log_vertex_build as crud_log_vertex_build
-from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
 from langflow.services.database.utils import session_getter
-from langflow.services.deps import get_db_service, get_settings_service
+from langflow.services.deps import get_build_log_service, get_db_service, get_settings_service
 
 if TYPE_CHECKING:
     from langflow.api.v1.schemas import ResultDataResponse
@@ -157,6 +157,10 @@ async def log_transaction(
             error=error,
             flow_id=flow_id if isinstance(flow_id, UUID) else UUID(flow_id),
         )
+        build_log_service = get_build_log_service()
+        if build_log_service.enabled:
+            await build_log_service.log(TransactionTable(**transaction.model_dump()))
+            return
         async with session_getter(get_db_service()) as session:
             inserted = await crud_log_transaction(session, transaction)
             logger.debug(f"Logged transaction: {inserted.id}")
@@ -187,6 +191,10 @@ async def log_vertex_build(
             # ugly hack to get the model dump with weird datatypes
             artifacts=json.loads(json.dumps(artifacts, default=str)),
         )
+        build_log_service = get_build_log_service()
+        if build_log_service.enabled:
+            await build_log_service.log(VertexBuildTable(**vertex_build.model_dump()))
+            return
         async with session_getter(get_db_service()) as session:
             inserted = await crud_log_vertex_build(session, vertex_build)
             logger.debug(f"Logged vertex build: {inserted.build_id}")
@@ -194,6 +202,13 @@ async def log_vertex_build(
         logger.exception("Error logging vertex build")
 
 
+async def aflush_build_logs() -> None:
+    """Writes the buffered transactions and vertex builds to the database, if `build_log_batching` is enabled."""
+    build_log_service = get_build_log_service()
+    if build_log_service.enabled:
+        await build_log_service.flush()
+
+
 def rewrite_file_path(file_path: str):
     file_path = file_path.replace("\\", "/")
 
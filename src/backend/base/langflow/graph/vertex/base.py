@@ -4,6 +4,7 @@ import ast
 import asyncio
 import inspect
 import os
+import time
 import traceback
 import types
 from collections.abc import AsyncIterator, Callable, Iterator, Mapping
@@ -16,12 +17,14 @@ from loguru import logger
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.schema import INPUT_COMPONENTS, OUTPUT_COMPONENTS, InterfaceComponentTypes, ResultData
 from langflow.graph.utils import UnbuiltObject, UnbuiltResult, log_transaction
+from langflow.graph.vertex.utils import hash_build_inputs
 from langflow.interface import initialize
 from langflow.interface.listing import lazy_load_dict
 from langflow.schema.artifact import ArtifactType
 from langflow.schema.data import Data
 from langflow.schema.message import Message
 from langflow.schema.schema import INPUT_FIELD_NAME, OutputValue, build_output_logs
+from langflow.services.cache.utils import CacheMiss
 from langflow.services.deps import get_storage_service
 from langflow.utils.constants import DIRECT_TYPES
 from langflow.utils.schemas import ChatOutputResponse
@@ -35,6 +38,7 @@ if TYPE_CHECKING:
     from langflow.graph.edge.base import CycleEdge, Edge
     from langflow.graph.graph.base import Graph
     from langflow.graph.vertex.schema import NodeData
+    from langflow.services.chat.schema import GetCache, SetCache
     from langflow.services.tracing.schema import Log
 
 
@@ -46,6 +50,34 @@ class VertexStates(str, Enum):
     ERROR = "ERROR"
 
 
+VERTEX_RUN_STATE_ATTRIBUTES = (
+    "built",
+    "built_object",
+    "built_result",
+    "result",
+    "results",
+    "artifacts",
+    "artifacts_raw",
+    "artifacts_type",
+    "outputs_logs",
+    "logs",
+    "params",
+    "state",
+    "use_result",
+)
+
+
+CACHED_RESULT_ATTRIBUTES = (
+    "built_object",
+    "artifacts",
+    "artifacts_raw",
+    "artifacts_type",
+    "outputs_logs",
+    "logs",
+    "results",
+)
+
+
 class Vertex:
     def __init__(
         self,
@@ -130,6 +162,7 @@ class Vertex:
 
     def set_state(self, state: str) -> None:
         self.state = VertexStates[state]
+        self.graph.mark_vertex_changed(self.id)
         if self.state == VertexStates.INACTIVE and self.graph.in_degree_map[self.id] <= 1:
             # If the vertex is inactive and has only one in degree
             # it means that it is not a merge point in the graph
@@ -140,6 +173,15 @@ class Vertex:
     def is_active(self):
         return self.state == VertexStates.ACTIVE
 
+    def get_run_state(self) -> dict[str, Any]:
+        """Returns the attributes of the vertex that change when it is built or (in)activated."""
+        return {attribute: getattr(self, attribute) for attribute in VERTEX_RUN_STATE_ATTRIBUTES}
+
+    def set_run_state(self, run_state: dict[str, Any]) -> None:
+        """Restores the attributes returned by `get_run_state`."""
+        for attribute, value in run_state.items():
+            setattr(self, attribute, value)
+
     @property
     def avg_build_time(self):
         return sum(self.build_times) / len(self.build_times) if self.build_times else 0
@@ -177,11 +219,11 @@ class Vertex:
 
     @property
     def outgoing_edges(self) -> list[CycleEdge]:
-        return [edge for edge in self.edges if edge.source_id == self.id]
+        return self.graph.get_vertex_edges(self.id, is_target=False)
 
     @property
     def incoming_edges(self) -> list[CycleEdge]:
-        return [edge for edge in self.edges if edge.target_id == self.id]
+        return self.graph.get_vertex_edges(self.id, is_source=False)
 
     @property
     def edges_source_names(self) -> set[str | None]:
@@ -475,8 +517,14 @@ class Vertex:
         fallback_to_env_vars,
         user_id=None,
         event_manager: EventManager | None = None,
+        get_cache: GetCache | None = None,
+        set_cache: SetCache | None = None,
     ) -> None:
-        """Initiate the build process."""
+        """Initiate the build process.
+
+        When `get_cache` and `set_cache` are given and the component class sets `cache_results`, the results
+        are reused from previous builds with the same code, resolved params and selected outputs.
+        """
         logger.debug(f"Building {self.display_name}")
         await self._build_each_vertex_in_params_dict()
 
@@ -494,17 +542,60 @@ class Vertex:
                 self.custom_component.set_event_manager(event_manager)
             custom_params = initialize.loading.get_params(self.params)
 
-        await self._build_results(
-            custom_component=custom_component,
-            custom_params=custom_params,
-            fallback_to_env_vars=fallback_to_env_vars,
-            base_type=self.base_type,
-        )
+        result_cache_key = None
+        if get_cache is not None and set_cache is not None:
+            result_cache_key = self._get_result_cache_key(custom_component, user_id)
+        if result_cache_key is None or not await self._load_cached_results(
+            custom_component, result_cache_key, get_cache
+        ):
+            await self._build_results(
+                custom_component=custom_component,
+                custom_params=custom_params,
+                fallback_to_env_vars=fallback_to_env_vars,
+                base_type=self.base_type,
+            )
+            if result_cache_key is not None:
+                await self._cache_results(result_cache_key, set_cache)
 
         self._validate_built_object()
 
         self.built = True
 
+    def _get_result_cache_key(self, custom_component, user_id) -> str | None:
+        """Returns the key of the results of this build, or None if they should not be cached."""
+        if not getattr(type(custom_component), "cache_results", False):
+            return None
+        inputs_hash = hash_build_inputs(
+            {
+                "code": self.data["node"]["template"].get("code", {}).get("value"),
+                "params": self.params,
+                "outputs": sorted(str(edge.source_handle.name) for edge in self.outgoing_edges),
+                "user_id": str(user_id),
+            }
+        )
+        return None if inputs_hash is None else f"vertex_result:{inputs_hash}"
+
+    async def _load_cached_results(self, custom_component, key: str, get_cache: GetCache) -> bool:
+        """Restores the results of a previous build with the same key, returning whether they were found."""
+        cached = await get_cache(key=key)
+        if isinstance(cached, CacheMiss) or not isinstance(cached, dict):
+            return False
+        cached_results = cached["result"]
+        ttl = getattr(type(custom_component), "cache_results_ttl", None)
+        if ttl is not None and time.time() - cached_results["time"] > ttl:
+            return False
+        for attribute, value in cached_results["run_state"].items():
+            setattr(self, attribute, value)
+        logger.debug(f"Reusing cached results for {self.display_name}")
+        return True
+
+    async def _cache_results(self, key: str, set_cache: SetCache) -> None:
+        run_state = {attribute: getattr(self, attribute) for attribute in CACHED_RESULT_ATTRIBUTES}
+        try:
+            await set_cache(key=key, data={"time": time.time(), "run_state": run_state})
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"Could not cache the results of {self.display_name}")
+
     def extract_messages_from_artifacts(self, artifacts: dict[str, Any]) -> list[dict]:
         """Extracts messages from the artifacts.
 
@@ -830,7 +921,7 @@ class Vertex:
             return self.built_object
 
         # Get the requester edge
-        requester_edge = next((edge for edge in self.edges if edge.target_id == requester.id), None)
+        requester_edge = self.graph.get_edge(self.id, requester.id)
         # Return the result of the requester edge
         return (
             None
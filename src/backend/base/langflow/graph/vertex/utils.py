@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from pydantic import BaseModel, SecretStr
 
 if TYPE_CHECKING:
     from langflow.graph.vertex.base import Vertex
@@ -17,3 +21,32 @@ def build_clean_params(target: Vertex) -> dict:
         if isinstance(value, list):
             params[key] = [item for item in value if isinstance(item, str | int | bool | float | list | dict)]
     return params
+
+
+def _serialize_build_input(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, SecretStr):
+        # Secrets are part of the hash without being kept in the serialized inputs
+        return hashlib.sha256(value.get_secret_value().encode()).hexdigest()
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=str)
+    if isinstance(value, bytes):
+        return value.hex()
+    msg = f"Cannot hash a value of type {type(value).__name__}"
+    raise TypeError(msg)
+
+
+def hash_build_inputs(inputs: dict[str, Any]) -> str | None:
+    """Returns a stable hash of the inputs of a build.
+
+    Returns None if the inputs contain values that cannot be serialized reliably, e.g. functions or
+    clients, in which case the build should not be cached.
+    """
+    try:
+        serialized = orjson.dumps(
+            inputs, default=_serialize_build_input, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+    except TypeError:
+        return None
+    return hashlib.sha256(serialized).hexdigest()
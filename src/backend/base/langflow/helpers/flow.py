@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
+from cachetools import TTLCache
 from fastapi import HTTPException
 from pydantic.v1 import BaseModel, Field, create_model
 from sqlmodel import select
@@ -46,8 +47,12 @@ async def list_flows(*, user_id: str | None = None) -> list[Data]:
 async def load_flow(
     user_id: str, flow_id: str | None = None, flow_name: str | None = None, tweaks: dict | None = None
 ) -> Graph:
-    from langflow.graph.graph.base import Graph
-    from langflow.processing.process import process_tweaks
+    """Returns a graph of the flow, cloned from the compiled graph cache when the flow did not change since.
+
+    When the graph cache is enabled, only the update time of the flow is read when its graph is cached, so sub-flows
+    and flow tools that run many times do not load and compile the flow data on every run.
+    """
+    from langflow.processing.graph_cache import get_graph_cache
 
     if not flow_id and not flow_name:
         msg = "Flow ID or Flow Name is required"
@@ -58,22 +63,57 @@ async def load_flow(
             msg = f"Flow {flow_name} not found"
             raise ValueError(msg)
 
+    uuid_flow_id = UUID(flow_id) if isinstance(flow_id, str) else flow_id
+    graph_cache = get_graph_cache()
     async with session_scope() as session:
-        graph_data = flow.data if (flow := await session.get(Flow, flow_id)) else None
-    if not graph_data:
+        if graph_cache.max_size > 0:
+            updated_at = (await session.exec(select(Flow.updated_at).where(Flow.id == uuid_flow_id))).first()
+            # stream=None keeps the flow data as saved, as sub-flows are not run with the stream tweak
+            graph = graph_cache.get_cached_graph(
+                flow_id=str(flow_id), updated_at=updated_at, tweaks=tweaks, stream=None, user_id=user_id
+            )
+            if graph is not None:
+                return graph
+        row = (await session.exec(select(Flow.data, Flow.updated_at).where(Flow.id == uuid_flow_id))).first()
+    if row is None or not row[0]:
         msg = f"Flow {flow_id} not found"
         raise ValueError(msg)
-    if tweaks:
-        graph_data = process_tweaks(graph_data=graph_data, tweaks=tweaks)
-    return Graph.from_payload(graph_data, flow_id=flow_id, user_id=user_id)
+    graph_data, updated_at = row
+    return graph_cache.get_graph(
+        graph_data, flow_id=str(flow_id), updated_at=updated_at, tweaks=tweaks, stream=None, user_id=user_id
+    )
+
+
+_flow_ids_by_name: TTLCache | None = None
+
+
+def _get_flow_ids_by_name() -> TTLCache | None:
+    global _flow_ids_by_name  # noqa: PLW0603
+    ttl = get_settings_service().settings.flow_name_cache_ttl
+    if ttl <= 0:
+        return None
+    if _flow_ids_by_name is None:
+        _flow_ids_by_name = TTLCache(maxsize=1024, ttl=ttl)
+    return _flow_ids_by_name
 
 
 async def find_flow(flow_name: str, user_id: str) -> str | None:
+    """Returns the ID of the flow of the user with the given name.
+
+    The IDs are cached for `flow_name_cache_ttl` seconds, so renaming a flow may take that long to be seen.
+    """
+    flow_ids_by_name = _get_flow_ids_by_name()
+    key = (str(user_id), flow_name)
+    if flow_ids_by_name is not None and (flow_id := flow_ids_by_name.get(key)):
+        return flow_id
+
     async with session_scope() as session:
         uuid_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
-        stmt = select(Flow).where(Flow.name == flow_name).where(Flow.user_id == uuid_user_id)
-        flow = (await session.exec(stmt)).first()
-        return flow.id if flow else None
+        stmt = select(Flow.id).where(Flow.name == flow_name).where(Flow.user_id == uuid_user_id)
+        flow_id = (await session.exec(stmt)).first()
+    if flow_id and flow_ids_by_name is not None:
+        flow_ids_by_name[key] = flow_id
+    return flow_id
 
 
 async def run_flow(
@@ -9,7 +9,7 @@ import orjson
 from loguru import logger
 from pydantic import PydanticDeprecatedSince20
 
-from langflow.custom.eval import eval_custom_component_code
+from langflow.custom.eval import get_component_class
 from langflow.schema import Data
 from langflow.schema.artifact import get_artifact_type, post_process_raw
 from langflow.services.deps import get_tracing_service
@@ -36,7 +36,7 @@ def instantiate_class(
 
     custom_params = get_params(vertex.params)
     code = custom_params.pop("code")
-    class_object: type[CustomComponent | Component] = eval_custom_component_code(code)
+    class_object: type[CustomComponent | Component] = get_component_class(code)
     custom_component: CustomComponent | Component = class_object(
         _user_id=user_id,
         _parameters=custom_params,
@@ -3,7 +3,6 @@ import json
 import logging
 import os
 import sys
-from collections import deque
 from pathlib import Path
 from threading import Lock, Semaphore
 from typing import TypedDict
@@ -35,74 +34,131 @@ class SizedLogBuffer:
 
         The buffer can be overwritten by an env variable LANGFLOW_LOG_RETRIEVER_BUFFER_SIZE
         because the logger is initialized before the settings_service are loaded.
-        """
-        self.buffer: deque = deque()
 
+        The messages are kept in a ring of `max` slots, each holding a `(sequence, timestamp, message)` tuple, where
+        the sequence numbers the messages in the order they were written. Messages are written in timestamp order,
+        so readers binary search the ring by timestamp. Readers do not take the write lock: a slot overwritten during
+        a read no longer holds the expected sequence and is skipped, as that message has left the buffer.
+        """
         self._max_readers = max_readers
         self._wlock = Lock()
         self._rsemaphore = Semaphore(max_readers)
         self._max = 0
+        self._slots: list[tuple[int, int, str] | None] = []
+        self._next_sequence = 0
 
     def get_write_lock(self) -> Lock:
         return self._wlock
 
     def write(self, message: str) -> None:
-        record = json.loads(message)
-        log_entry = record["text"]
-        epoch = int(record["record"]["time"]["timestamp"] * 1000)
+        # Sinks receive loguru messages, which carry their record, serialized messages are parsed
+        record = getattr(message, "record", None)
+        if record is not None:
+            log_entry = str(message)
+            epoch = int(record["time"].timestamp() * 1000)
+        else:
+            serialized = json.loads(message)
+            log_entry = serialized["text"]
+            epoch = int(serialized["record"]["time"]["timestamp"] * 1000)
         with self._wlock:
-            if len(self.buffer) >= self.max:
-                for _ in range(len(self.buffer) - self.max + 1):
-                    self.buffer.popleft()
-            self.buffer.append((epoch, log_entry))
+            if len(self._slots) != self.max:
+                self._resize(self.max)
+            if not self._slots:
+                return
+            sequence = self._next_sequence
+            self._slots[sequence % len(self._slots)] = (sequence, epoch, log_entry)
+            # Incremented after the slot is written, so readers never see a sequence whose slot is not written
+            self._next_sequence = sequence + 1
+
+    def _resize(self, size: int) -> None:
+        slots, start, end = self._bounds()
+        entries = [entry for sequence in range(max(start, end - size), end) if (entry := self._entry(slots, sequence))]
+        new_slots: list[tuple[int, int, str] | None] = [None] * size
+        for entry in entries:
+            new_slots[entry[0] % size] = entry
+        self._slots = new_slots
+
+    def _bounds(self) -> tuple[list[tuple[int, int, str] | None], int, int]:
+        """Returns the slots and the range of sequences they hold."""
+        # Read the slots before the next sequence, which a writer only increments once the slot is written
+        slots = self._slots
+        end = self._next_sequence
+        return slots, max(end - len(slots), 0), end
+
+    @staticmethod
+    def _entry(slots: list[tuple[int, int, str] | None], sequence: int) -> tuple[int, int, str] | None:
+        """Returns the entry of a sequence, or None if it was overwritten."""
+        if not slots:
+            return None
+        entry = slots[sequence % len(slots)]
+        if entry is None or entry[0] != sequence:
+            return None
+        return entry
+
+    def _bisect(self, slots: list[tuple[int, int, str] | None], start: int, end: int, timestamp: int) -> int:
+        """Returns the first sequence in [start, end) with a timestamp at or after `timestamp`, or `end`."""
+        while start < end:
+            middle = (start + end) // 2
+            entry = self._entry(slots, middle)
+            # An overwritten entry is older than all the entries still in the buffer
+            if entry is None or entry[1] < timestamp:
+                start = middle + 1
+            else:
+                end = middle
+        return start
+
+    def _collect(self, slots: list[tuple[int, int, str] | None], start: int, end: int) -> dict[int, str]:
+        return {entry[1]: entry[2] for sequence in range(start, end) if (entry := self._entry(slots, sequence))}
+
+    @property
+    def buffer(self) -> list[tuple[int, str]]:
+        """A snapshot of the `(timestamp, message)` entries of the buffer, oldest first."""
+        slots, start, end = self._bounds()
+        return [(entry[1], entry[2]) for sequence in range(start, end) if (entry := self._entry(slots, sequence))]
+
+    @property
+    def sequence(self) -> int:
+        """The sequence number of the next message written to the buffer."""
+        return self._next_sequence
 
     def __len__(self) -> int:
-        return len(self.buffer)
+        return min(self._next_sequence, len(self._slots))
+
+    def get_after_sequence(self, sequence: int) -> tuple[list[tuple[int, str]], int]:
+        """Returns the `(timestamp, message)` entries written from `sequence` on and the next sequence to read."""
+        slots, start, end = self._bounds()
+        entries = [
+            (entry[1], entry[2])
+            for sequence_ in range(max(start, sequence), end)
+            if (entry := self._entry(slots, sequence_))
+        ]
+        return entries, end
 
     def get_after_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
-        rc = {}
-
         self._rsemaphore.acquire()
         try:
-            with self._wlock:
-                for ts, msg in self.buffer:
-                    if lines == 0:
-                        break
-                    if ts >= timestamp and lines > 0:
-                        rc[ts] = msg
-                        lines -= 1
+            slots, start, end = self._bounds()
+            first = self._bisect(slots, start, end, timestamp)
+            return self._collect(slots, first, min(first + lines, end))
         finally:
             self._rsemaphore.release()
 
-        return rc
-
     def get_before_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
         self._rsemaphore.acquire()
         try:
-            with self._wlock:
-                as_list = list(self.buffer)
-            max_index = -1
-            for i, (ts, _) in enumerate(as_list):
-                if ts >= timestamp:
-                    max_index = i
-                    break
-            if max_index == -1:
-                return self.get_last_n(lines)
-            rc = {}
-            start_from = max(max_index - lines, 0)
-            for i, (ts, msg) in enumerate(as_list):
-                if start_from <= i < max_index:
-                    rc[ts] = msg
-            return rc
+            slots, start, end = self._bounds()
+            first_after = self._bisect(slots, start, end, timestamp)
+            if first_after == end:
+                return self._collect(slots, max(end - lines, start), end)
+            return self._collect(slots, max(first_after - lines, start), first_after)
         finally:
             self._rsemaphore.release()
 
     def get_last_n(self, last_idx: int) -> dict[int, str]:
         self._rsemaphore.acquire()
         try:
-            with self._wlock:
-                as_list = list(self.buffer)
-            return dict(as_list[-last_idx:])
+            slots, start, end = self._bounds()
+            return self._collect(slots, max(end - last_idx, start) if last_idx > 0 else start, end)
         finally:
             self._rsemaphore.release()
 
@@ -259,7 +315,7 @@ def configure(
             logger.exception("Error setting up log file")
 
     if log_buffer.enabled():
-        logger.add(sink=log_buffer.write, format="{time} {level} {message}", serialize=True)
+        logger.add(sink=log_buffer.write, format="{time} {level} {message}")
 
     logger.debug(f"Logger set up with log level: {log_level}")
 
@@ -1,5 +1,6 @@
 import json
 from collections.abc import Sequence
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from langchain_core.chat_history import BaseChatMessageHistory
@@ -11,9 +12,27 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.schema.message import Message
 from langflow.services.database.models.message.model import MessageRead, MessageTable
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_message_sink_service, session_scope
 from langflow.utils.async_helpers import run_until_complete
 
+if TYPE_CHECKING:
+    from langflow.services.message_sink.service import MessageSinkService
+
+
+def _get_message_sink() -> "MessageSinkService | None":
+    message_sink = get_message_sink_service()
+    return message_sink if message_sink.enabled else None
+
+
+async def aflush_messages(session_id: str | UUID | None = None) -> None:
+    """Writes the messages that are waiting to be written to the database, if `message_write_behind` is enabled.
+
+    Args:
+        session_id (Optional[str | UUID]): If set, only the messages of this session are written right away.
+    """
+    if (message_sink := _get_message_sink()) is not None:
+        await message_sink.flush(session_id)
+
 
 def _get_variable_query(
     sender: str | None = None,
@@ -92,6 +111,7 @@ async def aget_messages(
     Returns:
         List[Data]: A list of Data objects representing the retrieved messages.
     """
+    await aflush_messages(session_id)
     async with session_scope() as session:
         stmt = _get_variable_query(sender, sender_name, session_id, order_by, order, flow_id, limit)
         messages = await session.exec(stmt)
@@ -118,9 +138,14 @@ async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID |
 
     try:
         messages_models = [MessageTable.from_message(msg, flow_id=flow_id) for msg in messages]
-        async with session_scope() as session:
-            messages_models = await aadd_messagetables(messages_models, session)
-        return [await Message.create(**message.model_dump()) for message in messages_models]
+        if (message_sink := _get_message_sink()) is not None:
+            for message_model in messages_models:
+                message_sink.add(message_model)
+            stored_messages = [_to_message_read(message_model) for message_model in messages_models]
+        else:
+            async with session_scope() as session:
+                stored_messages = await aadd_messagetables(messages_models, session)
+        return [await Message.create(**message.model_dump()) for message in stored_messages]
     except Exception as e:
         logger.exception(e)
         raise
@@ -130,22 +155,44 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
     if not isinstance(messages, list):
         messages = [messages]
 
+    message_sink = _get_message_sink()
     async with session_scope() as session:
-        updated_messages: list[MessageTable] = []
+        updated_messages: list[MessageRead] = []
         for message in messages:
+            if message_sink is not None:
+                if (pending_msg := message_sink.get_pending(message.id)) is not None:
+                    # The message is not written yet, so the update is written with it
+                    updated_messages.append(_to_message_read(_update_messagetable(pending_msg, message)))
+                    continue
+                # The message may be part of a batch being written
+                await message_sink.flush(message.session_id)
             msg = await session.get(MessageTable, message.id)
             if msg:
-                msg = msg.sqlmodel_update(message.model_dump(exclude_unset=True, exclude_none=True))
-                # Convert flow_id to UUID if it's a string preventing error when saving to database
-                if msg.flow_id and isinstance(msg.flow_id, str):
-                    msg.flow_id = UUID(msg.flow_id)
+                msg = _update_messagetable(msg, message)
                 session.add(msg)
                 await session.commit()
                 await session.refresh(msg)
-                updated_messages.append(msg)
+                updated_messages.append(MessageRead.model_validate(msg, from_attributes=True))
             else:
                 logger.warning(f"Message with id {message.id} not found")
-        return [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
+        return updated_messages
+
+
+def _update_messagetable(msg: MessageTable, message: Message) -> MessageTable:
+    msg = msg.sqlmodel_update(message.model_dump(exclude_unset=True, exclude_none=True))
+    # Convert flow_id to UUID if it's a string preventing error when saving to database
+    if msg.flow_id and isinstance(msg.flow_id, str):
+        msg.flow_id = UUID(msg.flow_id)
+    return msg
+
+
+def _to_message_read(msg: MessageTable) -> MessageRead:
+    """Builds the MessageRead of a message that is not written yet, without changing it."""
+    data = {name: getattr(msg, name) for name in MessageRead.model_fields}
+    data["properties"] = json.loads(msg.properties) if isinstance(msg.properties, str) else msg.properties
+    data["content_blocks"] = [json.loads(j) if isinstance(j, str) else j for j in msg.content_blocks]
+    data["category"] = msg.category or ""
+    return MessageRead.model_validate(data)
 
 
 async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession):
@@ -186,6 +233,9 @@ async def adelete_messages(session_id: str) -> None:
     Args:
         session_id (str): The session ID associated with the messages to delete.
     """
+    if (message_sink := _get_message_sink()) is not None:
+        message_sink.discard(session_id=session_id)
+    await aflush_messages(session_id)
     async with session_scope() as session:
         stmt = (
             delete(MessageTable)
@@ -201,6 +251,9 @@ async def delete_message(id_: str) -> None:
     Args:
         id_ (str): The ID of the message to delete.
     """
+    if (message_sink := _get_message_sink()) is not None:
+        message_sink.discard(message_id=id_)
+    await aflush_messages()
     async with session_scope() as session:
         message = await session.get(MessageTable, id_)
         if message:
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from cachetools import LRUCache
+
+from langflow.graph.graph.base import Graph
+from langflow.processing.process import process_tweaks
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from langflow.schema.graph import Tweaks
+
+
+def hash_tweaks(tweaks: Tweaks | dict[str, Any] | None) -> str:
+    """Returns a stable hash of the tweaks so they can be used as part of a cache key."""
+    if tweaks is None:
+        tweaks = {}
+    elif not isinstance(tweaks, dict):
+        tweaks = tweaks.model_dump()
+    return hashlib.sha256(orjson.dumps(tweaks, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+
+
+class GraphCache:
+    """An LRU cache of compiled graphs keyed by flow id, flow version and tweaks.
+
+    The cached graphs are used as templates and are never run. Every call to `get_graph`
+    returns a clone of the template, so each run gets its own vertices and run state.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._cache: LRUCache = LRUCache(maxsize=max(max_size, 1))
+        self._lock = threading.Lock()
+
+    def get_graph(
+        self,
+        graph_data: dict,
+        *,
+        flow_id: str,
+        updated_at: datetime | None,
+        tweaks: Tweaks | dict[str, Any] | None = None,
+        stream: bool | None = False,
+        flow_name: str | None = None,
+        user_id: str | None = None,
+    ) -> Graph:
+        """Returns a graph ready to be run, building the template if it is not cached yet.
+
+        Args:
+            graph_data: The flow data. It is only used when the graph is not cached.
+            flow_id: The ID of the flow.
+            updated_at: The last time the flow was updated. Flows without it are never cached.
+            tweaks: The tweaks to apply to the flow.
+            stream: Whether the flow should stream its results. None keeps the stream setting of the flow data.
+            flow_name: The flow name.
+            user_id: The user ID of the run.
+
+        Returns:
+            Graph: A graph that is not shared with any other run.
+        """
+        if self.max_size <= 0 or updated_at is None:
+            return self.build_graph(
+                graph_data, flow_id=flow_id, tweaks=tweaks, stream=stream, flow_name=flow_name, user_id=user_id
+            )
+
+        graph = self.get_cached_graph(
+            flow_id=flow_id, updated_at=updated_at, tweaks=tweaks, stream=stream, user_id=user_id
+        )
+        if graph is not None:
+            return graph
+        template = self.build_graph(
+            graph_data, flow_id=flow_id, tweaks=tweaks, stream=stream, flow_name=flow_name, user_id=user_id
+        )
+        with self._lock:
+            self._cache[self._key(flow_id, updated_at, tweaks, stream)] = template
+        return template.clone(user_id=user_id)
+
+    def get_cached_graph(
+        self,
+        *,
+        flow_id: str,
+        updated_at: datetime | None,
+        tweaks: Tweaks | dict[str, Any] | None = None,
+        stream: bool | None = False,
+        user_id: str | None = None,
+    ) -> Graph | None:
+        """Returns a clone of the cached graph, or None if it is not cached, without needing the flow data."""
+        if self.max_size <= 0 or updated_at is None:
+            return None
+        with self._lock:
+            template = self._cache.get(self._key(flow_id, updated_at, tweaks, stream))
+        return template.clone(user_id=user_id) if template is not None else None
+
+    @staticmethod
+    def _key(
+        flow_id: str, updated_at: datetime, tweaks: Tweaks | dict[str, Any] | None, stream: bool | None
+    ) -> tuple[str, str, str, bool | None]:
+        return (str(flow_id), updated_at.isoformat(), hash_tweaks(tweaks), stream)
+
+    @staticmethod
+    def build_graph(
+        graph_data: dict,
+        *,
+        flow_id: str,
+        tweaks: Tweaks | dict[str, Any] | None = None,
+        stream: bool | None = False,
+        flow_name: str | None = None,
+        user_id: str | None = None,
+    ) -> Graph:
+        if stream is not None or tweaks:
+            graph_data = process_tweaks(graph_data.copy(), tweaks or {}, stream=bool(stream))
+        return Graph.from_payload(graph_data, flow_id=flow_id, flow_name=flow_name, user_id=user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_graph_cache: GraphCache | None = None
+
+
+def get_graph_cache() -> GraphCache:
+    """Returns the process wide graph cache, sized by the `graph_cache_size` setting."""
+    global _graph_cache  # noqa: PLW0603
+    if _graph_cache is None:
+        _graph_cache = GraphCache(max_size=get_settings_service().settings.graph_cache_size)
+    return _graph_cache
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from cachetools import TTLCache
+
+from langflow.processing.graph_cache import hash_tweaks
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from datetime import datetime
+
+    from langflow.api.v1.schemas import SimplifiedAPIRequest
+
+
+def run_fingerprint(
+    input_request: SimplifiedAPIRequest,
+    *,
+    flow_id: str,
+    updated_at: datetime | None,
+    user_id: str | None = None,
+) -> str:
+    """Returns a key that is the same for runs of the same flow version with the same inputs and tweaks."""
+    fingerprint = {
+        "flow_id": flow_id,
+        "updated_at": updated_at.isoformat() if updated_at else None,
+        "user_id": user_id,
+        "input_value": input_request.input_value,
+        "input_type": input_request.input_type,
+        "output_type": input_request.output_type,
+        "output_component": input_request.output_component,
+        "tweaks": hash_tweaks(input_request.tweaks),
+    }
+    return hashlib.sha256(orjson.dumps(fingerprint, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+
+
+class RunCoalescer:
+    """Shares a single execution between identical concurrent runs.
+
+    The first run with a given key starts the execution, and the runs with the same key that arrive
+    while it is in flight wait for it and receive the same result. The execution runs in its own task,
+    so a caller that is cancelled does not cancel it for the others. When `result_ttl` is set, successful
+    results are also kept for that many seconds and returned to later runs with the same key.
+    """
+
+    def __init__(self, result_ttl: float = 0, max_results: int = 1000) -> None:
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self._results: TTLCache | None = TTLCache(maxsize=max_results, ttl=result_ttl) if result_ttl > 0 else None
+
+    async def run(self, key: str, execute: Callable[[], Awaitable[Any]]) -> Any:
+        """Returns the result of `execute`, sharing it with the other runs with the same key.
+
+        Args:
+            key: The fingerprint of the run, e.g. created with `run_fingerprint`.
+            execute: A callable that starts the execution. It is not called if an execution with the
+                same key is in flight or its result is cached.
+
+        Returns:
+            Any: The result of the execution.
+        """
+        if self._results is not None and key in self._results:
+            return self._results[key]
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(execute())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._on_done(key, done))
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self._results is not None:
+            self._results[key] = task.result()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def clear(self) -> None:
+        if self._results is not None:
+            self._results.clear()
+
+
+_run_coalescer: RunCoalescer | None = None
+
+
+def get_run_coalescer() -> RunCoalescer | None:
+    """Returns the process wide run coalescer, or None if `run_coalescing` is disabled."""
+    global _run_coalescer  # noqa: PLW0603
+    settings = get_settings_service().settings
+    if not settings.run_coalescing:
+        return None
+    if _run_coalescer is None:
+        _run_coalescer = RunCoalescer(result_ttl=settings.run_result_cache_ttl)
+    return _run_coalescer
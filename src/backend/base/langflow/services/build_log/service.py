@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from langflow.services.write_behind import WriteBehindService
+
+if TYPE_CHECKING:
+    from sqlmodel import SQLModel
+
+    from langflow.services.settings.service import SettingsService
+
+
+class BuildLogService(WriteBehindService):
+    """Writes the transactions and vertex builds logged by flow runs to the database in batches.
+
+    Rows are buffered in memory and inserted together, in a single transaction and without refreshing them,
+    after `build_log_flush_interval` ms or as soon as `build_log_batch_size` rows are buffered. When
+    `build_log_max_pending` rows are buffered or being written, logging waits for a write to finish and
+    drops the row if the database still cannot keep up, so monitoring never slows down the flows it monitors.
+    """
+
+    name = "build_log_service"
+    row_name = "build log rows"
+
+    def __init__(self, settings_service: SettingsService):
+        settings = settings_service.settings
+        super().__init__(
+            flush_interval=settings.build_log_flush_interval / 1000, batch_size=settings.build_log_batch_size
+        )
+        self.enabled = settings.build_log_batching
+        self.max_pending = max(settings.build_log_max_pending, self.batch_size)
+        self.dropped = 0
+        self._pending: list[SQLModel] = []
+
+    async def log(self, row: SQLModel) -> None:
+        """Buffers a row to be inserted in the next batch, or drops it if the buffer is full."""
+        if len(self._pending) + self._writing >= self.max_pending:
+            # Backpressure: give the writes in flight a chance to finish before dropping the row
+            writes = self._get_writes()
+            if writes:
+                await asyncio.wait(writes, timeout=self.flush_interval, return_when=asyncio.FIRST_COMPLETED)
+            if len(self._pending) + self._writing >= self.max_pending:
+                self._drop(row)
+                return
+        self._pending.append(row)
+        if len(self._pending) >= self.batch_size:
+            self._start_write(self._take())
+        else:
+            self._schedule_flush()
+
+    def _take(self) -> list[SQLModel]:
+        batch, self._pending = self._pending, []
+        return batch
+
+    def _drop(self, row: SQLModel) -> None:
+        self.dropped += 1
+        if self.dropped == 1 or self.dropped % 1000 == 0:
+            logger.warning(
+                f"The build log is full, dropped {type(row).__name__} rows. Total rows dropped: {self.dropped}"
+            )
@@ -36,7 +36,11 @@ class CacheServiceFactory(ServiceFactory):
             raise ConnectionError(msg)
 
         if settings_service.settings.cache_type == "memory":
-            return ThreadingInMemoryCache(expiration_time=settings_service.settings.cache_expire)
+            return ThreadingInMemoryCache(
+                expiration_time=settings_service.settings.cache_expire,
+                max_size_bytes=settings_service.settings.cache_max_size_bytes or None,
+                num_shards=settings_service.settings.cache_shards,
+            )
         if settings_service.settings.cache_type == "async":
             return AsyncInMemoryCache(expiration_time=settings_service.settings.cache_expire)
         if settings_service.settings.cache_type == "disk":
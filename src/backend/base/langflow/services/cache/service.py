@@ -1,4 +1,6 @@
 import asyncio
+import contextlib
+import itertools
 import pickle
 import threading
 import time
@@ -9,19 +11,35 @@ from loguru import logger
 from typing_extensions import override
 
 from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType, CacheService, LockType
-from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.cache.utils import CACHE_MISS, get_approximate_size
+
+
+class _CacheShard:
+    """A slice of a ThreadingInMemoryCache with its own lock, size and counters."""
+
+    def __init__(self) -> None:
+        self.items: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
 
 class ThreadingInMemoryCache(CacheService, Generic[LockType]):
-    """A simple in-memory cache using an OrderedDict.
+    """A sharded in-memory cache using an OrderedDict per shard.
 
-    This cache supports setting a maximum size and expiration time for cached items.
-    When the cache is full, it uses a Least Recently Used (LRU) eviction policy.
-    Thread-safe using a threading Lock.
+    This cache supports setting a maximum size, a maximum approximate size in bytes and an expiration
+    time for cached items. Keys are spread over shards that have their own lock, so operations on keys
+    in different shards do not wait for each other. The bounds apply to the whole cache: when it is full,
+    the least recently used items of all the shards are evicted (LRU).
+    Thread-safe using a threading Lock per shard.
 
     Attributes:
         max_size (int, optional): Maximum number of items to store in the cache.
+        max_size_bytes (int, optional): Maximum approximate size in bytes of the items stored in the cache.
         expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+        num_shards (int, optional): Number of shards the keys are spread over. Default is 16.
 
     Example:
         cache = InMemoryCache(max_size=3, expiration_time=5)
@@ -34,19 +52,37 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         # getting cache values
         a = cache.get("a")
         b = cache["b"]
+
+        # getting cache values from a coroutine
+        c = await cache.aget("c")
     """
 
-    def __init__(self, max_size=None, expiration_time=60 * 60) -> None:
+    def __init__(self, max_size=None, expiration_time=60 * 60, max_size_bytes=None, num_shards=16) -> None:
         """Initialize a new InMemoryCache instance.
 
         Args:
             max_size (int, optional): Maximum number of items to store in the cache.
             expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+            max_size_bytes (int, optional): Maximum approximate size in bytes of the items stored in the cache.
+            num_shards (int, optional): Number of shards the keys are spread over. Default is 16.
         """
-        self._cache: OrderedDict = OrderedDict()
-        self._lock = threading.RLock()
         self.max_size = max_size
+        self.max_size_bytes = max_size_bytes
         self.expiration_time = expiration_time
+        self.num_shards = max(num_shards, 1)
+        self._shards = [_CacheShard() for _ in range(self.num_shards)]
+        # The number of items and size of the whole cache, updated with the shard lock held
+        self._length = 0
+        self._size_bytes = 0
+        self._totals_lock = threading.Lock()
+        # Orders the uses of the items across shards, to find the least recently used one
+        self._clock = itertools.count()
+
+    def _get_shard(self, key) -> _CacheShard:
+        return self._shards[hash(key) % self.num_shards]
+
+    def _get_size(self, value) -> int:
+        return get_approximate_size(value) if self.max_size_bytes else 0
 
     def get(self, key, lock: Union[threading.Lock, None] = None):  # noqa: UP007
         """Retrieve an item from the cache.
@@ -58,40 +94,81 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         Returns:
             The value associated with the key, or CACHE_MISS if the key is not found or the item has expired.
         """
-        with lock or self._lock:
-            return self._get_without_lock(key)
+        shard = self._get_shard(key)
+        with lock or contextlib.nullcontext(), shard.lock:
+            return self._get_from_shard(shard, key)
 
-    def _get_without_lock(self, key):
-        """Retrieve an item from the cache without acquiring the lock."""
-        if item := self._cache.get(key):
+    def _get_from_shard(self, shard: _CacheShard, key):
+        """Retrieve an item from a shard. The shard lock must be held."""
+        if item := shard.items.get(key):
             if self.expiration_time is None or time.time() - item["time"] < self.expiration_time:
                 # Move the key to the end to make it recently used
-                self._cache.move_to_end(key)
+                shard.items.move_to_end(key)
+                item["used"] = next(self._clock)
+                shard.hits += 1
                 # Check if the value is pickled
                 return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
-            self.delete(key)
+            self._delete_from_shard(shard, key)
+        shard.misses += 1
         return CACHE_MISS
 
     def set(self, key, value, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Add an item to the cache.
 
-        If the cache is full, the least recently used item is evicted.
+        If the cache is full, its least recently used items are evicted.
 
         Args:
             key: The key of the item.
             value: The value to cache.
             lock: A lock to use for the operation.
         """
-        with lock or self._lock:
-            if key in self._cache:
-                # Remove existing key before re-inserting to update order
-                self.delete(key)
-            elif self.max_size and len(self._cache) >= self.max_size:
-                # Remove least recently used item
-                self._cache.popitem(last=False)
-            # pickle locally to mimic Redis
+        size = self._get_size(value)
+        shard = self._get_shard(key)
+        with lock or contextlib.nullcontext():
+            with shard.lock:
+                self._set_in_shard(shard, key, value, size)
+            self._evict(key)
+
+    def _set_in_shard(self, shard: _CacheShard, key, value, size: int) -> None:
+        """Add an item of the given approximate size to a shard. The shard lock must be held."""
+        # Remove existing key before re-inserting to update order
+        self._delete_from_shard(shard, key)
+        shard.items[key] = {"value": value, "time": time.time(), "size": size, "used": next(self._clock)}
+        shard.size_bytes += size
+        self._update_totals(1, size)
+
+    def _is_full(self) -> bool:
+        return bool(
+            (self.max_size and self._length > self.max_size)
+            or (self.max_size_bytes and self._size_bytes > self.max_size_bytes)
+        )
 
-            self._cache[key] = {"value": value, "time": time.time()}
+    def _evict(self, added_key) -> None:
+        """Evict the least recently used items of all the shards until the cache is within its bounds.
+
+        The shard locks are taken one at a time, after the lock of the shard of the added item was released,
+        so threads evicting at the same time never wait for each other's locks. The item just added is never
+        evicted, even if it is larger than the cache.
+        """
+        while self._is_full():
+            # The items of a shard are ordered by use, so the least recently used item is the first of a shard
+            candidates = []
+            for shard in self._shards:
+                with contextlib.suppress(StopIteration, RuntimeError):
+                    key, item = next(iter(shard.items.items()))
+                    if key != added_key:
+                        candidates.append((item["used"], shard))
+            if not candidates:
+                return
+            _, shard = min(candidates, key=lambda candidate: candidate[0])
+            with shard.lock:
+                if not shard.items or not self._is_full():
+                    continue
+                key = next(iter(shard.items))
+                if key == added_key:
+                    continue
+                self._delete_from_shard(shard, key)
+                shard.evictions += 1
 
     def upsert(self, key, value, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Inserts or updates a value in the cache.
@@ -103,13 +180,25 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
             value: The value to insert or update.
             lock: A lock to use for the operation.
         """
-        with lock or self._lock:
-            existing_value = self._get_without_lock(key)
-            if existing_value is not CACHE_MISS and isinstance(existing_value, dict) and isinstance(value, dict):
-                existing_value.update(value)
-                value = existing_value
+        size = self._get_size(value)
+        shard = self._get_shard(key)
+        with lock or contextlib.nullcontext():
+            with shard.lock:
+                self._upsert_in_shard(shard, key, value, size)
+            self._evict(key)
+
+    def _upsert_in_shard(self, shard: _CacheShard, key, value, size: int) -> None:
+        """Insert or update an item of a shard. The shard lock must be held."""
+        existing_item = shard.items.get(key)
+        existing_value = self._get_from_shard(shard, key)
+        if existing_value is not CACHE_MISS and isinstance(existing_value, dict) and isinstance(value, dict):
+            existing_value.update(value)
+            value = existing_value
+            # The merged value is not measured again under the lock. Its size is approximated by the larger of
+            # the two, so updating the same keys again and again does not grow it
+            size = max(size, existing_item["size"])
 
-            self.set(key, value)
+        self._set_in_shard(shard, key, value, size)
 
     def get_or_set(self, key, value, lock: Union[threading.Lock, None] = None):  # noqa: UP007
         """Retrieve an item from the cache.
@@ -124,24 +213,103 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         Returns:
             The cached value associated with the key.
         """
-        with lock or self._lock:
-            if key in self._cache:
-                return self.get(key)
-            self.set(key, value)
+        size = self._get_size(value)
+        shard = self._get_shard(key)
+        with lock or contextlib.nullcontext():
+            with shard.lock:
+                if key in shard.items:
+                    return self._get_from_shard(shard, key)
+                self._set_in_shard(shard, key, value, size)
+            self._evict(key)
             return value
 
     def delete(self, key, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
-        with lock or self._lock:
-            self._cache.pop(key, None)
+        shard = self._get_shard(key)
+        with lock or contextlib.nullcontext(), shard.lock:
+            self._delete_from_shard(shard, key)
+
+    def _delete_from_shard(self, shard: _CacheShard, key) -> None:
+        """Remove an item from a shard. The shard lock must be held."""
+        if (item := shard.items.pop(key, None)) is not None:
+            shard.size_bytes -= item["size"]
+            self._update_totals(-1, -item["size"])
+
+    def _update_totals(self, items: int, size_bytes: int) -> None:
+        with self._totals_lock:
+            self._length += items
+            self._size_bytes += size_bytes
 
     def clear(self, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Clear all items from the cache."""
-        with lock or self._lock:
-            self._cache.clear()
+        with lock or contextlib.nullcontext():
+            for shard in self._shards:
+                with shard.lock:
+                    self._update_totals(-len(shard.items), -shard.size_bytes)
+                    shard.items.clear()
+                    shard.size_bytes = 0
+
+    async def aget(self, key):
+        """Retrieve an item from the cache without leaving the event loop when its shard is not busy."""
+        return await self._run_in_shard(key, self._get_from_shard, key)
+
+    async def aset(self, key, value) -> None:
+        """Add an item to the cache without leaving the event loop when its shard is not busy."""
+        size = await self._aget_size(value)
+        await self._run_in_shard(key, self._set_in_shard, key, value, size)
+        await self._aevict(key)
+
+    async def aupsert(self, key, value) -> None:
+        """Insert or update an item without leaving the event loop when its shard is not busy."""
+        size = await self._aget_size(value)
+        await self._run_in_shard(key, self._upsert_in_shard, key, value, size)
+        await self._aevict(key)
+
+    async def _aevict(self, added_key) -> None:
+        # Evicting waits for the locks of other shards, so it does not run in the event loop
+        if self._is_full():
+            await asyncio.to_thread(self._evict, added_key)
+
+    async def _aget_size(self, value) -> int:
+        # Measuring a value can walk thousands of objects, so it does not run in the event loop
+        return await asyncio.to_thread(get_approximate_size, value) if self.max_size_bytes else 0
+
+    async def adelete(self, key) -> None:
+        """Remove an item from the cache without leaving the event loop when its shard is not busy."""
+        await self._run_in_shard(key, self._delete_from_shard, key)
+
+    async def _run_in_shard(self, key, operation, *args):
+        """Run an operation on the shard of a key.
+
+        In-memory operations are fast, so the operation runs in the event loop when the shard lock is free
+        and only moves to a thread when it would have to wait for another thread to release the lock.
+        """
+        shard = self._get_shard(key)
+        if shard.lock.acquire(blocking=False):
+            try:
+                return operation(shard, *args)
+            finally:
+                shard.lock.release()
+
+        def run_locked():
+            with shard.lock:
+                return operation(shard, *args)
+
+        return await asyncio.to_thread(run_locked)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return the number of items, approximate size in bytes, hits, misses and evictions of the cache."""
+        return {
+            "items": len(self),
+            "size_bytes": self._size_bytes,
+            "hits": sum(shard.hits for shard in self._shards),
+            "misses": sum(shard.misses for shard in self._shards),
+            "evictions": sum(shard.evictions for shard in self._shards),
+        }
 
     def contains(self, key) -> bool:
         """Check if the key is in the cache."""
-        return key in self._cache
+        return key in self._get_shard(key).items
 
     def __contains__(self, key) -> bool:
         """Check if the key is in the cache."""
@@ -161,11 +329,14 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
 
     def __len__(self) -> int:
         """Return the number of items in the cache."""
-        return len(self._cache)
+        return self._length
 
     def __repr__(self) -> str:
         """Return a string representation of the InMemoryCache instance."""
-        return f"InMemoryCache(max_size={self.max_size}, expiration_time={self.expiration_time})"
+        return (
+            f"InMemoryCache(max_size={self.max_size}, max_size_bytes={self.max_size_bytes}, "
+            f"expiration_time={self.expiration_time}, num_shards={self.num_shards})"
+        )
 
 
 class RedisCache(AsyncBaseCacheService, Generic[LockType]):
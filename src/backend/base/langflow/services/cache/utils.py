@@ -1,7 +1,9 @@
 import base64
 import contextlib
 import hashlib
+import sys
 import tempfile
+from collections import deque
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -26,6 +28,33 @@ class CacheMiss:
         return False
 
 
+def get_approximate_size(obj: Any, max_objects: int = 10_000) -> int:
+    """Returns an approximation of the memory used by an object and the objects it references.
+
+    Containers and object attributes are followed until `max_objects` objects have been visited,
+    so the result is a lower bound for very large objects.
+    """
+    size = 0
+    seen: set[int] = set()
+    stack = [obj]
+    while stack and len(seen) < max_objects:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current, 0)
+        if isinstance(current, str | bytes | bytearray | int | float | bool) or current is None:
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, list | tuple | set | frozenset | deque):
+            stack.extend(current)
+        elif hasattr(current, "__dict__") and not isinstance(current, type):
+            stack.append(vars(current))
+    return size
+
+
 def create_cache_folder(func):
     def wrapper(*args, **kwargs):
         # Get the destination folder
@@ -1,11 +1,19 @@
+from __future__ import annotations
+
 import asyncio
 from collections import defaultdict
 from threading import RLock
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
-from langflow.services.deps import get_cache_service
+from langflow.services.cache.service import ThreadingInMemoryCache
+from langflow.services.cache.utils import CacheMiss
+from langflow.services.deps import get_cache_service, get_settings_service
+
+if TYPE_CHECKING:
+    from langflow.graph.graph.base import Graph
 
 
 class ChatService(Service):
@@ -17,6 +25,8 @@ class ChatService(Service):
         self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
+        self.graph_state_snapshot_interval = get_settings_service().settings.graph_state_snapshot_interval
+        self._graph_delta_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
         """Set the cache for a client.
@@ -36,6 +46,9 @@ class ChatService(Service):
         if isinstance(self.cache_service, AsyncBaseCacheService):
             await self.cache_service.upsert(str(key), result_dict, lock=lock or self.async_cache_locks[key])
             return await self.cache_service.contains(key)
+        if isinstance(self.cache_service, ThreadingInMemoryCache):
+            await self.cache_service.aupsert(str(key), result_dict)
+            return key in self.cache_service
         await asyncio.to_thread(
             self.cache_service.upsert, str(key), result_dict, lock=lock or self._sync_cache_locks[key]
         )
@@ -53,6 +66,8 @@ class ChatService(Service):
         """
         if isinstance(self.cache_service, AsyncBaseCacheService):
             return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
+        if isinstance(self.cache_service, ThreadingInMemoryCache):
+            return await self.cache_service.aget(key)
         return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
 
     async def clear_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
@@ -64,4 +79,99 @@ class ChatService(Service):
         """
         if isinstance(self.cache_service, AsyncBaseCacheService):
             return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
+        if isinstance(self.cache_service, ThreadingInMemoryCache):
+            return await self.cache_service.adelete(key)
         return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
+
+    async def cache_graph(
+        self, key: str, graph: Graph, *, snapshot: bool = False, lock: asyncio.Lock | None = None
+    ) -> bool:
+        """Persist the run state of a graph.
+
+        When `graph_state_snapshot_interval` is set, only the run state that changed since the previous
+        call is written, and the whole graph is written again once that many deltas have been stored. Each
+        snapshot starts a new generation of deltas, recorded in the cache so all the processes sharing it agree.
+
+        Args:
+            key (str): The cache key.
+            graph (Graph): The graph being built.
+            snapshot (bool, optional): Whether to write the whole graph, e.g. for a graph that was just built.
+                Defaults to False.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
+
+        Returns:
+            bool: True if the cache was set successfully, False otherwise.
+        """
+        if self.graph_state_snapshot_interval <= 0:
+            return await self.set_cache(key, graph, lock=lock)
+        # The vertices of a build are cached by concurrent tasks, each reading and then incrementing the count
+        async with self._graph_delta_locks[key]:
+            delta = graph.pop_state_delta()
+            deltas = await self._get_graph_deltas(key)
+            if snapshot or deltas is None or deltas["count"] >= self.graph_state_snapshot_interval:
+                # The new generation is written before the snapshot, so a reader never replays the deltas of the
+                # previous snapshot on the new one, even from another process sharing the cache
+                await self.set_cache(self._graph_deltas_key(key), {"generation": uuid4().hex, "count": 0})
+                result = await self.set_cache(key, graph, lock=lock)
+                if deltas is not None:
+                    await self._clear_graph_deltas(key, deltas)
+                return result
+            await self.set_cache(self._graph_delta_key(key, deltas["generation"], deltas["count"]), delta)
+            return await self.set_cache(self._graph_deltas_key(key), {**deltas, "count": deltas["count"] + 1})
+
+    async def get_cached_graph(self, key: str, lock: asyncio.Lock | None = None) -> Any:
+        """Get a graph stored with `cache_graph`, replaying the deltas written after its last snapshot.
+
+        Args:
+            key (str): The cache key.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
+
+        Returns:
+            Any: The cached data, in the same format returned by `get_cache`.
+        """
+        cache = await self.get_cache(key, lock=lock)
+        if self.graph_state_snapshot_interval <= 0 or isinstance(cache, CacheMiss):
+            return cache
+        deltas = await self._get_graph_deltas(key)
+        if deltas is None:
+            return cache
+        graph = cache["result"]
+        for delta_index in range(deltas["count"]):
+            delta = await self.get_cache(self._graph_delta_key(key, deltas["generation"], delta_index))
+            if isinstance(delta, CacheMiss):
+                break
+            graph.apply_state_delta(delta["result"])
+        return cache
+
+    async def clear_graph_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
+        """Clear a graph stored with `cache_graph` and its deltas.
+
+        Args:
+            key (str): The cache key.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
+        """
+        async with self._graph_delta_locks[key]:
+            deltas = await self._get_graph_deltas(key)
+            if deltas is not None:
+                await self._clear_graph_deltas(key, deltas)
+                await self.clear_cache(self._graph_deltas_key(key))
+            await self.clear_cache(key, lock=lock)
+        if not self._graph_delta_locks[key].locked():
+            del self._graph_delta_locks[key]
+
+    async def _get_graph_deltas(self, key: str) -> dict[str, Any] | None:
+        # The generation of the snapshot and its number of deltas are kept in the cache, next to the snapshot
+        deltas = await self.get_cache(self._graph_deltas_key(key))
+        return None if isinstance(deltas, CacheMiss) else deltas["result"]
+
+    async def _clear_graph_deltas(self, key: str, deltas: dict[str, Any]) -> None:
+        for delta_index in range(deltas["count"]):
+            await self.clear_cache(self._graph_delta_key(key, deltas["generation"], delta_index))
+
+    @staticmethod
+    def _graph_deltas_key(key: str) -> str:
+        return f"{key}:deltas"
+
+    @staticmethod
+    def _graph_delta_key(key: str, generation: str, delta_index: int) -> str:
+        return f"{key}:delta:{generation}:{delta_index}"
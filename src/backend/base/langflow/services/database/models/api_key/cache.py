@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import hashlib
+import threading
+from typing import TYPE_CHECKING
+
+from cachetools import TTLCache
+from loguru import logger
+from sqlalchemy import case, update
+from sqlmodel import col
+
+from langflow.services.database.models.api_key.model import ApiKey
+from langflow.services.deps import get_settings_service, session_scope
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.services.database.models.user.model import User
+
+
+class VerifiedApiKeyCache:
+    """A short-lived cache of verified API keys and their users.
+
+    The API keys are stored hashed. Entries expire after `ttl` seconds and are invalidated when the
+    API key is deleted or its user is updated or deleted.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 10000) -> None:
+        self._cache: TTLCache = TTLCache(maxsize=max_size, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _hash(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode()).hexdigest()
+
+    def get(self, api_key: str) -> tuple[UUID, User] | None:
+        """Returns the ID of the API key and a copy of its user, or None if the key was not verified recently."""
+        with self._lock:
+            return self._cache.get(self._hash(api_key))
+
+    def set(self, api_key: str, api_key_id: UUID, user: User) -> None:
+        with self._lock:
+            self._cache[self._hash(api_key)] = (api_key_id, user)
+
+    def invalidate(self, *, api_key_id: UUID | None = None, user_id: UUID | None = None) -> None:
+        """Removes the entries of an API key or of all the API keys of a user."""
+        with self._lock:
+            for key, (cached_api_key_id, user) in list(self._cache.items()):
+                if (api_key_id is not None and str(cached_api_key_id) == str(api_key_id)) or (
+                    user_id is not None and str(user.id) == str(user_id)
+                ):
+                    del self._cache[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+class ApiKeyUsageCounter:
+    """Aggregates the uses of API keys in memory and writes them in a single UPDATE.
+
+    The counters are written `flush_interval` seconds after the first use that was not written yet.
+    """
+
+    def __init__(self, flush_interval: float) -> None:
+        self.flush_interval = flush_interval
+        self._uses: dict[UUID, int] = {}
+        self._last_used_at: dict[UUID, datetime.datetime] = {}
+        self._flusher: asyncio.Task | None = None
+
+    def record(self, api_key_id: UUID) -> None:
+        self._uses[api_key_id] = self._uses.get(api_key_id, 0) + 1
+        self._last_used_at[api_key_id] = datetime.datetime.now(datetime.timezone.utc)
+        if self._flusher is None or self._flusher.done() or self._flusher.get_loop() is not asyncio.get_running_loop():
+            self._flusher = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Adds the recorded uses to the total uses of the API keys."""
+        if not self._uses:
+            return
+        uses, self._uses = self._uses, {}
+        last_used_at, self._last_used_at = self._last_used_at, {}
+        stmt = (
+            update(ApiKey)
+            .where(col(ApiKey.id).in_(list(uses)))
+            .values(
+                total_uses=ApiKey.total_uses + case(uses, value=ApiKey.id, else_=0),
+                last_used_at=case(last_used_at, value=ApiKey.id, else_=ApiKey.last_used_at),
+            )
+        )
+        try:
+            async with session_scope() as session:
+                await session.exec(stmt)  # type: ignore[call-overload]
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).warning(f"Could not update the uses of {len(uses)} API keys")
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+
+_verified_api_key_cache: VerifiedApiKeyCache | None = None
+_api_key_usage_counter: ApiKeyUsageCounter | None = None
+
+
+def get_verified_api_key_cache() -> VerifiedApiKeyCache | None:
+    """Returns the process wide cache of verified API keys, or None if `api_key_cache_ttl` is 0."""
+    global _verified_api_key_cache  # noqa: PLW0603
+    ttl = get_settings_service().settings.api_key_cache_ttl
+    if ttl <= 0:
+        return None
+    if _verified_api_key_cache is None:
+        _verified_api_key_cache = VerifiedApiKeyCache(ttl=ttl)
+    return _verified_api_key_cache
+
+
+def get_api_key_usage_counter() -> ApiKeyUsageCounter | None:
+    """Returns the process wide API key usage counter, or None if `api_key_usage_flush_interval` is 0."""
+    global _api_key_usage_counter  # noqa: PLW0603
+    flush_interval = get_settings_service().settings.api_key_usage_flush_interval
+    if flush_interval <= 0:
+        return None
+    if _api_key_usage_counter is None:
+        _api_key_usage_counter = ApiKeyUsageCounter(flush_interval=flush_interval)
+    return _api_key_usage_counter
+
+
+def invalidate_verified_api_keys(*, api_key_id: UUID | None = None, user_id: UUID | None = None) -> None:
+    """Removes the cached verifications of an API key or of all the API keys of a user."""
+    if (cache := get_verified_api_key_cache()) is not None:
+        cache.invalidate(api_key_id=api_key_id, user_id=user_id)
@@ -10,6 +10,11 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models import User
 from langflow.services.database.models.api_key import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
+from langflow.services.database.models.api_key.cache import (
+    get_api_key_usage_counter,
+    get_verified_api_key_cache,
+    invalidate_verified_api_keys,
+)
 from langflow.services.database.utils import session_getter
 from langflow.services.deps import get_db_service
 
@@ -49,6 +54,7 @@ async def delete_api_key(session: AsyncSession, api_key_id: UUID) -> None:
         raise ValueError(msg)
     await session.delete(api_key)
     await session.commit()
+    invalidate_verified_api_keys(api_key_id=api_key_id)
 
 
 update_total_uses_tasks: set[asyncio.Task] = set()
@@ -56,16 +62,32 @@ update_total_uses_tasks: set[asyncio.Task] = set()
 
 async def check_key(session: AsyncSession, api_key: str) -> User | None:
     """Check if the API key is valid."""
+    cache = get_verified_api_key_cache()
+    if cache is not None and (cached := cache.get(api_key)) is not None:
+        api_key_id, user = cached
+        _record_use(api_key_id)
+        return user
     query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
     api_key_object: ApiKey | None = (await session.exec(query)).first()
     if api_key_object is not None:
-        task = asyncio.create_task(update_total_uses(api_key_object.id))
-        task.add_done_callback(update_total_uses_tasks.discard)
-        update_total_uses_tasks.add(task)
+        _record_use(api_key_object.id)
+        if cache is not None:
+            # Cache a copy, the user loaded by the query is bound to the session
+            cache.set(api_key, api_key_object.id, User(**api_key_object.user.model_dump()))
         return api_key_object.user
     return None
 
 
+def _record_use(api_key_id: UUID) -> None:
+    counter = get_api_key_usage_counter()
+    if counter is not None:
+        counter.record(api_key_id)
+        return
+    task = asyncio.create_task(update_total_uses(api_key_id))
+    task.add_done_callback(update_total_uses_tasks.discard)
+    update_total_uses_tasks.add(task)
+
+
 async def update_total_uses(api_key_id: UUID):
     """Update the total uses and last used at."""
     async with session_getter(get_db_service()) as session:
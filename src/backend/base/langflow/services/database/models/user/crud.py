@@ -8,6 +8,7 @@ from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from langflow.services.database.models.api_key.cache import invalidate_verified_api_keys
 from langflow.services.database.models.user.model import User, UserUpdate
 
 
@@ -50,6 +51,7 @@ async def update_user(user_db: User | None, user: UserUpdate, db: AsyncSession)
         await db.rollback()
         raise HTTPException(status_code=400, detail=str(e)) from e
 
+    invalidate_verified_api_keys(user_id=user_db.id)
     return user_db
 
 
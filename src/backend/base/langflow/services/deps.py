@@ -12,9 +12,12 @@ if TYPE_CHECKING:
 
     from sqlmodel.ext.asyncio.session import AsyncSession
 
+    from langflow.services.build_log.service import BuildLogService
     from langflow.services.cache.service import AsyncBaseCacheService, CacheService
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
+    from langflow.services.http_client.service import HttpClientService
+    from langflow.services.message_sink.service import MessageSinkService
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
     from langflow.services.socket.service import SocketIOService
@@ -70,6 +73,39 @@ def get_tracing_service() -> TracingService:
     return get_service(ServiceType.TRACING_SERVICE, TracingServiceFactory())
 
 
+def get_message_sink_service() -> MessageSinkService:
+    """Retrieves the MessageSinkService instance from the service manager.
+
+    Returns:
+        The MessageSinkService instance.
+    """
+    from langflow.services.message_sink.factory import MessageSinkServiceFactory
+
+    return get_service(ServiceType.MESSAGE_SINK_SERVICE, MessageSinkServiceFactory())
+
+
+def get_build_log_service() -> BuildLogService:
+    """Retrieves the BuildLogService instance from the service manager.
+
+    Returns:
+        The BuildLogService instance.
+    """
+    from langflow.services.build_log.factory import BuildLogServiceFactory
+
+    return get_service(ServiceType.BUILD_LOG_SERVICE, BuildLogServiceFactory())
+
+
+def get_http_client_service() -> HttpClientService:
+    """Retrieves the HttpClientService instance from the service manager.
+
+    Returns:
+        The HttpClientService instance.
+    """
+    from langflow.services.http_client.factory import HttpClientServiceFactory
+
+    return get_service(ServiceType.HTTP_CLIENT_SERVICE, HttpClientServiceFactory())
+
+
 def get_state_service() -> StateService:
     """Retrieves the StateService instance from the service manager.
 
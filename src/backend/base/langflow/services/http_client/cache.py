@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from cachetools import LRUCache
+
+# The maximum size of a response body kept in the cache
+MAX_BODY_SIZE = 10 * 1024 * 1024
+
+
+def parse_cache_control(headers: httpx.Headers) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for header in headers.get_list("cache-control", split_commas=True):
+        name, _, value = header.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def freshness_lifetime(headers: httpx.Headers) -> float:
+    """Returns the number of seconds a response can be used without revalidating it, from its Cache-Control."""
+    cache_control = parse_cache_control(headers)
+    if "no-cache" in cache_control:
+        return 0
+    max_age = cache_control.get("s-maxage") or cache_control.get("max-age")
+    try:
+        lifetime = float(max_age) if max_age else 0
+        age = float(headers.get("age", 0))
+    except ValueError:
+        return 0
+    return max(lifetime - age, 0)
+
+
+@dataclass
+class CachedResponse:
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    content: bytes
+    expires_at: float
+    extensions: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def etag(self) -> str | None:
+        return httpx.Headers(self.headers).get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return httpx.Headers(self.headers).get("last-modified")
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        # The content is still encoded as it was received, the client decodes it like any other response
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+            extensions=self.extensions,
+        )
+
+
+class HttpResponseCache:
+    """An LRU cache of the responses to GET requests, honoring their Cache-Control, ETag and Last-Modified headers.
+
+    The responses are keyed by their URL and all the headers of their request, so requests made with different
+    credentials never share a response. Fresh responses are returned without a request, stale responses that have
+    a validator are revalidated with a conditional request.
+    """
+
+    def __init__(self, max_size: int, max_body_size: int = MAX_BODY_SIZE) -> None:
+        self.max_size = max_size
+        self.max_body_size = max_body_size
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._cache: LRUCache = LRUCache(maxsize=max(max_size, 1))
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(request: httpx.Request) -> tuple:
+        return str(request.url), tuple(sorted((name.lower(), value) for name, value in request.headers.raw))
+
+    def get(self, key: tuple) -> CachedResponse | None:
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: tuple, response: CachedResponse) -> None:
+        with self._lock:
+            self._cache[key] = response
+
+    def pop(self, key: tuple) -> None:
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def is_storable(self, response: httpx.Response) -> bool:
+        cache_control = parse_cache_control(response.headers)
+        if response.status_code != httpx.codes.OK or "no-store" in cache_control or "private" in cache_control:
+            return False
+        if response.headers.get("vary") == "*":
+            return False
+        content_length = response.headers.get("content-length")
+        if content_length is not None and (not content_length.isdigit() or int(content_length) > self.max_body_size):
+            return False
+        return freshness_lifetime(response.headers) > 0 or any(
+            header in response.headers for header in ("etag", "last-modified")
+        )
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """A transport that answers GET requests from an `HttpResponseCache` when it can."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: HttpResponseCache) -> None:
+        self.transport = transport
+        self.cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request_cache_control = parse_cache_control(request.headers)
+        if (
+            request.method != "GET"
+            or "no-store" in request_cache_control
+            # Conditional requests of the caller expect the 304 response
+            or "if-none-match" in request.headers
+            or "if-modified-since" in request.headers
+        ):
+            return await self.transport.handle_async_request(request)
+
+        key = self.cache.key(request)
+        cached = self.cache.get(key)
+        if cached is not None and cached.is_fresh() and "no-cache" not in request_cache_control:
+            self.cache.hits += 1
+            return cached.to_response(request)
+        if cached is not None:
+            if cached.etag:
+                request.headers["if-none-match"] = cached.etag
+            if cached.last_modified:
+                request.headers["if-modified-since"] = cached.last_modified
+
+        response = await self.transport.handle_async_request(request)
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            await response.aclose()
+            self.cache.revalidations += 1
+            cached.expires_at = time.monotonic() + freshness_lifetime(response.headers)
+            return cached.to_response(request)
+
+        self.cache.misses += 1
+        if not self.cache.is_storable(response):
+            if cached is not None:
+                self.cache.pop(key)
+            return response
+
+        try:
+            # The stream of the transport, which yields the content still encoded
+            content = b"".join([chunk async for chunk in response.stream])  # type: ignore[union-attr]
+        finally:
+            await response.aclose()
+        entry = CachedResponse(
+            status_code=response.status_code,
+            headers=response.headers.raw,
+            content=content,
+            expires_at=time.monotonic() + freshness_lifetime(response.headers),
+            # Without the network stream, which would keep the connection alive
+            extensions={
+                name: value for name, value in response.extensions.items() if name in {"http_version", "reason_phrase"}
+            },
+        )
+        if len(content) <= self.cache.max_body_size:
+            self.cache.set(key, entry)
+        return entry.to_response(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.services.factory import ServiceFactory
+from langflow.services.http_client.service import HttpClientService
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+
+class HttpClientServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(HttpClientService)
+
+    def create(self, settings_service: SettingsService):
+        return HttpClientService(settings_service)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import weakref
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING
+
+import httpx
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.http_client.cache import CachingTransport, HttpResponseCache
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+
+class HttpClientService(Service):
+    """Provides HTTP clients that keep their connections open and share them between the components.
+
+    Each event loop gets its own client, as the connections of a client cannot be used by another loop. The
+    clients keep a pool of connections per host, limited by the `http_client_*` settings, and can cache the
+    responses to GET requests. They do not keep cookies, as they are shared by every flow and user.
+    """
+
+    name = "http_client_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        settings = settings_service.settings
+        self.limits = httpx.Limits(
+            max_connections=settings.http_client_max_connections,
+            max_keepalive_connections=settings.http_client_max_keepalive_connections,
+            keepalive_expiry=settings.http_client_keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(settings.http_client_timeout or None)
+        self.http2 = settings.http_client_http2
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requires the h2 package, the HTTP clients will use HTTP/1.1")
+            self.http2 = False
+        self.response_cache = (
+            HttpResponseCache(max_size=settings.http_client_cache_size) if settings.http_client_cache_size > 0 else None
+        )
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Returns the client of the running event loop. The client is shared and must not be closed."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._create_client()
+            self._clients[loop] = client
+        return client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+        if self.response_cache is not None:
+            transport = CachingTransport(transport, self.response_cache)
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=self.timeout,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+
+    async def teardown(self) -> None:
+        loop = asyncio.get_running_loop()
+        for client_loop, client in list(self._clients.items()):
+            # The clients of other loops cannot be closed from this one, their connections are dropped instead
+            if client_loop is loop:
+                await client.aclose()
+        self._clients.clear()
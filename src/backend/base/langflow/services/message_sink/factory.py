@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.services.factory import ServiceFactory
+from langflow.services.message_sink.service import MessageSinkService
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+
+class MessageSinkServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(MessageSinkService)
+
+    def create(self, settings_service: SettingsService):
+        return MessageSinkService(settings_service)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from langflow.services.write_behind import WriteBehindService
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.services.database.models.message.model import MessageTable
+    from langflow.services.settings.service import SettingsService
+
+
+class MessageSinkService(WriteBehindService):
+    """Writes the messages stored by components to the database in batches.
+
+    New messages are kept in memory and inserted together, in a single transaction, after
+    `message_flush_interval` ms or as soon as `message_flush_batch_size` messages are pending.
+    Updates of pending messages are applied in memory, so a streamed message is usually written once.
+    Reads of a session flush its pending messages first, so callers always see their own writes.
+    """
+
+    name = "message_sink_service"
+    row_name = "messages"
+
+    def __init__(self, settings_service: SettingsService):
+        settings = settings_service.settings
+        super().__init__(
+            flush_interval=settings.message_flush_interval / 1000, batch_size=settings.message_flush_batch_size
+        )
+        self.enabled = settings.message_write_behind
+        self._pending: dict[str, MessageTable] = {}
+
+    def add(self, message: MessageTable) -> None:
+        """Queues a new message to be inserted in the next batch."""
+        self._pending[str(message.id)] = message
+        if len(self._pending) >= self.batch_size:
+            self._start_write(self._take())
+        else:
+            self._schedule_flush()
+
+    def get_pending(self, message_id: str | UUID) -> MessageTable | None:
+        """Returns the message if it is queued and not written yet. Changes to it are written with it."""
+        return self._pending.get(str(message_id))
+
+    def discard(self, *, message_id: str | UUID | None = None, session_id: str | UUID | None = None) -> None:
+        """Removes queued messages, by ID or by session, so they are never written."""
+        if message_id is not None:
+            self._pending.pop(str(message_id), None)
+        if session_id is not None:
+            self._take(session_id)
+
+    async def flush(self, session_id: str | UUID | None = None) -> None:
+        """Writes the queued messages and waits for the writes in flight.
+
+        Args:
+            session_id: If set, only the messages of this session are written right away.
+        """
+        self._start_write(self._take(session_id))
+        await self._wait_for_writes()
+
+    def _take(self, session_id: str | UUID | None = None) -> list[MessageTable]:
+        if session_id is None:
+            batch = list(self._pending.values())
+            self._pending.clear()
+            return batch
+        batch = [message for message in self._pending.values() if str(message.session_id) == str(session_id)]
+        for message in batch:
+            del self._pending[str(message.id)]
+        return batch
+
+    def _log_write_error(self, row: MessageTable) -> None:
+        logger.exception(f"Failed to write message {row.id}")
@@ -19,3 +19,6 @@ class ServiceType(str, Enum):
     STATE_SERVICE = "state_service"
     TRACING_SERVICE = "tracing_service"
     TELEMETRY_SERVICE = "telemetry_service"
+    MESSAGE_SINK_SERVICE = "message_sink_service"
+    BUILD_LOG_SERVICE = "build_log_service"
+    HTTP_CLIENT_SERVICE = "http_client_service"
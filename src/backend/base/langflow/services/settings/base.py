@@ -89,6 +89,10 @@ class Settings(BaseSettings):
     """The cache type can be 'async' or 'redis'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    cache_max_size_bytes: int = 0
+    """The maximum approximate size in bytes of the items kept by the 'memory' cache. 0 means no limit."""
+    cache_shards: int = 16
+    """The number of independently locked shards of the 'memory' cache."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
 
@@ -180,6 +184,101 @@ class Settings(BaseSettings):
     """The maximum number of transactions to keep in the database."""
     max_vertex_builds_to_keep: int = 3000
     """The maximum number of vertex builds to keep in the database."""
+    message_write_behind: bool = False
+    """If set to True, the messages stored by components are written to the database in batches instead of one
+    transaction per message. Reads of a session always include its pending messages."""
+    message_flush_interval: int = 50
+    """The interval in ms at which pending messages are written when `message_write_behind` is enabled."""
+    message_flush_batch_size: int = 100
+    """The number of pending messages that triggers a write before the flush interval when `message_write_behind`
+    is enabled."""
+    build_log_batching: bool = False
+    """If set to True, the transactions and vertex builds of flow runs are written to the database in batches
+    instead of one transaction per row, and rows are dropped when the database cannot keep up."""
+    build_log_flush_interval: int = 500
+    """The interval in ms at which buffered transactions and vertex builds are written when `build_log_batching`
+    is enabled."""
+    build_log_batch_size: int = 200
+    """The number of buffered transactions and vertex builds that triggers a write before the flush interval."""
+    build_log_max_pending: int = 10000
+    """The maximum number of transactions and vertex builds buffered or being written. Rows logged beyond it are
+    dropped."""
+    component_catalog_snapshot: bool = False
+    """If set to True, the templates built from the component files are saved in the config directory on startup,
+    and only the components whose code changed, or all of them after a Langflow upgrade, are built again."""
+    component_discovery_workers: int = 0
+    """The number of processes that build the components on startup. Set to 0 to build them in the server
+    process."""
+    variable_cache_ttl: int = 0
+    """The number of seconds the variables of a user are cached in memory between flow runs. Updating, creating or
+    deleting a variable invalidates the cache. Set to 0 to load the variables once per flow run."""
+    api_key_cache_ttl: int = 0
+    """The number of seconds a verified API key and its user are cached in memory. Deleting the key or updating
+    its user invalidates the cache. Set to 0 to verify API keys against the database on every request."""
+    api_key_usage_flush_interval: int = 0
+    """The number of seconds the uses of API keys are aggregated in memory before being written in a single
+    update. Set to 0 to write every use as it happens."""
+    max_concurrent_vertex_builds: int = 0
+    """The maximum number of vertices built at the same time in a single flow run. 0 means no limit."""
+    graph_cache_size: int = 0
+    """The maximum number of compiled flow graphs kept in memory and cloned for each run of the run endpoint.
+    Set to 0 to build the graph from the flow data on every run. Sub-flows and flow tools share this cache."""
+    build_event_buffer_size: int = 0
+    """The number of events of a flow build buffered for the client before the overflow policy applies. With a
+    buffer, the vertices are built without waiting for the client to read their events. Set to 0 to build each
+    vertex only after the client read the events of the previous one."""
+    build_event_overflow_policy: Literal["coalesce", "drop"] = "coalesce"
+    """What to do with the token events of a flow build once the event buffer is full. `coalesce` merges them into
+    the last buffered token event of the same message, `drop` discards them."""
+    token_event_batch_interval: float = 0
+    """The number of seconds the token events of a message are collected before being sent to the client as a
+    single event. Set to 0 to send every token as it is generated."""
+    token_event_batch_size: int = 32
+    """The maximum number of tokens sent in a single token event when `token_event_batch_interval` is set."""
+    http_client_max_connections: int = 100
+    """The maximum number of connections opened at the same time by the HTTP client shared by the components."""
+    http_client_max_keepalive_connections: int = 20
+    """The maximum number of idle connections the shared HTTP client keeps open to reuse them."""
+    http_client_keepalive_expiry: float = 30
+    """The number of seconds an idle connection of the shared HTTP client is kept open."""
+    http_client_timeout: float = 60
+    """The number of seconds the shared HTTP client waits to connect to a server or to receive data from it, for
+    the requests that do not set their own timeout. Set to 0 to wait indefinitely."""
+    http_client_http2: bool = False
+    """If set to True, the shared HTTP client uses HTTP/2 with the servers that support it. Requires the h2
+    package."""
+    http_client_cache_size: int = 0
+    """The maximum number of responses to GET requests cached by the shared HTTP client, following their
+    Cache-Control and ETag headers. Set to 0 to disable the cache."""
+    component_class_cache_size: int = 0
+    """The maximum number of component classes compiled from component code kept in memory, so that building a
+    vertex does not compile its component code again. Set to 0 to compile the code of every vertex."""
+    flow_name_cache_ttl: int = 0
+    """The number of seconds the IDs of flows looked up by name, e.g. by sub-flows, are cached in memory. A renamed
+    flow may keep resolving by its old name for that long. Set to 0 to look up the flow name on every run."""
+    vertex_result_cache: bool = False
+    """If set to True, components that set `cache_results` reuse the results of previous builds with the same
+    code and inputs, across runs and sessions."""
+    vector_store_pool_size: int = 0
+    """The maximum number of built vector stores kept by the process and reused by runs with the same connection
+    and configuration. Set to 0 to build the vector store on every run."""
+    vector_store_pool_idle_timeout: int = 600
+    """The number of seconds a pooled vector store can go unused before it is evicted. 0 means never."""
+    sql_database_pool_size: int = 0
+    """The maximum number of SQL databases, with their engine and reflected schema, kept by the process and reused by
+    the runs that connect to the same database. Set to 0 to connect and reflect the schema on every run."""
+    sql_database_pool_idle_timeout: int = 600
+    """The number of seconds a pooled SQL database can go unused before its connections are closed. 0 means never."""
+    sql_database_connection_pool_size: int = 5
+    """The number of connections each pooled SQL database keeps open."""
+    run_coalescing: bool = False
+    """If set to True, identical concurrent calls to the run endpoint without a session ID share one execution."""
+    run_result_cache_ttl: int = 0
+    """The number of seconds the results of coalesced runs are reused for identical runs.
+    Only enable it for deterministic flows. Set to 0 to only share in-flight runs."""
+    graph_state_snapshot_interval: int = 0
+    """The number of run state deltas written to the cache between two full snapshots of a graph being built.
+    Set to 0 to write the whole graph to the cache after every step."""
 
     @field_validator("dev")
     @classmethod
@@ -1,8 +1,16 @@
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
 import anyio
 from aiofile import async_open
 from loguru import logger
 
-from .service import StorageService
+from .service import CHUNK_SIZE, StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
 
 
 class LocalStorageService(StorageService):
@@ -40,6 +48,36 @@ class LocalStorageService(StorageService):
             logger.exception(f"Error saving file {file_name} in flow {flow_id}")
             raise
 
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> str:
+        """Save a file in the local storage from chunks of its content.
+
+        The chunks are written to a temporary file which replaces the file once complete, so an interrupted
+        upload never leaves a partial file behind.
+
+        :param flow_id: The identifier for the flow.
+        :param file_name: The name of the file to be saved.
+        :param chunks: The content of the file, in chunks.
+        :return: The SHA-256 hex digest of the content.
+        """
+        folder_path = self.data_dir / flow_id
+        await folder_path.mkdir(parents=True, exist_ok=True)
+        file_path = folder_path / file_name
+        tmp_path = folder_path / f".{file_name}.part"
+        sha256 = hashlib.sha256()
+
+        try:
+            async with async_open(str(tmp_path), "wb") as f:
+                async for chunk in chunks:
+                    sha256.update(chunk)
+                    await f.write(chunk)
+            await tmp_path.replace(file_path)
+            logger.info(f"File {file_name} saved successfully in flow {flow_id}.")
+        except BaseException:
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            await tmp_path.unlink(missing_ok=True)
+            raise
+        return sha256.hexdigest()
+
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         """Retrieve a file from the local storage.
 
@@ -60,6 +98,25 @@ class LocalStorageService(StorageService):
         logger.debug(f"File {file_name} retrieved successfully from flow {flow_id}.")
         return content
 
+    async def get_file_stream(self, flow_id: str, file_name: str, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Retrieve a file from the local storage in chunks.
+
+        :param flow_id: The identifier for the flow.
+        :param file_name: The name of the file to be retrieved.
+        :param chunk_size: The maximum size of the chunks in bytes.
+        :return: An async iterator over the content of the file.
+        :raises FileNotFoundError: If the file does not exist.
+        """
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            logger.warning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+
+        async with async_open(str(file_path), "rb") as f:
+            while chunk := await f.read(chunk_size):
+                yield chunk
+
     async def list_files(self, flow_id: str):
         """List all files in a specified flow.
 
@@ -1,8 +1,20 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from typing import TYPE_CHECKING
+
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from loguru import logger
 
-from .service import StorageService
+from .service import CHUNK_SIZE, StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+# S3 requires every part of a multipart upload but the last one to be at least 5 MiB
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
 
 
 class S3StorageService(StorageService):
@@ -33,6 +45,68 @@ class S3StorageService(StorageService):
             logger.exception(f"Error saving file {file_name} in folder {folder}")
             raise
 
+    async def save_file_stream(self, folder: str, file_name: str, chunks: AsyncIterable[bytes]) -> str:
+        """Save a file to the S3 bucket from chunks of its content, using a multipart upload.
+
+        Only one part of the file is held in memory at a time. The upload is aborted if an error occurs.
+
+        :param folder: The folder in the bucket to save the file.
+        :param file_name: The name of the file to be saved.
+        :param chunks: The content of the file, in chunks.
+        :return: The SHA-256 hex digest of the content.
+        :raises Exception: If an error occurs during file saving.
+        """
+        key = f"{folder}/{file_name}"
+        sha256 = hashlib.sha256()
+        try:
+            upload = await asyncio.to_thread(self.s3_client.create_multipart_upload, Bucket=self.bucket, Key=key)
+        except NoCredentialsError:
+            logger.exception("Credentials not available for AWS S3.")
+            raise
+        except ClientError:
+            logger.exception(f"Error saving file {file_name} in folder {folder}")
+            raise
+
+        upload_id = upload["UploadId"]
+        parts: list[dict] = []
+        buffer = bytearray()
+
+        async def upload_part() -> None:
+            response = await asyncio.to_thread(
+                self.s3_client.upload_part,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=len(parts) + 1,
+                Body=bytes(buffer),
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": len(parts) + 1})
+            buffer.clear()
+
+        try:
+            async for chunk in chunks:
+                sha256.update(chunk)
+                buffer.extend(chunk)
+                if len(buffer) >= MULTIPART_PART_SIZE:
+                    await upload_part()
+            if buffer or not parts:
+                await upload_part()
+            await asyncio.to_thread(
+                self.s3_client.complete_multipart_upload,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+            logger.info(f"File {file_name} saved successfully in folder {folder}.")
+        except BaseException:
+            logger.exception(f"Error saving file {file_name} in folder {folder}")
+            await asyncio.to_thread(
+                self.s3_client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id
+            )
+            raise
+        return sha256.hexdigest()
+
     async def get_file(self, folder: str, file_name: str):
         """Retrieve a file from the S3 bucket.
 
@@ -49,6 +123,30 @@ class S3StorageService(StorageService):
             logger.exception(f"Error retrieving file {file_name} from folder {folder}")
             raise
 
+    async def get_file_stream(self, folder: str, file_name: str, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Retrieve a file from the S3 bucket in chunks.
+
+        :param folder: The folder in the bucket where the file is stored.
+        :param file_name: The name of the file to be retrieved.
+        :param chunk_size: The maximum size of the chunks in bytes.
+        :return: An async iterator over the content of the file.
+        :raises Exception: If an error occurs during file retrieval.
+        """
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.get_object, Bucket=self.bucket, Key=f"{folder}/{file_name}"
+            )
+        except ClientError:
+            logger.exception(f"Error retrieving file {file_name} from folder {folder}")
+            raise
+
+        body = response["Body"]
+        try:
+            while chunk := await asyncio.to_thread(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
     async def list_files(self, folder: str):
         """List all files in a specified folder of the S3 bucket.
 
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import hashlib
 from abc import abstractmethod
 from typing import TYPE_CHECKING
 
 from langflow.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
 
 
+CHUNK_SIZE = 1024 * 1024
+
+
 class StorageService(Service):
     name = "storage_service"
 
@@ -32,6 +38,33 @@ class StorageService(Service):
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         raise NotImplementedError
 
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> str:
+        """Saves a file from chunks of its content, without holding the whole file in memory.
+
+        Storages that cannot write a file in chunks should override this method, the default implementation
+        joins the chunks and calls `save_file`.
+
+        Returns:
+            The SHA-256 hex digest of the content.
+        """
+        sha256 = hashlib.sha256()
+        data = bytearray()
+        async for chunk in chunks:
+            sha256.update(chunk)
+            data.extend(chunk)
+        await self.save_file(flow_id, file_name, bytes(data))
+        return sha256.hexdigest()
+
+    async def get_file_stream(self, flow_id: str, file_name: str, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Yields the content of a file in chunks of up to `chunk_size` bytes.
+
+        Storages that cannot read a file in chunks should override this method, the default implementation
+        reads the whole file with `get_file`.
+        """
+        content = await self.get_file(flow_id, file_name)
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
+
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
         raise NotImplementedError
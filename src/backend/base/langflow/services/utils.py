@@ -139,6 +139,13 @@ async def teardown_services() -> None:
             await teardown_superuser(get_settings_service(), session)
     except Exception as exc:  # noqa: BLE001
         logger.exception(exc)
+    try:
+        from langflow.services.database.models.api_key.cache import get_api_key_usage_counter
+
+        if (counter := get_api_key_usage_counter()) is not None:
+            await counter.flush()
+    except Exception as exc:  # noqa: BLE001
+        logger.exception(exc)
     try:
         from langflow.services.manager import service_manager
 
@@ -4,6 +4,7 @@ import os
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
+from cachetools import TTLCache
 from loguru import logger
 from sqlmodel import select
 
@@ -22,9 +23,52 @@ if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
 
 
+class UserVariables:
+    """The variables of a user, loaded in a single query and decrypted on first use."""
+
+    def __init__(self, user_id: UUID | str, variables: Sequence[Variable], settings_service: SettingsService):
+        self.user_id = user_id
+        self.settings_service = settings_service
+        self._variables = {variable.name: (variable.type, variable.value) for variable in variables}
+        self._decrypted: dict[str, str] = {}
+
+    def get(self, name: str, field: str) -> str:
+        type_, value = self._variables.get(name, (None, None))
+        if not value:
+            msg = f"{name} variable not found."
+            raise ValueError(msg)
+
+        if type_ == CREDENTIAL_TYPE and field == "session_id":
+            msg = (
+                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
+                "because its purpose is to prevent the exposure of values."
+            )
+            raise TypeError(msg)
+
+        if name not in self._decrypted:
+            self._decrypted[name] = auth_utils.decrypt_api_key(value, settings_service=self.settings_service)
+        return self._decrypted[name]
+
+
 class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        ttl = settings_service.settings.variable_cache_ttl
+        self._user_variables: TTLCache | None = TTLCache(maxsize=1024, ttl=ttl) if ttl > 0 else None
+
+    async def get_user_variables(self, user_id: UUID | str, session: AsyncSession) -> UserVariables:
+        """Loads all the variables of a user at once, to resolve the variables of a whole flow run."""
+        if self._user_variables is not None and (user_variables := self._user_variables.get(str(user_id))):
+            return user_variables
+        stmt = select(Variable).where(Variable.user_id == user_id)
+        user_variables = UserVariables(user_id, (await session.exec(stmt)).all(), self.settings_service)
+        if self._user_variables is not None:
+            self._user_variables[str(user_id)] = user_variables
+        return user_variables
+
+    def invalidate_user_variables(self, user_id: UUID | str) -> None:
+        if self._user_variables is not None:
+            self._user_variables.pop(str(user_id), None)
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -60,24 +104,14 @@ class DatabaseVariableService(VariableService, Service):
         field: str,
         session: AsyncSession,
     ) -> str:
+        if self._user_variables is not None:
+            user_variables = await self.get_user_variables(user_id, session)
+            return user_variables.get(name, field)
+
         # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
         stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
         variable = (await session.exec(stmt)).first()
-
-        if not variable or not variable.value:
-            msg = f"{name} variable not found."
-            raise ValueError(msg)
-
-        if variable.type == CREDENTIAL_TYPE and field == "session_id":
-            msg = (
-                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
-                "because its purpose is to prevent the exposure of values."
-            )
-            raise TypeError(msg)
-
-        # we decrypt the value
-        return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        return UserVariables(user_id, [variable] if variable else [], self.settings_service).get(name, field)
 
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
@@ -114,6 +148,7 @@ class DatabaseVariableService(VariableService, Service):
         variable.value = encrypted
         session.add(variable)
         await session.commit()
+        self.invalidate_user_variables(user_id)
         await session.refresh(variable)
         return variable
 
@@ -138,6 +173,7 @@ class DatabaseVariableService(VariableService, Service):
 
         session.add(db_variable)
         await session.commit()
+        self.invalidate_user_variables(user_id)
         await session.refresh(db_variable)
         return db_variable
 
@@ -154,6 +190,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.invalidate_user_variables(user_id)
 
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
         stmt = select(Variable).where(Variable.user_id == user_id, Variable.id == variable_id)
@@ -163,6 +200,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.invalidate_user_variables(user_id)
 
     async def create_variable(
         self,
@@ -183,5 +221,6 @@ class DatabaseVariableService(VariableService, Service):
         variable = Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
         session.add(variable)
         await session.commit()
+        self.invalidate_user_variables(user_id)
         await session.refresh(variable)
         return variable
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+from abc import abstractmethod
+from typing import Any
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.deps import session_scope
+
+
+class WriteBehindService(Service):
+    """Base class of the services that insert rows in the database in batches, after the callers moved on.
+
+    Subclasses keep the rows waiting to be written and return them from `_take`. A batch is written in a single
+    transaction once `batch_size` rows are waiting, by calling `_start_write(self._take())`, or `flush_interval`
+    seconds after `_schedule_flush`. If the batch fails, its rows are written one by one, so a single invalid row
+    does not lose the others.
+    """
+
+    # The name of the rows in the logs, e.g. "messages"
+    row_name = "rows"
+
+    def __init__(self, *, flush_interval: float, batch_size: int) -> None:
+        super().__init__()
+        self.flush_interval = flush_interval
+        self.batch_size = max(batch_size, 1)
+        # The number of rows being written
+        self._writing = 0
+        self._writes: set[asyncio.Task] = set()
+        self._flusher: asyncio.Task | None = None
+
+    @abstractmethod
+    def _take(self) -> list[Any]:
+        """Returns the rows waiting to be written and forgets them."""
+
+    async def flush(self) -> None:
+        """Writes the waiting rows and waits for the writes in flight."""
+        self._start_write(self._take())
+        await self._wait_for_writes()
+
+    def _start_write(self, batch: list[Any]) -> None:
+        if not batch:
+            return
+        self._writing += len(batch)
+        task = asyncio.create_task(self._write(batch))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    def _get_writes(self) -> list[asyncio.Task]:
+        # The writes of other event loops cannot be awaited from this one
+        loop = asyncio.get_running_loop()
+        return [task for task in self._writes if task.get_loop() is loop]
+
+    async def _wait_for_writes(self) -> None:
+        writes = self._get_writes()
+        if writes:
+            # asyncio.wait does not cancel the writes if the caller is cancelled
+            await asyncio.wait(writes)
+
+    def _schedule_flush(self) -> None:
+        if not self._flush_scheduled():
+            self._flusher = asyncio.create_task(self._flush_later())
+
+    def _flush_scheduled(self) -> bool:
+        return (
+            self._flusher is not None
+            and not self._flusher.done()
+            and self._flusher.get_loop() is asyncio.get_running_loop()
+        )
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        self._start_write(self._take())
+
+    async def _write(self, batch: list[Any]) -> None:
+        try:
+            async with session_scope() as session:
+                session.add_all(batch)
+        except Exception:  # noqa: BLE001
+            logger.warning(f"Failed to write a batch of {len(batch)} {self.row_name}, writing them one by one")
+            for row in batch:
+                try:
+                    async with session_scope() as session:
+                        session.add(row)
+                except Exception:  # noqa: BLE001
+                    self._log_write_error(row)
+        finally:
+            self._writing -= len(batch)
+
+    def _log_write_error(self, row: Any) -> None:
+        logger.opt(exception=True).debug(f"Failed to write {type(row).__name__} row")
+
+    async def teardown(self) -> None:
+        if self._flush_scheduled():
+            self._flusher.cancel()
+        await self.flush()
@@ -23,6 +23,12 @@ def mock_storage_service():
     # Setup mock behaviors for the service methods as needed
     service.save_file.return_value = None
     service.get_file.return_value = b"file content"  # Binary content for files
+
+    async def get_file_stream(*_args, **_kwargs):
+        yield b"file "
+        yield b"content"
+
+    service.get_file_stream.side_effect = get_file_stream
     service.list_files.return_value = ["file1.txt", "file2.jpg"]
     service.delete_file.return_value = None
 
@@ -179,6 +185,30 @@ async def test_file_operations(client, created_api_key, flow):
     assert full_file_name not in response.json()["files"]
 
 
+async def test_download_file_range(client, created_api_key, flow):
+    headers = {"x-api-key": created_api_key.api_key}
+    file_content = b"0123456789" * 1000
+
+    response = await client.post(
+        f"api/v1/files/upload/{flow.id}",
+        files={"file": ("large.txt", file_content, "text/plain")},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    full_file_name = response.json()["file_path"].split("/")[-1]
+
+    response = await client.get(f"api/v1/files/download/{flow.id}/{full_file_name}", headers=headers)
+    assert response.status_code == 200
+    assert response.content == file_content
+    assert response.headers["content-length"] == str(len(file_content))
+
+    response = await client.get(
+        f"api/v1/files/download/{flow.id}/{full_file_name}", headers={**headers, "Range": "bytes=100-109"}
+    )
+    assert response.status_code == 206
+    assert response.content == file_content[100:110]
+
+
 @pytest.mark.usefixtures("max_file_size_upload_fixture")
 async def test_upload_file_size_limit(files_client, created_api_key, flow):
     headers = {"x-api-key": created_api_key.api_key}
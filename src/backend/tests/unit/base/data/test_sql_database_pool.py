@@ -0,0 +1,77 @@
+import sqlite3
+import time
+
+import pytest
+from langchain_community.utilities import SQLDatabase
+from langflow.base.data import sql_database_pool
+from langflow.base.data.sql_database_pool import SQLDatabasePool, iter_query_batches
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    path = tmp_path / "test.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        connection.executemany("INSERT INTO users (name) VALUES (?)", [(f"user{i}",) for i in range(5)])
+    return f"sqlite:///{path}"
+
+
+def test_sql_database_pool_reuses_databases(database_url):
+    pool = SQLDatabasePool(max_size=2)
+    database = pool.get_database(database_url)
+
+    assert pool.get_database(database_url) is database
+    assert database.get_usable_table_names() == ["users"]
+    assert len(pool) == 1
+    pool.clear()
+
+
+def test_sql_database_pool_connects_without_the_lock(database_url, monkeypatch):
+    pool = SQLDatabasePool(max_size=2)
+    locked = []
+
+    def sql_database(engine, **kwargs):
+        locked.append(pool._lock.locked())
+        return SQLDatabase(engine, **kwargs)
+
+    monkeypatch.setattr(sql_database_pool, "SQLDatabase", sql_database)
+    database = pool.get_database(database_url)
+
+    assert locked == [False]
+    assert pool.get_database(database_url) is database
+    pool.clear()
+
+
+def test_sql_database_pool_evicts_least_recently_used(database_url, tmp_path):
+    pool = SQLDatabasePool(max_size=1)
+    database = pool.get_database(database_url)
+    pool.get_database(f"sqlite:///{tmp_path / 'other.db'}")
+
+    assert len(pool) == 1
+    assert pool.get_database(database_url) is not database
+    pool.clear()
+
+
+def test_sql_database_pool_evicts_idle_databases(database_url, monkeypatch):
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    pool = SQLDatabasePool(max_size=2, idle_timeout=60)
+    database = pool.get_database(database_url)
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+
+    assert pool.get_database(database_url) is not database
+    assert len(pool) == 1
+    pool.clear()
+
+
+def test_iter_query_batches(database_url):
+    pool = SQLDatabasePool(max_size=1)
+    database = pool.get_database(database_url)
+
+    batches = list(iter_query_batches(database, "SELECT id, name FROM users ORDER BY id", batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert batches[0][0] == {"id": 1, "name": "user0"}
+    assert list(iter_query_batches(database, "UPDATE users SET name = 'x'", batch_size=2)) == []
+    pool.clear()
@@ -0,0 +1,79 @@
+import time
+
+from langchain_community.embeddings import FakeEmbeddings
+from langflow.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
+from langflow.base.vectorstores.pool import VectorStorePool
+from langflow.io import HandleInput, StrInput
+
+
+def test_vector_store_pool_evicts_least_recently_used():
+    pool = VectorStorePool(max_size=2)
+    pool.put("a", "store_a")
+    pool.put("b", "store_b")
+    assert pool.get("a") == "store_a"
+
+    pool.put("c", "store_c")
+
+    assert pool.get("b") is None
+    assert pool.get("a") == "store_a"
+    assert pool.get("c") == "store_c"
+
+
+def test_vector_store_pool_evicts_idle_stores(monkeypatch):
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    pool = VectorStorePool(max_size=2, idle_timeout=60)
+    pool.put("a", "store_a")
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+
+    assert pool.get("a") is None
+    assert len(pool) == 0
+
+
+def test_vector_store_pool_drops_unhealthy_stores():
+    def failing_health_check(_store):
+        msg = "Connection refused"
+        raise ConnectionError(msg)
+
+    pool = VectorStorePool(max_size=2)
+    pool.put("a", "store_a")
+    pool.put("b", "store_b")
+
+    assert pool.get("a", health_check=failing_health_check) is None
+    assert pool.get("b", health_check=lambda _store: True) == "store_b"
+    assert len(pool) == 1
+
+
+class _PooledVectorStoreComponent(LCVectorStoreComponent):
+    pool_vector_store = True
+    inputs = [
+        StrInput(name="collection_name"),
+        HandleInput(name="embedding", input_types=["Embeddings"]),
+    ]
+
+    @check_cached_vector_store
+    def build_vector_store(self):
+        return None
+
+
+def test_vector_store_pool_key_requires_hashable_inputs():
+    component = _PooledVectorStoreComponent(collection_name="docs", embedding=FakeEmbeddings(size=2))
+    key = component.get_vector_store_pool_key()
+    assert key is not None
+    assert (
+        key
+        == _PooledVectorStoreComponent(
+            collection_name="docs", embedding=FakeEmbeddings(size=2)
+        ).get_vector_store_pool_key()
+    )
+    assert (
+        key
+        != _PooledVectorStoreComponent(
+            collection_name="docs", embedding=FakeEmbeddings(size=3)
+        ).get_vector_store_pool_key()
+    )
+
+    # An upstream object that cannot be hashed could differ between builds, so the store is not pooled
+    component = _PooledVectorStoreComponent(collection_name="docs", embedding=object())
+    assert component.get_vector_store_pool_key() is None
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from langflow.components.embeddings.similarity import EmbeddingSimilarityComponent
+from langflow.schema import Data
+
+
+def _vectors(matrix: np.ndarray) -> list[Data]:
+    return [Data(data={"embeddings": row.tolist()}) for row in matrix]
+
+
+@pytest.mark.parametrize("similarity_metric", ["Cosine Similarity", "Euclidean Distance", "Manhattan Distance"])
+def test_top_matches_agree_with_pairwise_similarity(similarity_metric):
+    rng = np.random.default_rng(0)
+    queries = rng.normal(size=(4, 8))
+    candidates = rng.normal(size=(10, 8))
+    component = EmbeddingSimilarityComponent()
+    component.set_attributes(
+        {
+            "embedding_vectors": _vectors(queries),
+            "candidate_vectors": _vectors(candidates),
+            "similarity_metric": similarity_metric,
+            "top_k": 3,
+        }
+    )
+
+    top_matches = component.compute_top_matches()
+
+    assert list(top_matches.columns) == ["query_index", "candidate_index", "rank", "score"]
+    assert len(top_matches) == 12
+    for query_index, query in enumerate(queries):
+        pair_scores = []
+        for candidate in candidates:
+            component.embedding_vectors = _vectors(np.stack([query, candidate]))
+            pair_scores.append(next(iter(component.compute_similarity().data["similarity_score"].values())))
+        expected = np.argsort(pair_scores)
+        if similarity_metric == "Cosine Similarity":
+            expected = expected[::-1]
+        rows = top_matches[top_matches["query_index"] == query_index]
+        assert rows["candidate_index"].tolist() == expected[:3].tolist()
+        assert np.allclose(rows["score"], np.array(pair_scores)[expected[:3]])
+
+
+def test_top_matches_without_candidates_excludes_each_vector_itself():
+    vectors = np.array([[1.0, 0.0], [0.99, 0.1], [0.0, 1.0]])
+    component = EmbeddingSimilarityComponent()
+    component.set_attributes(
+        {
+            "embedding_vectors": _vectors(vectors),
+            "candidate_vectors": [],
+            "similarity_metric": "Cosine Similarity",
+            "top_k": 5,
+        }
+    )
+
+    top_matches = component.compute_top_matches()
+
+    assert len(top_matches) == 6
+    assert (top_matches["query_index"] != top_matches["candidate_index"]).all()
+    best = top_matches[top_matches["rank"] == 1]
+    assert best["candidate_index"].tolist() == [1, 0, 1]
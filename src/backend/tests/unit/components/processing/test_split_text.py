@@ -0,0 +1,24 @@
+import pytest
+from langchain_text_splitters import CharacterTextSplitter
+from langflow.components.processing.split_text import SplitTextComponent
+from langflow.schema import Data
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_split_text_matches_split_documents(workers):
+    data_inputs = [
+        Data(data={"text": "\n".join(f"line {index} of input {i}" for index in range(50)), "source": f"doc_{i}"})
+        for i in range(5)
+    ]
+    component = SplitTextComponent()
+    component.set_attributes(
+        {"data_inputs": data_inputs, "chunk_size": 100, "chunk_overlap": 20, "separator": "\\n", "workers": workers}
+    )
+
+    chunks = component.split_text()
+
+    splitter = CharacterTextSplitter(chunk_size=100, chunk_overlap=20, separator="\n")
+    documents = splitter.split_documents([data.to_lc_document() for data in data_inputs])
+    assert [(chunk.text, chunk.data["source"]) for chunk in chunks] == [
+        (document.page_content, document.metadata["source"]) for document in documents
+    ]
@@ -0,0 +1,69 @@
+from textwrap import dedent
+
+import pytest
+from langflow.custom.directory_reader.catalog import ComponentCatalog
+from langflow.custom.directory_reader.utils import (
+    abuild_custom_component_list_from_path,
+    build_custom_component_list_from_path,
+)
+
+COMPONENT_CODE = dedent(
+    """
+    from langflow.custom import Component
+    from langflow.io import MessageTextInput, Output
+    from langflow.schema.message import Message
+
+
+    class EchoComponent(Component):
+        display_name = "Echo"
+        inputs = [MessageTextInput(name="text", display_name="Text")]
+        outputs = [Output(display_name="Message", name="message", method="echo")]
+
+        def echo(self) -> Message:
+            return Message(text=self.text)
+    """
+)
+
+
+def test_component_catalog_only_rebuilds_changed_components(tmp_path, monkeypatch):
+    component_file = tmp_path / "components" / "custom" / "echo.py"
+    component_file.parent.mkdir(parents=True)
+    component_file.write_text(COMPONENT_CODE)
+    catalog_path = tmp_path / "component_catalog.json"
+
+    catalog = ComponentCatalog.load(catalog_path, "1.0.0")
+    types_dict = build_custom_component_list_from_path(str(tmp_path / "components"), catalog=catalog)
+    catalog.save()
+    assert types_dict["custom"]["EchoComponent"]["display_name"] == "Echo"
+
+    def build_component(component):
+        msg = f"{component['name']} should be read from the catalog"
+        raise AssertionError(msg)
+
+    # The filter of the loaded components imports build_component when it is called
+    monkeypatch.setattr("langflow.custom.utils.build_component", build_component)
+    catalog = ComponentCatalog.load(catalog_path, "1.0.0")
+    cached_types_dict = build_custom_component_list_from_path(str(tmp_path / "components"), catalog=catalog)
+    assert cached_types_dict == types_dict
+
+    # Components are built again after an upgrade
+    assert ComponentCatalog.load(catalog_path, "1.0.0").get(COMPONENT_CODE) is not None
+    assert ComponentCatalog.load(catalog_path, "1.0.1").get(COMPONENT_CODE) is None
+
+
+@pytest.fixture
+def components_path(tmp_path):
+    components_path = tmp_path / "components"
+    for menu, name in [("custom", "echo"), ("custom", "echo_two"), ("other", "echo_three")]:
+        component_file = components_path / menu / f"{name}.py"
+        component_file.parent.mkdir(parents=True, exist_ok=True)
+        component_file.write_text(COMPONENT_CODE.replace("EchoComponent", f"{name.title().replace('_', '')}Component"))
+    return components_path
+
+
+async def test_components_built_in_processes_match_components_built_in_process(components_path):
+    types_dict = await abuild_custom_component_list_from_path(str(components_path))
+    pool_types_dict = await abuild_custom_component_list_from_path(str(components_path), workers=2)
+
+    assert set(types_dict["custom"]) == {"EchoComponent", "EchoTwoComponent"}
+    assert pool_types_dict == types_dict
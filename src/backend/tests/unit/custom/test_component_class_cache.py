@@ -0,0 +1,48 @@
+from textwrap import dedent
+
+import pytest
+from langflow.custom.eval import ComponentClassCache
+
+COMPONENT_CODE = dedent(
+    """
+    from langflow.custom import Component
+    from langflow.io import MessageTextInput, Output
+    from langflow.schema.message import Message
+
+
+    class EchoComponent(Component):
+        display_name = "Echo"
+        inputs = [MessageTextInput(name="text", display_name="Text")]
+        outputs = [Output(display_name="Message", name="message", method="echo")]
+
+        def echo(self) -> Message:
+            return Message(text=self.text)
+    """
+)
+
+
+def test_component_class_cache_compiles_code_once():
+    cache = ComponentClassCache(max_size=2)
+
+    echo_class = cache.get_class(COMPONENT_CODE)
+    assert cache.get_class(COMPONENT_CODE) is echo_class
+    assert cache.get_class(COMPONENT_CODE.replace("Echo", "Repeat")) is not echo_class
+    assert cache.stats() == {"size": 2, "max_size": 2, "hits": 1, "misses": 2}
+
+    # Instances of the shared class do not leak inputs to each other
+    component = echo_class()
+    component._get_or_create_input("extra")
+    assert [input_.name for input_ in echo_class().inputs] == ["text"]
+
+
+def test_component_class_cache_disabled():
+    cache = ComponentClassCache(max_size=0)
+    assert cache.get_class(COMPONENT_CODE) is not cache.get_class(COMPONENT_CODE)
+    assert len(cache) == 0
+
+
+def test_component_class_cache_does_not_cache_errors():
+    cache = ComponentClassCache(max_size=2)
+    with pytest.raises(ValueError, match="Invalid Python code"):
+        cache.get_class("class Broken(Component:\n    pass")
+    assert len(cache) == 0
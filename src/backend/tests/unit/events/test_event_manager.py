@@ -4,8 +4,9 @@ import time
 import uuid
 
 import pytest
-from langflow.events.event_manager import EventManager
+from langflow.events.event_manager import EventManager, create_default_event_manager
 from langflow.schema.log import LoggableType
+from langflow.schema.message import Message
 
 
 class TestEventManager:
@@ -212,3 +213,57 @@ class TestEventManager:
         # Accessing a non-registered event callback should return the 'noop' function
         callback = event_manager.on_non_existing_event
         assert callback.__name__ == "noop"
+
+    # Batching the token events of a message and keeping the order of the events
+    async def test_token_events_are_batched(self):
+        queue = asyncio.Queue()
+        event_manager = create_default_event_manager(queue, token_batch_interval=60, token_batch_size=3)
+
+        for chunk in ["a", "b", "c", "d", "e"]:
+            event_manager.on_token(data={"chunk": chunk, "id": "message"})
+        event_manager.on_token(data={"chunk": "x", "id": "other"})
+        event_manager.on_end(data={})
+
+        events = [json.loads(queue.get_nowait()[1]) for _ in range(queue.qsize())]
+        assert [(event["event"], event["data"].get("chunk")) for event in events] == [
+            ("token", "abc"),
+            ("token", "de"),
+            ("token", "x"),
+            ("end", None),
+        ]
+        assert event_manager.event_counts == {"token_chunk": 6, "token": 3, "end": 1}
+
+    # Sending the pending tokens when no other event follows them
+    async def test_token_events_are_flushed_after_the_interval(self):
+        queue = asyncio.Queue()
+        event_manager = create_default_event_manager(queue, token_batch_interval=0.01)
+
+        event_manager.on_token(data={"chunk": "a", "id": "message"})
+        assert queue.empty()
+        _, value, _ = await asyncio.wait_for(queue.get(), timeout=1)
+        assert json.loads(value)["data"]["chunk"] == "a"
+
+    # Batching the tokens that components send from worker threads
+    async def test_token_events_from_threads_are_batched(self):
+        queue = asyncio.Queue()
+        event_manager = create_default_event_manager(queue, token_batch_interval=0.5, token_batch_size=100)
+
+        for i in range(10):
+            await asyncio.to_thread(event_manager.on_token, data={"chunk": str(i), "id": "message"})
+        assert queue.empty()
+
+        _, value, _ = await asyncio.wait_for(queue.get(), timeout=2)
+        assert json.loads(value)["data"]["chunk"] == "0123456789"
+        assert queue.empty()
+        assert event_manager.event_counts == {"token_chunk": 10, "token": 1}
+
+    # Encoding pydantic models nested in the event data
+    def test_send_event_encodes_models(self):
+        queue = asyncio.Queue()
+        event_manager = create_default_event_manager(queue)
+        message = Message(text="hello", sender="User")
+
+        event_manager.on_end_vertex(data={"build_data": message})
+
+        _, value, _ = queue.get_nowait()
+        assert json.loads(value)["data"]["build_data"] == json.loads(message.model_dump_json(by_alias=True))
@@ -0,0 +1,42 @@
+import json
+import time
+
+from langflow.events.event_manager import encode_event
+from langflow.events.event_queue import BuildEventQueue
+
+
+def _token_event(chunk: str, message_id: str = "message") -> tuple[str, bytes, float]:
+    value = encode_event("token", {"chunk": chunk, "id": message_id}) + b"\n\n"
+    return f"token-{chunk}", value, time.time()
+
+
+def _end_vertex_event() -> tuple[str, bytes, float]:
+    value = json.dumps({"event": "end_vertex", "data": {}}) + "\n\n"
+    return "end_vertex-id", value.encode("utf-8"), time.time()
+
+
+def _chunks(queue: BuildEventQueue) -> list[str]:
+    events = [json.loads(queue.get_nowait()[1]) for _ in range(queue.qsize())]
+    return [event["data"].get("chunk", event["event"]) for event in events]
+
+
+def test_build_event_queue_coalesces_token_events():
+    queue = BuildEventQueue(max_size=2)
+    for chunk in ["a", "b", "c", "d"]:
+        queue.put_nowait(_token_event(chunk))
+    queue.put_nowait(_token_event("x", message_id="other"))
+
+    assert queue.coalesced == 2
+    # Merged events are encoded as the events sent by the EventManager
+    assert queue._queue[1][1] == _token_event("bcd")[1]
+    assert _chunks(queue) == ["a", "bcd", "x"]
+
+
+def test_build_event_queue_drops_token_events():
+    queue = BuildEventQueue(max_size=2, overflow_policy="drop")
+    for chunk in ["a", "b", "c"]:
+        queue.put_nowait(_token_event(chunk))
+    queue.put_nowait(_end_vertex_event())
+
+    assert queue.dropped == 1
+    assert _chunks(queue) == ["a", "b", "end_vertex"]
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from collections import deque
 
@@ -6,8 +7,13 @@ from langflow.components.inputs import ChatInput
 from langflow.components.langchain_utilities import ToolCallingAgentComponent
 from langflow.components.outputs import ChatOutput, TextOutputComponent
 from langflow.components.tools import YfinanceToolComponent
+from langflow.custom import Component
+from langflow.exceptions.component import ComponentBuildError
 from langflow.graph import Graph
 from langflow.graph.graph.constants import Finish
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+from langflow.services.deps import get_settings_service
 
 
 async def test_graph_not_prepared():
@@ -136,3 +142,149 @@ def test_graph_set_with_valid_component():
     tool = YfinanceToolComponent()
     tool_calling_agent = ToolCallingAgentComponent()
     tool_calling_agent.set(tools=[tool])
+
+
+async def test_graph_process_builds_vertices_as_predecessors_finish():
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(should_store_message=False, sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    graph.add_component(text_output)
+    graph.add_component_edge("chat_input", ("message", "input_value"), "text_output")
+    graph.prepare()
+
+    await graph.process(fallback_to_env_vars=False, max_concurrency=1)
+
+    assert all(vertex.built for vertex in graph.vertices)
+    assert set(graph.queue_wait_times) == {"chat_input", "text_output", "chat_output"}
+
+
+class _DelayedComponent(Component):
+    delay = 0.0
+    events: list[tuple[str, str]] = []
+    inputs = [MessageTextInput(name="input_value")]
+    outputs = [Output(display_name="Text", name="text", method="build_text")]
+
+    async def build_text(self) -> Message:
+        self.events.append(("start", self._id))
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.events.append(("cancelled", self._id))
+            raise
+        self.events.append(("end", self._id))
+        return Message(text=self.input_value)
+
+
+class _SlowComponent(_DelayedComponent):
+    delay = 0.5
+
+
+async def test_graph_process_does_not_wait_for_slow_siblings():
+    _DelayedComponent.events.clear()
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    slow = _SlowComponent(_id="slow")
+    fast = _DelayedComponent(_id="fast")
+    fast_next = _DelayedComponent(_id="fast_next")
+    slow.set(input_value=chat_input.message_response)
+    fast.set(input_value=chat_input.message_response)
+    fast_next.set(input_value=fast.build_text)
+    graph = Graph()
+    for component in (chat_input, slow, fast, fast_next):
+        graph.add_component(component)
+    graph.add_component_edge("chat_input", ("message", "input_value"), "slow")
+    graph.add_component_edge("chat_input", ("message", "input_value"), "fast")
+    graph.add_component_edge("fast", ("text", "input_value"), "fast_next")
+    graph.prepare()
+
+    await graph.process(fallback_to_env_vars=False)
+
+    # Built layer by layer, fast_next would only start once slow, in the previous layer, had finished
+    events = _DelayedComponent.events
+    assert events.index(("start", "fast_next")) < events.index(("end", "slow"))
+
+
+class _FailingComponent(_DelayedComponent):
+    async def build_text(self) -> Message:
+        msg = "Build failed"
+        raise ValueError(msg)
+
+
+async def test_graph_process_cancels_running_builds_on_error():
+    _DelayedComponent.events.clear()
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    slow = _SlowComponent(_id="slow")
+    failing = _FailingComponent(_id="failing")
+    slow.set(input_value=chat_input.message_response)
+    failing.set(input_value=chat_input.message_response)
+    graph = Graph()
+    for component in (chat_input, slow, failing):
+        graph.add_component(component)
+    graph.add_component_edge("chat_input", ("message", "input_value"), "slow")
+    graph.add_component_edge("chat_input", ("message", "input_value"), "failing")
+    graph.prepare()
+
+    with pytest.raises(ComponentBuildError):
+        await graph.process(fallback_to_env_vars=False)
+
+    assert ("cancelled", "slow") in _DelayedComponent.events
+
+
+def _chat_graph() -> Graph:
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(should_store_message=False, sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    graph.prepare()
+    return graph
+
+
+async def test_graph_state_delta_round_trip():
+    graph = _chat_graph()
+    replica = _chat_graph()
+    replica.apply_state_delta(graph.pop_state_delta())
+    assert replica.vertices_to_run == graph.vertices_to_run
+
+    await graph.astep()
+    delta = graph.pop_state_delta()
+    assert set(delta["vertices"]) == {"chat_input"}
+    replica.apply_state_delta(delta)
+
+    assert replica.get_vertex("chat_input").built
+    assert replica.get_vertex("chat_input").results == graph.get_vertex("chat_input").results
+    assert not replica.get_vertex("chat_output").built
+    assert list(replica._run_queue) == ["chat_output"]
+    assert replica.run_manager.to_dict() == graph.run_manager.to_dict()
+    assert graph.pop_state_delta()["vertices"] == {}
+
+
+class _CountingComponent(Component):
+    cache_results = True
+    builds = 0
+    inputs = [MessageTextInput(name="input_value")]
+    outputs = [Output(display_name="Text", name="text", method="build_text")]
+
+    def build_text(self) -> Message:
+        type(self).builds += 1
+        return Message(text=self.input_value)
+
+
+async def test_vertex_result_cache_reuses_results_across_runs(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "vertex_result_cache", True)
+    _CountingComponent.builds = 0
+    for _ in range(2):
+        component = _CountingComponent(_id="counting", input_value="same input")
+        text_output = TextOutputComponent(_id="text_output")
+        text_output.set(input_value=component.build_text)
+        graph = Graph(component, text_output)
+        graph.prepare()
+        await graph.process(fallback_to_env_vars=False)
+        assert graph.get_vertex("counting").results["text"].text == "same input"
+
+    assert _CountingComponent.builds == 1
@@ -265,3 +265,40 @@ async def test_serialize_graph():
     assert serialized is not None
     assert isinstance(serialized, str)
     assert len(serialized) > 0
+
+
+async def test_clone_graph():
+    starter_projects = await load_starter_projects()
+    data = starter_projects[0][1]["data"]
+    graph = Graph.from_payload(data, flow_id="flow_id", user_id="user_id")
+    cloned = graph.clone(user_id="other_user_id")
+    assert cloned is not graph
+    assert cloned.flow_id == "flow_id"
+    assert cloned.user_id == "other_user_id"
+    assert [vertex.id for vertex in cloned.vertices] == [vertex.id for vertex in graph.vertices]
+    for vertex in cloned.vertices:
+        assert vertex is not graph.get_vertex(vertex.id)
+        assert vertex.graph is cloned
+        assert vertex.custom_component is not graph.get_vertex(vertex.id).custom_component
+    assert cloned.predecessor_map == graph.predecessor_map
+    assert cloned.successor_map == graph.successor_map
+    assert all(cloned.predecessor_map[key] is not value for key, value in graph.predecessor_map.items())
+    assert cloned.sort_vertices() == graph.sort_vertices()
+
+
+async def test_vertex_edges_follow_graph_changes():
+    starter_projects = await load_starter_projects()
+    data = starter_projects[0][1]["data"]
+    graph = Graph.from_payload(data)
+    for vertex in graph.vertices:
+        assert vertex.outgoing_edges == [edge for edge in graph.edges if edge.source_id == vertex.id]
+        assert vertex.incoming_edges == [edge for edge in graph.edges if edge.target_id == vertex.id]
+
+    removed = next(vertex for vertex in graph.vertices if vertex.edges)
+    neighbor_ids = {edge.source_id for edge in removed.edges} | {edge.target_id for edge in removed.edges}
+    neighbor_ids.discard(removed.id)
+    graph.remove_vertex(removed.id)
+    assert graph.get_vertex_edges(removed.id) == []
+    for neighbor_id in neighbor_ids:
+        assert all(removed.id not in {edge.source_id, edge.target_id} for edge in graph.get_vertex_edges(neighbor_id))
+    assert all(removed.id not in {edge.source_id, edge.target_id} for edge in graph.edges)
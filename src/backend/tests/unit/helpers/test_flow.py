@@ -0,0 +1,89 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from langflow.helpers.flow import find_flow, load_flow
+from langflow.processing.graph_cache import get_graph_cache
+from langflow.services.database.models.flow import Flow
+from langflow.services.deps import session_scope
+from sqlalchemy import event
+
+
+@pytest.fixture
+async def memory_chatbot_flow(active_user, json_memory_chatbot_no_llm):
+    async with session_scope() as session:
+        flow = Flow(
+            name="memory_chatbot",
+            data=json.loads(json_memory_chatbot_no_llm)["data"],
+            user_id=active_user.id,
+        )
+        session.add(flow)
+        await session.commit()
+        await session.refresh(flow)
+    return flow
+
+
+async def test_load_flow_clones_cached_graph(memory_chatbot_flow, monkeypatch):
+    from langflow.processing import graph_cache as graph_cache_module
+    from langflow.services.deps import get_settings_service
+
+    monkeypatch.setattr(get_settings_service().settings, "graph_cache_size", 10)
+    monkeypatch.setattr(graph_cache_module, "_graph_cache", None)
+    flow = memory_chatbot_flow
+    graph_cache = get_graph_cache()
+    user_id = str(flow.user_id)
+
+    graph1 = await load_flow(user_id, flow_id=str(flow.id))
+    graph2 = await load_flow(user_id, flow_id=str(flow.id))
+    assert len(graph_cache) == 1
+    assert graph1 is not graph2
+    assert [vertex.id for vertex in graph1.vertices] == [vertex.id for vertex in graph2.vertices]
+
+    async with session_scope() as session:
+        db_flow = await session.get(Flow, flow.id)
+        db_flow.updated_at = datetime.now(timezone.utc)
+        session.add(db_flow)
+    graph3 = await load_flow(user_id, flow_id=str(flow.id))
+    assert graph3 is not graph1
+    assert len(graph_cache) == 2
+
+
+async def test_load_flow_reads_the_flow_once_without_graph_cache(memory_chatbot_flow, monkeypatch):
+    from langflow.processing import graph_cache as graph_cache_module
+    from langflow.services.deps import get_db_service, get_settings_service
+
+    monkeypatch.setattr(get_settings_service().settings, "graph_cache_size", 0)
+    monkeypatch.setattr(graph_cache_module, "_graph_cache", None)
+    statements = []
+
+    def before_cursor_execute(_conn, _cursor, statement, *_args):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM flow" in statement:
+            statements.append(statement)
+
+    engine = get_db_service().engine.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        graph = await load_flow(str(memory_chatbot_flow.user_id), flow_id=str(memory_chatbot_flow.id))
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert graph.vertices
+    assert len(statements) == 1
+
+
+async def test_find_flow_caches_flow_ids(flow, monkeypatch):
+    from langflow.helpers import flow as flow_helpers
+    from langflow.services.deps import get_settings_service
+
+    monkeypatch.setattr(get_settings_service().settings, "flow_name_cache_ttl", 60)
+    monkeypatch.setattr(flow_helpers, "_flow_ids_by_name", None)
+    user_id = str(flow.user_id)
+
+    assert await find_flow(flow.name, user_id) == flow.id
+    async with session_scope() as session:
+        db_flow = await session.get(Flow, flow.id)
+        db_flow.name = "renamed_flow"
+        session.add(db_flow)
+    assert await find_flow(flow.name, user_id) == flow.id
+    assert await find_flow("renamed_flow", user_id) == flow.id
+    assert await find_flow("missing_flow", user_id) is None
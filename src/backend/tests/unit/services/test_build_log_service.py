@@ -0,0 +1,64 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+from langflow.services.build_log.service import BuildLogService
+
+
+def _build_log_service(monkeypatch, **settings) -> tuple[BuildLogService, list[list], asyncio.Event]:
+    settings = {
+        "build_log_batching": True,
+        "build_log_flush_interval": 10,
+        "build_log_batch_size": 2,
+        "build_log_max_pending": 4,
+        **settings,
+    }
+    service = BuildLogService(SimpleNamespace(settings=SimpleNamespace(**settings)))
+    batches: list[list] = []
+    database_available = asyncio.Event()
+    database_available.set()
+
+    @asynccontextmanager
+    async def session_scope():
+        await database_available.wait()
+        yield SimpleNamespace(add_all=batches.append)
+
+    monkeypatch.setattr("langflow.services.write_behind.session_scope", session_scope)
+    return service, batches, database_available
+
+
+async def test_build_log_writes_rows_in_batches(monkeypatch):
+    service, batches, _ = _build_log_service(monkeypatch)
+
+    for row in range(5):
+        await service.log(row)
+    await service.flush()
+
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+async def test_build_log_flushes_after_interval(monkeypatch):
+    service, batches, _ = _build_log_service(monkeypatch)
+
+    await service.log("row")
+    assert batches == []
+    await asyncio.sleep(0.05)
+
+    assert batches == [["row"]]
+
+
+async def test_build_log_drops_rows_when_the_database_cannot_keep_up(monkeypatch):
+    service, batches, database_available = _build_log_service(monkeypatch)
+    database_available.clear()
+
+    for row in range(6):
+        await service.log(row)
+
+    assert service.dropped == 2
+
+    database_available.set()
+    await service.flush()
+    assert batches == [[0, 1], [2, 3]]
+    await service.log("after")
+    await service.flush()
+    assert batches[-1] == ["after"]
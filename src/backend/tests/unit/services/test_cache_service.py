@@ -0,0 +1,78 @@
+from langflow.services.cache.service import ThreadingInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
+
+
+def test_threading_in_memory_cache_counts_hits_and_misses():
+    cache = ThreadingInMemoryCache()
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("b") is CACHE_MISS
+    cache.upsert("c", {"x": 1})
+    cache.upsert("c", {"y": 2})
+    assert cache["c"] == {"x": 1, "y": 2}
+
+    stats = cache.stats
+    assert stats["items"] == 2
+    assert stats["hits"] == 3
+    assert stats["misses"] == 2
+    assert stats["evictions"] == 0
+
+
+def test_threading_in_memory_cache_evicts_by_size_within_a_shard():
+    cache = ThreadingInMemoryCache(max_size_bytes=10_000, num_shards=1)
+    cache.set("small", "x")
+    cache.set("large", "x" * 20_000)
+    # The large item is kept even though it does not fit, evicting older items instead
+    assert cache.get("small") is CACHE_MISS
+    assert cache.get("large") == "x" * 20_000
+    assert cache.stats["evictions"] == 1
+
+    cache.delete("large")
+    assert cache.stats["size_bytes"] == 0
+
+
+def test_threading_in_memory_cache_bounds_the_whole_cache():
+    cache = ThreadingInMemoryCache(max_size=3)
+    for key in range(3):
+        cache.set(key, key)
+    assert cache.get(0) == 0
+    cache.set(3, 3)
+    # The least recently used item of all the shards is evicted
+    assert len(cache) == 3
+    assert cache.get(1) is CACHE_MISS
+    assert [cache.get(key) for key in (0, 2, 3)] == [0, 2, 3]
+
+
+def test_threading_in_memory_cache_does_not_evict_under_its_bound():
+    cache = ThreadingInMemoryCache(max_size=4, num_shards=2)
+    # Integer keys go to the shard of their parity, so all these keys share a shard
+    for key in (0, 2, 4, 6):
+        cache.set(key, key)
+    assert [cache.get(key) for key in (0, 2, 4, 6)] == [0, 2, 4, 6]
+    assert cache.stats["evictions"] == 0
+
+
+async def test_threading_in_memory_cache_async_fast_path():
+    cache = ThreadingInMemoryCache()
+    await cache.aset("a", {"x": 1})
+    await cache.aupsert("a", {"y": 2})
+    assert await cache.aget("a") == {"x": 1, "y": 2}
+    await cache.adelete("a")
+    assert await cache.aget("a") is CACHE_MISS
+
+
+async def test_threading_in_memory_cache_async_evicts_by_size():
+    cache = ThreadingInMemoryCache(max_size_bytes=10_000)
+    await cache.aset("small", "x")
+    await cache.aupsert("large", {"value": "x" * 20_000})
+    assert await cache.aget("small") is CACHE_MISS
+    assert len(cache) == 1
+
+
+def test_threading_in_memory_cache_upserts_do_not_grow_the_size():
+    cache = ThreadingInMemoryCache(max_size_bytes=100_000)
+    cache.set("other", "x")
+    for step in range(100):
+        cache.upsert("graph", {"result": "x" * 1_000, "step": step})
+    assert cache.stats["size_bytes"] < 10_000
+    assert cache.get("other") == "x"
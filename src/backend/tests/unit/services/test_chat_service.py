@@ -0,0 +1,94 @@
+import asyncio
+import copy
+
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.graph import Graph
+from langflow.services.cache.utils import CacheMiss
+from langflow.services.chat.service import ChatService
+
+
+def _chat_graph() -> Graph:
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(should_store_message=False, sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    graph.prepare()
+    return graph
+
+
+async def _delta_keys(chat_service: ChatService, key: str) -> list[str]:
+    deltas = (await chat_service.get_cache(f"{key}:deltas"))["result"]
+    return [f"{key}:delta:{deltas['generation']}:{delta_index}" for delta_index in range(deltas["count"])]
+
+
+async def test_cache_graph_writes_deltas_between_snapshots():
+    chat_service = ChatService()
+    chat_service.graph_state_snapshot_interval = 2
+    graph = _chat_graph()
+
+    await chat_service.cache_graph("flow", graph, snapshot=True)
+    await chat_service.cache_graph("flow", graph)
+    await chat_service.cache_graph("flow", graph)
+    delta_keys = await _delta_keys(chat_service, "flow")
+    assert len(delta_keys) == 2
+    for delta_key in delta_keys:
+        assert not isinstance(await chat_service.get_cache(delta_key), CacheMiss)
+    assert (await chat_service.get_cached_graph("flow"))["result"] is graph
+
+    # The interval was reached, so the next call compacts the deltas into a snapshot
+    await chat_service.cache_graph("flow", graph)
+    assert await _delta_keys(chat_service, "flow") == []
+    assert isinstance(await chat_service.get_cache(delta_keys[0]), CacheMiss)
+
+    await chat_service.clear_graph_cache("flow")
+    assert isinstance(await chat_service.get_cached_graph("flow"), CacheMiss)
+    assert isinstance(await chat_service.get_cache("flow:deltas"), CacheMiss)
+
+
+async def test_cache_graph_snapshot_discards_deltas_of_other_processes(monkeypatch):
+    # Two services sharing a cache, as two workers sharing Redis
+    chat_service = ChatService()
+    other_chat_service = ChatService()
+    chat_service.graph_state_snapshot_interval = other_chat_service.graph_state_snapshot_interval = 5
+    graph = _chat_graph()
+
+    await chat_service.cache_graph("flow", graph, snapshot=True)
+    await chat_service.cache_graph("flow", graph)
+    delta_keys = await _delta_keys(chat_service, "flow")
+
+    other_graph = _chat_graph()
+    await other_chat_service.cache_graph("flow", other_graph, snapshot=True)
+    assert isinstance(await chat_service.get_cache(delta_keys[0]), CacheMiss)
+
+    replayed = []
+    monkeypatch.setattr(other_graph, "apply_state_delta", replayed.append)
+    assert (await chat_service.get_cached_graph("flow"))["result"] is other_graph
+    assert replayed == []
+    await chat_service.clear_graph_cache("flow")
+
+
+async def test_cache_graph_keeps_concurrent_deltas(monkeypatch):
+    chat_service = ChatService()
+    chat_service.graph_state_snapshot_interval = 10
+    graph = _chat_graph()
+    await chat_service.cache_graph("flow", graph, snapshot=True)
+    get_cache = chat_service.get_cache
+
+    async def slow_get_cache(*args, **kwargs):
+        # As a cache reached over the network, which returns copies and lets the other tasks run while reading
+        value = copy.deepcopy(await get_cache(*args, **kwargs))
+        await asyncio.sleep(0)
+        return value
+
+    monkeypatch.setattr(chat_service, "get_cache", slow_get_cache)
+
+    # As the concurrent builds of sibling vertices do
+    await asyncio.gather(*(chat_service.cache_graph("flow", graph) for _ in range(5)))
+
+    delta_keys = await _delta_keys(chat_service, "flow")
+    assert len(delta_keys) == 5
+    for delta_key in delta_keys:
+        assert not isinstance(await chat_service.get_cache(delta_key), CacheMiss)
+    await chat_service.clear_graph_cache("flow")
@@ -0,0 +1,115 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+from langflow.services.http_client.cache import CachingTransport, HttpResponseCache
+from langflow.services.http_client.service import HttpClientService
+
+
+def _http_client_service(**settings) -> HttpClientService:
+    settings = {
+        "http_client_max_connections": 10,
+        "http_client_max_keepalive_connections": 5,
+        "http_client_keepalive_expiry": 5,
+        "http_client_timeout": 60,
+        "http_client_http2": False,
+        "http_client_cache_size": 0,
+        **settings,
+    }
+    return HttpClientService(SimpleNamespace(settings=SimpleNamespace(**settings)))
+
+
+def _caching_client(handler) -> tuple[httpx.AsyncClient, HttpResponseCache]:
+    cache = HttpResponseCache(max_size=10)
+    return httpx.AsyncClient(transport=CachingTransport(httpx.MockTransport(handler), cache)), cache
+
+
+async def test_http_client_service_shares_a_client_per_event_loop():
+    service = _http_client_service()
+    client = service.get_client()
+    assert service.get_client() is client
+
+    other_loop_client = await asyncio.to_thread(lambda: asyncio.run(_get_client(service)))
+    assert other_loop_client is not client
+
+    await service.teardown()
+    assert client.is_closed
+    assert service.get_client() is not client
+
+
+async def test_http_client_service_sets_the_default_timeout():
+    service = _http_client_service(http_client_timeout=120)
+    assert service.get_client().timeout == httpx.Timeout(120)
+    await service.teardown()
+
+    service = _http_client_service(http_client_timeout=0)
+    assert service.get_client().timeout == httpx.Timeout(None)
+    await service.teardown()
+
+
+async def _get_client(service: HttpClientService) -> httpx.AsyncClient:
+    return service.get_client()
+
+
+async def test_http_client_service_does_not_keep_cookies():
+    service = _http_client_service()
+    service.get_client().cookies.extract_cookies(
+        httpx.Response(
+            200, headers={"set-cookie": "session=secret"}, request=httpx.Request("GET", "https://example.com")
+        )
+    )
+    assert not service.get_client().cookies
+    await service.teardown()
+
+
+async def test_response_cache_serves_fresh_responses():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"count": len(requests)}, headers={"cache-control": "max-age=60"})
+
+    client, cache = _caching_client(handler)
+    async with client:
+        first = await client.get("https://example.com/api")
+        second = await client.get("https://example.com/api")
+        other = await client.get("https://example.com/api", headers={"authorization": "Bearer other"})
+        post = await client.post("https://example.com/api")
+
+    assert first.json() == second.json() == {"count": 1}
+    assert other.json() == {"count": 2}
+    assert post.json() == {"count": 3}
+    assert cache.stats() == {"size": 2, "max_size": 10, "hits": 1, "misses": 2, "revalidations": 0}
+
+
+async def test_response_cache_revalidates_with_etag():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text="content", headers={"etag": '"v1"', "cache-control": "no-cache"})
+
+    client, cache = _caching_client(handler)
+    async with client:
+        first = await client.get("https://example.com/page")
+        second = await client.get("https://example.com/page")
+
+    assert first.text == second.text == "content"
+    assert second.status_code == 200
+    assert len(requests) == 2
+    assert cache.revalidations == 1
+
+
+async def test_response_cache_skips_uncacheable_responses():
+    def handler(request: httpx.Request) -> httpx.Response:  # noqa: ARG001
+        return httpx.Response(200, text="content", headers={"cache-control": "no-store, max-age=60"})
+
+    client, cache = _caching_client(handler)
+    async with client:
+        await client.get("https://example.com/page")
+        await client.get("https://example.com/page")
+
+    assert len(cache) == 0
+    assert cache.misses == 2
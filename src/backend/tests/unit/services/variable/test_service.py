@@ -240,3 +240,37 @@ async def test_create_variable(service, session: AsyncSession):
     assert result.type == CREDENTIAL_TYPE
     assert isinstance(result.created_at, datetime)
     assert isinstance(result.updated_at, datetime)
+
+
+async def test_get_user_variables(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name1", "value1", session=session)
+    await service.create_variable(user_id, "name2", "value2", type_=CREDENTIAL_TYPE, session=session)
+
+    user_variables = await service.get_user_variables(user_id, session=session)
+
+    assert user_variables.get("name1", "") == "value1"
+    assert user_variables.get("name2", "") == "value2"
+    with pytest.raises(ValueError, match="name3 variable not found."):
+        user_variables.get("name3", "")
+    with pytest.raises(TypeError):
+        user_variables.get("name2", "session_id")
+
+
+async def test_get_variable__cached_until_changed(session: AsyncSession, monkeypatch):
+    settings_service = get_settings_service()
+    monkeypatch.setattr(settings_service.settings, "variable_cache_ttl", 60)
+    service = DatabaseVariableService(settings_service)
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "old_value", session=session)
+
+    assert await service.get_variable(user_id, "name", "", session=session) == "old_value"
+    with patch.object(session, "exec", side_effect=AssertionError("the variable should be cached")):
+        assert await service.get_variable(user_id, "name", "", session=session) == "old_value"
+
+    await service.update_variable(user_id, "name", "new_value", session=session)
+    assert await service.get_variable(user_id, "name", "", session=session) == "new_value"
+
+    await service.delete_variable(user_id, "name", session=session)
+    with pytest.raises(ValueError, match="name variable not found."):
+        await service.get_variable(user_id, "name", "", session=session)
@@ -1,3 +1,5 @@
+from uuid import UUID
+
 import pytest
 from httpx import AsyncClient
 from langflow.services.database.models.api_key import ApiKeyCreate
@@ -47,3 +49,34 @@ async def test_delete_api_key(client, logged_in_headers, api_key):
     data = response.json()
     assert data["detail"] == "API Key deleted"
     # Optionally, add a follow-up check to ensure that the key is actually removed from the database
+
+
+async def test_verified_api_keys_are_cached_until_deleted(client, logged_in_headers, monkeypatch):
+    from langflow.services.database.models.api_key import ApiKey
+    from langflow.services.database.models.api_key import cache as api_key_cache
+    from langflow.services.deps import get_settings_service, session_scope
+
+    settings = get_settings_service().settings
+    monkeypatch.setattr(settings, "api_key_cache_ttl", 60)
+    monkeypatch.setattr(settings, "api_key_usage_flush_interval", 60)
+    monkeypatch.setattr(api_key_cache, "_verified_api_key_cache", None)
+    monkeypatch.setattr(api_key_cache, "_api_key_usage_counter", None)
+    response = await client.post("api/v1/api_key/", json={"name": "cached-api-key"}, headers=logged_in_headers)
+    api_key = response.json()
+    api_key_headers = {"x-api-key": api_key["api_key"]}
+
+    for _ in range(3):
+        response = await client.get("api/v1/api_key/", headers=api_key_headers)
+        assert response.status_code == 200, response.text
+    assert api_key_cache.get_verified_api_key_cache().get(api_key["api_key"]) is not None
+
+    await api_key_cache.get_api_key_usage_counter().flush()
+    async with session_scope() as session:
+        api_key_db = await session.get(ApiKey, UUID(api_key["id"]))
+        assert api_key_db.total_uses == 3
+        assert api_key_db.last_used_at is not None
+
+    response = await client.delete(f"api/v1/api_key/{api_key['id']}", headers=logged_in_headers)
+    assert response.status_code == 200
+    response = await client.get("api/v1/api_key/", headers=api_key_headers)
+    assert response.status_code == 403
@@ -31,6 +31,18 @@ async def test_build_flow_from_request_data(client, json_memory_chatbot_no_llm,
     await check_messages(flow_id)
 
 
+async def test_build_flow_with_event_buffer(client, json_memory_chatbot_no_llm, logged_in_headers, monkeypatch):
+    from langflow.services.deps import get_settings_service
+
+    monkeypatch.setattr(get_settings_service().settings, "build_event_buffer_size", 2)
+    flow_id = await _create_flow(client, json_memory_chatbot_no_llm, logged_in_headers)
+
+    async with client.stream("POST", f"api/v1/build/{flow_id}/flow", json={}, headers=logged_in_headers) as r:
+        await consume_and_assert_stream(r)
+
+    await check_messages(flow_id)
+
+
 async def test_build_flow_with_frozen_path(client, json_memory_chatbot_no_llm, logged_in_headers):
     flow_id = await _create_flow(client, json_memory_chatbot_no_llm, logged_in_headers)
 
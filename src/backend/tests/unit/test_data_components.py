@@ -7,6 +7,7 @@ import pytest
 import respx
 from httpx import Response
 from langflow.components import data
+from langflow.schema import Data
 
 
 @pytest.fixture
@@ -190,11 +191,36 @@ def test_directory_without_mocks():
     assert len(results) == len(docs_files)
 
 
-def test_url_component():
+@pytest.mark.parametrize("use_multiprocessing", [False, True])
+def test_file_component_with_concurrency(tmp_path, use_multiprocessing):
+    file_paths = []
+    for index in range(5):
+        file_path = tmp_path / f"test_{index}.txt"
+        file_path.write_text(f"content {index}", encoding="utf-8")
+        file_paths.append(Data(data={"file_path": str(file_path)}))
+    file_component = data.FileComponent()
+    file_component.PROCESSING_BATCH_SIZE = 2
+    file_component.set_attributes(
+        {
+            "path": "",
+            "file_path": file_paths,
+            "use_multithreading": True,
+            "concurrency_multithreading": 2,
+            "use_multiprocessing": use_multiprocessing,
+            "delete_server_file_after_processing": False,
+        }
+    )
+
+    results = file_component.load_files()
+
+    assert [result.text for result in results] == [f"content {index}" for index in range(5)]
+
+
+async def test_url_component():
     url_component = data.URLComponent()
     url_component.set_attributes({"urls": ["https://langflow.org"]})
     # the url component can be used to load the contents of a website
-    data_ = url_component.fetch_content()
+    data_ = await url_component.fetch_content()
     assert all(value.data for value in data_)
     assert all(value.text for value in data_)
     assert all(value.source for value in data_)
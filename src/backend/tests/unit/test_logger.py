@@ -99,3 +99,35 @@ def test_max_size(sized_log_buffer):
     assert sized_log_buffer.max_size() == 0
     sized_log_buffer.max = 100
     assert sized_log_buffer.max_size() == 100
+
+
+def test_get_timestamps_after_the_ring_wraps(sized_log_buffer):
+    sized_log_buffer.max = 4
+    messages = [json.dumps({"text": f"Log {i}", "record": {"time": {"timestamp": 1625097600 + i}}}) for i in range(10)]
+    for message in messages:
+        sized_log_buffer.write(message)
+
+    assert [ts for ts, _ in sized_log_buffer.buffer] == [1625097606000, 1625097607000, 1625097608000, 1625097609000]
+    assert sized_log_buffer.get_after_timestamp(1625097600000, lines=2) == {
+        1625097606000: "Log 6",
+        1625097607000: "Log 7",
+    }
+    assert sized_log_buffer.get_before_timestamp(1625097609000, lines=2) == {
+        1625097607000: "Log 7",
+        1625097608000: "Log 8",
+    }
+    assert sized_log_buffer.get_after_sequence(8) == ([(1625097608000, "Log 8"), (1625097609000, "Log 9")], 10)
+
+
+def test_write_loguru_messages(sized_log_buffer):
+    from loguru import logger
+
+    sized_log_buffer.max = 10
+    handler_id = logger.add(sink=sized_log_buffer.write, format="{level} {message}")
+    try:
+        logger.info("Test log")
+    finally:
+        logger.remove(handler_id)
+
+    assert len(sized_log_buffer) == 1
+    assert sized_log_buffer.buffer[0][1] == "INFO Test log\n"
@@ -22,7 +22,7 @@ from langflow.schema.properties import Properties, Source
 # Assuming you have these imports available
 from langflow.services.database.models.message import MessageCreate, MessageRead
 from langflow.services.database.models.message.model import MessageTable
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_message_sink_service, session_scope
 from langflow.services.tracing.utils import convert_to_langchain_type
 
 
@@ -352,3 +352,24 @@ async def test_aupdate_message_with_nested_properties(created_message):
     assert updated[0].properties.allow_markdown is True
     assert updated[0].properties.state == "complete"
     assert updated[0].properties.targets == []
+
+
+@pytest.mark.usefixtures("client")
+async def test_write_behind_messages_are_read_by_their_session(monkeypatch):
+    message_sink = get_message_sink_service()
+    monkeypatch.setattr(message_sink, "enabled", True)
+    # Only reads flush the pending messages during the test
+    monkeypatch.setattr(message_sink, "flush_interval", 60)
+    session_id = "write_behind_session_id"
+
+    stored_messages = await astore_message(Message(text="", sender="AI", sender_name="AI", session_id=session_id))
+    assert message_sink.get_pending(stored_messages[0].id) is not None
+
+    stored_messages[0].text = "Streamed message"
+    updated_messages = await aupdate_messages(stored_messages[0])
+    assert updated_messages[0].text == "Streamed message"
+
+    messages = await aget_messages(session_id=session_id)
+    assert [message.text for message in messages] == ["Streamed message"]
+    assert message_sink.get_pending(stored_messages[0].id) is None
+    await message_sink.teardown()
@@ -1,4 +1,12 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from langflow.api.v1.schemas import SimplifiedAPIRequest
+from langflow.initial_setup.setup import load_starter_projects
+from langflow.processing.graph_cache import GraphCache, hash_tweaks
 from langflow.processing.process import process_tweaks
+from langflow.processing.run_coalescer import RunCoalescer, run_fingerprint
 from langflow.services.deps import get_session_service
 
 
@@ -306,3 +314,112 @@ async def test_load_langchain_object_with_cached_session(basic_graph_data):
 #     )
 #
 #     assert graph1 == graph2
+
+
+def test_hash_tweaks_ignores_key_order():
+    assert hash_tweaks({"a": 1, "b": {"c": 2}}) == hash_tweaks({"b": {"c": 2}, "a": 1})
+    assert hash_tweaks({"a": 1}) != hash_tweaks({"a": 2})
+    assert hash_tweaks(None) == hash_tweaks({})
+
+
+async def test_graph_cache_clones_template():
+    starter_projects = await load_starter_projects()
+    data = starter_projects[0][1]["data"]
+    graph_cache = GraphCache(max_size=2)
+    updated_at = datetime.now(timezone.utc)
+
+    graph1 = graph_cache.get_graph(data, flow_id="flow_id", updated_at=updated_at, user_id="user_id")
+    graph2 = graph_cache.get_graph(data, flow_id="flow_id", updated_at=updated_at, user_id="user_id")
+    assert len(graph_cache) == 1
+    assert graph1 is not graph2
+    assert [vertex.id for vertex in graph1.vertices] == [vertex.id for vertex in graph2.vertices]
+
+    graph_cache.get_graph(data, flow_id="flow_id", updated_at=updated_at, tweaks={"stream": True})
+    graph_cache.get_graph(data, flow_id="flow_id", updated_at=datetime.now(timezone.utc))
+    assert len(graph_cache) == 2
+
+
+async def test_graph_cache_disabled():
+    starter_projects = await load_starter_projects()
+    data = starter_projects[0][1]["data"]
+    graph_cache = GraphCache(max_size=0)
+    graph_cache.get_graph(data, flow_id="flow_id", updated_at=datetime.now(timezone.utc))
+    graph_cache.get_graph(data, flow_id="flow_id", updated_at=None)
+    assert len(graph_cache) == 0
+
+
+async def test_run_coalescer_shares_in_flight_runs():
+    coalescer = RunCoalescer()
+    calls = 0
+    release = asyncio.Event()
+
+    async def execute():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    runs = [asyncio.create_task(coalescer.run("key", execute)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert coalescer.in_flight == 1
+    release.set()
+    assert await asyncio.gather(*runs) == [1] * 5
+    assert coalescer.in_flight == 0
+    # Without a result TTL, later runs execute again
+    assert await coalescer.run("key", execute) == 2
+
+
+async def test_run_coalescer_caches_results_and_not_errors():
+    coalescer = RunCoalescer(result_ttl=60)
+    calls = 0
+
+    async def execute():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            msg = "boom"
+            raise ValueError(msg)
+        return calls
+
+    with pytest.raises(ValueError, match="boom"):
+        await coalescer.run("key", execute)
+    assert await coalescer.run("key", execute) == 2
+    assert await coalescer.run("key", execute) == 2
+
+
+async def test_simple_run_flow_does_not_share_streamed_runs(monkeypatch):
+    from types import SimpleNamespace
+
+    from langflow.api.v1 import endpoints
+
+    coalescer = RunCoalescer(result_ttl=60)
+    monkeypatch.setattr(endpoints, "get_run_coalescer", lambda: coalescer)
+    runs = []
+
+    async def _run_flow(**kwargs):
+        runs.append(kwargs)
+        run = len(runs)
+        await asyncio.sleep(0)
+        return run
+
+    monkeypatch.setattr(endpoints, "_run_flow", _run_flow)
+    flow = SimpleNamespace(id="flow", updated_at=datetime.now(timezone.utc))
+    request = SimplifiedAPIRequest(input_value="hi")
+
+    streamed = await asyncio.gather(*(endpoints.simple_run_flow(flow, request, stream=True) for _ in range(2)))
+    assert sorted(streamed) == [1, 2]
+    assert coalescer.in_flight == 0
+
+    not_streamed = await asyncio.gather(*(endpoints.simple_run_flow(flow, request) for _ in range(2)))
+    assert not_streamed == [3, 3]
+
+
+def test_run_fingerprint_depends_on_inputs():
+    request = SimplifiedAPIRequest(input_value="hi", tweaks={"a": {"b": 1}})
+    same_request = SimplifiedAPIRequest(input_value="hi", tweaks={"a": {"b": 1}})
+    other_request = SimplifiedAPIRequest(input_value="hello", tweaks={"a": {"b": 1}})
+    updated_at = datetime.now(timezone.utc)
+    fingerprint = run_fingerprint(request, flow_id="flow", updated_at=updated_at)
+    assert fingerprint == run_fingerprint(same_request, flow_id="flow", updated_at=updated_at)
+    assert fingerprint != run_fingerprint(other_request, flow_id="flow", updated_at=updated_at)
+    assert fingerprint != run_fingerprint(request, flow_id="flow", updated_at=updated_at, user_id="user")